@@ -1,5 +1,5 @@
 #
-# Copyright 2024 Picovoice Inc.
+# Copyright 2024-2026 Picovoice Inc.
 #
 # You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
 # file accompanying this source.
@@ -9,6 +9,20 @@
 # specific language governing permissions and limitations under the License.
 #
 
+from ._affinity import *
+from ._client import *
 from ._factory import *
+from ._fake import *
+from ._jitter_buffer import *
+from ._long_form import *
 from ._orca import *
+from ._pcm_buffer import *
+from ._pool import *
+from ._process_pool import *
+from ._segmenter import *
+from ._session import *
+from ._shared_pcm import *
+from ._stream_input import *
+from ._tune import *
 from ._util import *
+from ._wav_writer import *
@@ -0,0 +1,155 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import glob
+import os
+import re
+from typing import (
+    AbstractSet,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+)
+
+from ._orca import OrcaInvalidArgumentError
+
+_SYS_NODE_PATH = "/sys/devices/system/node"
+
+
+def _parse_cpu_list(cpu_list: str) -> FrozenSet[int]:
+    cpus = set()
+    for part in cpu_list.strip().split(","):
+        if len(part) == 0:
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return frozenset(cpus)
+
+
+def _available_cpus() -> FrozenSet[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return frozenset(os.sched_getaffinity(0))
+    return frozenset(range(os.cpu_count() or 1))
+
+
+def numa_nodes(sys_node_path: str = _SYS_NODE_PATH) -> Sequence[FrozenSet[int]]:
+    """
+    Lists the CPUs of each NUMA node that this process may run on, as reported in `/sys`. Hosts without NUMA topology
+    information are reported as a single node.
+
+    :param sys_node_path: Directory holding the `node*` entries.
+    :return: A set of CPU indices per NUMA node, in node order. Nodes without available CPUs are left out.
+    """
+
+    available = _available_cpus()
+
+    nodes = []
+    paths = glob.glob(os.path.join(sys_node_path, "node[0-9]*", "cpulist"))
+    for path in sorted(paths, key=lambda x: int(re.search(r"node(\d+)", x).group(1))):
+        try:
+            with open(path, "r") as f:
+                cpus = _parse_cpu_list(f.read()) & available
+        except (OSError, ValueError):
+            continue
+        if len(cpus) > 0:
+            nodes.append(cpus)
+
+    covered = frozenset().union(*nodes)
+    if len(nodes) == 0 or covered != available:
+        return [available]
+    return nodes
+
+
+def device_num_threads(device: str) -> Optional[int]:
+    """
+    Number of threads requested by a `cpu:${NUM_THREADS}` device string.
+
+    :param device: Device string, as passed to `Orca`.
+    :return: The number of threads, `None` if the device does not set one.
+    """
+
+    match = re.fullmatch(r"cpu:(\d+)", device.strip())
+    return int(match.group(1)) if match is not None else None
+
+
+def plan_cpu_sets(
+        num_sets: int,
+        device: Optional[str] = None,
+        nodes: Optional[Sequence[AbstractSet[int]]] = None) -> List[FrozenSet[int]]:
+    """
+    Splits the CPUs this process may run on into disjoint sets, one per pool worker, so that the inference threads of
+    different Orca instances do not compete for the same cores.
+
+    Each set holds as many CPUs as the `cpu:${NUM_THREADS}` device runs threads, or an equal share of the CPUs for other
+    devices. Sets are placed within a single NUMA node where they fit, and consecutive sets go to different nodes so
+    the workers are spread evenly over the sockets. If there are fewer CPUs than the sets need, sets are reused from
+    the start.
+
+    :param num_sets: Number of CPU sets, usually the number of instances of the pool.
+    :param device: Device string the instances are created with.
+    :param nodes: CPUs per NUMA node. Defaults to `numa_nodes()`.
+    :return: A list of `num_sets` sets of CPU indices.
+    """
+
+    if num_sets < 1:
+        raise OrcaInvalidArgumentError("`num_sets` should be a positive integer.")
+
+    if nodes is None:
+        nodes = numa_nodes()
+    free = [sorted(node) for node in nodes if len(node) > 0]
+    if len(free) == 0:
+        raise OrcaInvalidArgumentError("No CPUs to place the sets on.")
+    num_cpus = sum(len(node) for node in free)
+
+    set_size = None if device is None else device_num_threads(device)
+    if set_size is None:
+        set_size = max(1, num_cpus // num_sets)
+    set_size = min(set_size, num_cpus)
+
+    cpu_sets: List[FrozenSet[int]] = []
+    node_index = 0
+    while len(cpu_sets) < num_sets:
+        candidates = [i for i in range(len(free)) if len(free[i]) >= set_size]
+        if len(candidates) > 0:
+            index = min(candidates, key=lambda i: (i - node_index) % len(free))
+            cpu_set = free[index][:set_size]
+            free[index] = free[index][set_size:]
+            node_index = index + 1
+        else:
+            remaining = [cpu for node in free for cpu in node]
+            if len(remaining) < set_size:
+                break
+            cpu_set = remaining[:set_size]
+            for node in free:
+                node[:] = [cpu for cpu in node if cpu not in cpu_set]
+        cpu_sets.append(frozenset(cpu_set))
+
+    num_planned = len(cpu_sets)
+    while len(cpu_sets) < num_sets:
+        cpu_sets.append(cpu_sets[len(cpu_sets) % num_planned])
+
+    return cpu_sets
+
+
+def _pin_current_thread(cpus: Optional[AbstractSet[int]]) -> None:
+    if cpus is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+
+__all__ = [
+    "device_num_threads",
+    "numa_nodes",
+    "plan_cpu_sets",
+]
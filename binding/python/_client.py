@@ -0,0 +1,329 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import getpass
+import itertools
+import json
+import math
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from enum import IntEnum
+from typing import (
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from . import _orca
+from ._orca import (
+    Orca,
+    OrcaError,
+    OrcaIOError,
+    OrcaInvalidStateError,
+)
+
+def default_socket_path() -> str:
+    """
+    Default path of the daemon's Unix domain socket. It is in `$XDG_RUNTIME_DIR` if set, or in a directory of the
+    temporary directory named after the user, which the daemon creates with access for the user only.
+
+    :return: Path of the socket.
+    """
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir is None:
+        user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+        runtime_dir = os.path.join(tempfile.gettempdir(), "pvorca-%s" % user)
+    return os.path.join(runtime_dir, "pvorca.sock")
+
+
+# Every message is a header followed by `length` bytes of payload. `id` is the stream a message refers to.
+_HEADER = struct.Struct("<BII")
+# Synthesis parameters. A NaN speech rate and a negative random state stand for unset values.
+_PARAMS = struct.Struct("<fq")
+_PATH_LENGTH = struct.Struct("<H")
+_NUM_SAMPLES = struct.Struct("<I")
+
+
+class _MessageType(IntEnum):
+    INFO = 0
+    SYNTHESIZE = 1
+    SYNTHESIZE_TO_FILE = 2
+    STREAM_OPEN = 3
+    STREAM_SYNTHESIZE = 4
+    STREAM_FLUSH = 5
+    STREAM_CLOSE = 6
+    OK = 128
+    ERROR = 255
+
+
+def _encode_params(speech_rate: Optional[float], random_state: Optional[int]) -> bytes:
+    return _PARAMS.pack(
+        math.nan if speech_rate is None else speech_rate,
+        -1 if random_state is None else random_state)
+
+
+def _decode_params(payload: bytes) -> Tuple[Optional[float], Optional[int], bytes]:
+    speech_rate, random_state = _PARAMS.unpack_from(payload)
+    return (
+        None if math.isnan(speech_rate) else speech_rate,
+        None if random_state < 0 else random_state,
+        payload[_PARAMS.size:])
+
+
+def _encode_pcm(pcm: Optional[Sequence[int]]) -> bytes:
+    samples = array('h', [] if pcm is None else pcm)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _decode_pcm(payload: bytes) -> Sequence[int]:
+    samples = array('h')
+    samples.frombytes(payload)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tolist()
+
+
+def _encode_alignments(alignments: Sequence[Orca.WordAlignment]) -> bytes:
+    return json.dumps([
+        [word.word, word.start_sec, word.end_sec, [list(phoneme) for phoneme in word.phonemes]]
+        for word in alignments]).encode("utf-8")
+
+
+def _decode_alignments(payload: bytes) -> Sequence[Orca.WordAlignment]:
+    return [
+        Orca.WordAlignment(
+            word=word,
+            start_sec=start_sec,
+            end_sec=end_sec,
+            phonemes=[Orca.PhonemeAlignment(*phoneme) for phoneme in phonemes])
+        for word, start_sec, end_sec, phonemes in json.loads(payload.decode("utf-8"))]
+
+
+def _encode_error(error: Exception) -> bytes:
+    if isinstance(error, OrcaError):
+        content = [type(error).__name__, error.message, list(error.message_stack)]
+    else:
+        content = [OrcaError.__name__, str(error), []]
+    return json.dumps(content).encode("utf-8")
+
+
+def _decode_error(payload: bytes) -> OrcaError:
+    name, message, message_stack = json.loads(payload.decode("utf-8"))
+    exception = getattr(_orca, name, OrcaError)
+    if not (isinstance(exception, type) and issubclass(exception, OrcaError)):
+        exception = OrcaError
+    return exception(message=message, message_stack=message_stack)
+
+
+class OrcaClient:
+    """
+    Client of an Orca daemon (`python -m pvorca.daemon`) running on the same host. Mirrors the API of `Orca`, so that
+    many processes can share the engines of a single daemon instead of each loading its own model. A client can be
+    shared between threads; calls are serialized over one Unix domain socket connection.
+    """
+
+    class OrcaStream:
+        """Orca stream served by the daemon. Mirrors `Orca.OrcaStream`."""
+
+        def __init__(self, client: 'OrcaClient', stream_id: int) -> None:
+            self._client = client
+            self._stream_id = stream_id
+            self._is_closed = False
+
+        def synthesize(self, text: str) -> Optional[Sequence[int]]:
+            """
+            Adds a chunk of text to the stream and generates audio if enough text has been added.
+            See `Orca.OrcaStream.synthesize()`.
+
+            :param text: A chunk of text from a text input stream.
+            :return: The generated audio as a sequence of 16-bit linearly-encoded integers, `None` if no audio chunk
+            has been produced.
+            """
+
+            payload = self._client._call(_MessageType.STREAM_SYNTHESIZE, self._stream_id, text.encode("utf-8"))
+            return _decode_pcm(payload) if len(payload) > 0 else None
+
+        def flush(self) -> Sequence[int]:
+            """
+            Generates audio for all remaining text in the stream. See `Orca.OrcaStream.flush()`.
+
+            :return: The generated audio as a sequence of 16-bit linearly-encoded integers.
+            """
+
+            return _decode_pcm(self._client._call(_MessageType.STREAM_FLUSH, self._stream_id, b""))
+
+        def close(self) -> None:
+            """Releases the stream on the daemon."""
+
+            if self._is_closed:
+                return
+            self._is_closed = True
+            self._client._call(_MessageType.STREAM_CLOSE, self._stream_id, b"")
+
+    def __init__(self, socket_path: Optional[str] = None) -> None:
+        """
+        Constructor.
+
+        :param socket_path: Path to the Unix domain socket of the daemon. Defaults to `default_socket_path()`.
+        """
+
+        if socket_path is None:
+            socket_path = default_socket_path()
+
+        self._lock = threading.Lock()
+        self._stream_ids = itertools.count(1)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(socket_path)
+        except OSError as e:
+            self._socket.close()
+            raise OrcaIOError("Unable to connect to Orca daemon at `%s`: %s" % (socket_path, e))
+
+        info = json.loads(self._call(_MessageType.INFO, 0, b"").decode("utf-8"))
+        self._sample_rate = info["sample_rate"]
+        self._max_character_limit = info["max_character_limit"]
+        self._valid_characters = set(info["valid_characters"])
+        self._version = info["version"]
+
+    def delete(self) -> None:
+        """Closes the connection to the daemon. Streams that are still open are closed by the daemon."""
+
+        with self._lock:
+            self._socket.close()
+
+    @property
+    def valid_characters(self) -> Set[str]:
+        """Set of characters supported by Orca."""
+
+        return self._valid_characters
+
+    @property
+    def sample_rate(self) -> int:
+        """Audio sample rate of generated audio."""
+
+        return self._sample_rate
+
+    @property
+    def max_character_limit(self) -> int:
+        """Maximum number of characters allowed in a single synthesis request."""
+
+        return self._max_character_limit
+
+    @property
+    def version(self) -> str:
+        """Version."""
+
+        return self._version
+
+    def synthesize(
+            self,
+            text: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> Tuple[Sequence[int], Sequence[Orca.WordAlignment]]:
+        """
+        Generates audio from text. See `Orca.synthesize()`.
+
+        :param text: Text to be converted to audio.
+        :param speech_rate: Rate of speech of the synthesized audio.
+        :param random_state: Random seed for the synthesis process.
+        :return: A tuple containing the generated audio as a sequence of 16-bit linearly-encoded integers
+        and a sequence of OrcaWordAlignment objects representing the word alignments.
+        """
+
+        payload = self._call(
+            _MessageType.SYNTHESIZE,
+            0,
+            _encode_params(speech_rate, random_state) + text.encode("utf-8"))
+        num_samples, = _NUM_SAMPLES.unpack_from(payload)
+        pcm_end = _NUM_SAMPLES.size + 2 * num_samples
+        return _decode_pcm(payload[_NUM_SAMPLES.size:pcm_end]), _decode_alignments(payload[pcm_end:])
+
+    def synthesize_to_file(
+            self,
+            text: str,
+            output_path: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> Sequence[Orca.WordAlignment]:
+        """
+        Generates audio from text and saves it to a file written by the daemon. See `Orca.synthesize_to_file()`. The
+        daemon only writes files if it was started with an output directory.
+
+        :param text: Text to be converted to audio.
+        :param output_path: Path to the output audio file, relative to the daemon's output directory. An absolute path
+        has to be within that directory.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :return: A sequence of OrcaWordAlignment objects representing the word alignments.
+        """
+
+        path = output_path.encode("utf-8")
+        payload = self._call(
+            _MessageType.SYNTHESIZE_TO_FILE,
+            0,
+            _encode_params(speech_rate, random_state) + _PATH_LENGTH.pack(len(path)) + path + text.encode("utf-8"))
+        return _decode_alignments(payload)
+
+    def stream_open(
+            self,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> 'OrcaClient.OrcaStream':
+        """
+        Opens a stream for streaming text synthesis.
+
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :return: An instance of OrcaClient.OrcaStream.
+        """
+
+        stream_id = next(self._stream_ids)
+        self._call(_MessageType.STREAM_OPEN, stream_id, _encode_params(speech_rate, random_state))
+        return self.OrcaStream(self, stream_id)
+
+    def _call(self, message_type: _MessageType, stream_id: int, payload: bytes) -> bytes:
+        with self._lock:
+            try:
+                self._socket.sendall(_HEADER.pack(message_type, stream_id, len(payload)) + payload)
+                reply_type, _, length = _HEADER.unpack(self._receive(_HEADER.size))
+                reply = self._receive(length)
+            except OSError as e:
+                raise OrcaIOError("Connection to Orca daemon failed: %s" % e)
+
+        if reply_type == _MessageType.ERROR:
+            raise _decode_error(reply)
+        if reply_type != _MessageType.OK:
+            raise OrcaInvalidStateError("Unexpected reply from Orca daemon.")
+        return reply
+
+    def _receive(self, length: int) -> bytes:
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        offset = 0
+        while offset < length:
+            num_bytes = self._socket.recv_into(view[offset:])
+            if num_bytes == 0:
+                raise ConnectionResetError("Orca daemon closed the connection.")
+            offset += num_bytes
+        return bytes(buffer)
+
+
+__all__ = [
+    "default_socket_path",
+    "OrcaClient",
+]
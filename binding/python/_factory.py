@@ -15,20 +15,32 @@ from typing import (
 )
 
 from ._orca import (
+    invalidate_hardware_devices,
     list_hardware_devices,
     Orca
 )
+from ._tune import (
+    load_tuning,
+    OrcaWorkload
+)
 from ._util import (
     default_library_path,
     default_model_path
 )
 
 
+def _is_device_available(device: str, devices: Sequence[str]) -> bool:
+    if device.split(":")[0] == "cpu":
+        return any(x.split(":")[0] == "cpu" for x in devices)
+    return device in devices
+
+
 def create(
         access_key: str,
         model_path: Optional[str] = None,
         device: Optional[str] = None,
-        library_path: Optional[str] = None) -> Orca:
+        library_path: Optional[str] = None,
+        workload: OrcaWorkload = OrcaWorkload.STREAMING) -> Orca:
     """
     Factory method for Orca text-to-speech engine.
 
@@ -40,19 +52,25 @@ def create(
     To select a specific GPU device, set this argument to `gpu:${GPU_INDEX}`, where `${GPU_INDEX}` is the index
     of the target GPU. If set to`cpu`, the engine will run on the CPU with the default number of threads. To
     specify the number of threads, set this argument to `cpu:${NUM_THREADS}`, where `${NUM_THREADS}` is the
-    desired number of threads.
+    desired number of threads. If not set, the device saved by `tune()` for this host, model and `workload` is used, or
+    `best` if it has not been tuned or the saved device is no longer available.
     :param library_path: Absolute path to Orca's dynamic library. If not set it will be set to the default location.
+    :param workload: Workload whose tuned device is used when `device` is not set.
     """
 
     if model_path is None:
         model_path = default_model_path()
 
-    if device is None:
-        device = "best"
-
     if library_path is None:
         library_path = default_library_path()
 
+    if device is None:
+        tuning = load_tuning(workload=workload, model_path=model_path)
+        if tuning is not None and _is_device_available(tuning.device, list_hardware_devices(library_path=library_path)):
+            device = tuning.device
+        else:
+            device = "best"
+
     return Orca(
         access_key=access_key,
         model_path=model_path,
@@ -60,22 +78,35 @@ def create(
         library_path=library_path)
 
 
-def available_devices(library_path: Optional[str] = None) -> Sequence[str]:
+def available_devices(library_path: Optional[str] = None, refresh: bool = False) -> Sequence[str]:
     """
     Lists all available devices that Orca can use for inference. Each entry in the list can be the `device`
-    argument of `.create` factory method or `Orca` constructor.
+    argument of `.create` factory method or `Orca` constructor. The list is cached per library, so calling this often
+    (e.g. from health checks) does not query the hardware each time. Call `invalidate_available_devices()` or set
+    `refresh` to pick up devices that changed since.
     :param library_path: Absolute path to Orca's dynamic library.
     If not set it will be set to the default location.
+    :param refresh: Query the hardware again instead of returning the cached list.
     :return: List of all available devices that Orca can use for inference.
     """
 
     if library_path is None:
         library_path = default_library_path()
 
-    return list_hardware_devices(library_path=library_path)
+    return list_hardware_devices(library_path=library_path, refresh=refresh)
+
+
+def invalidate_available_devices(library_path: Optional[str] = None) -> None:
+    """
+    Drops the device list cached by `available_devices()`.
+    :param library_path: Absolute path to Orca's dynamic library. If not set, the lists of all libraries are dropped.
+    """
+
+    invalidate_hardware_devices(library_path=library_path)
 
 
 __all__ = [
     'available_devices',
     "create",
+    "invalidate_available_devices",
 ]
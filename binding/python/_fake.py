@@ -0,0 +1,305 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import math
+import re
+import string
+import threading
+import time
+import wave
+from array import array
+from collections import namedtuple
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ._orca import (
+    Orca,
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+)
+
+_PRONUNCIATION_PATTERN = re.compile(r"\{([^|{}]*)\|[^{}]*\}")
+
+
+class FakeOrca(Orca):
+    """
+    Stand-in for `Orca` that needs no AccessKey, dynamic library or model file, for testing and benchmarking the layers
+    built on top of Orca (pools, servers, sessions, buffers) on any machine and without network access.
+
+    It implements the public API of `Orca` in pure Python. The audio is a tone per character whose length follows the
+    speech rate, so it depends only on the text and is the same on every run. Streams hold back the last
+    `lookahead_words` words until more text arrives or they are flushed, like Orca does. How long each call takes is set
+    by a `FakeOrca.Profile`; `FakeOrca.INSTANT` returns immediately, `FakeOrca.CPU` and `FakeOrca.RASPBERRY_PI`
+    roughly follow the engine on a desktop CPU thread and on a Raspberry Pi.
+    """
+
+    Profile = namedtuple(
+        'Profile',
+        ['init_sec', 'call_sec', 'first_audio_sec', 'real_time_factor'],
+        defaults=[0., 0., 0., math.inf])
+
+    INSTANT = Profile()
+    CPU = Profile(init_sec=0.2, call_sec=0.0002, first_audio_sec=0.05, real_time_factor=5.)
+    RASPBERRY_PI = Profile(init_sec=1., call_sec=0.001, first_audio_sec=0.25, real_time_factor=1.)
+
+    DEFAULT_SAMPLE_RATE = 22050
+    DEFAULT_CHARACTER_DURATION_SEC = 0.06
+
+    class FakeStream(Orca.OrcaStream):
+        """Stand-in for `Orca.OrcaStream` returned by `FakeOrca.stream_open()`."""
+
+        def __init__(
+                self,
+                orca: 'FakeOrca',
+                speech_rate: Optional[float],
+                coalescing: Optional[Orca.Coalescing] = None) -> None:
+            super().__init__(None, orca, coalescing=coalescing)
+            self._speech_rate = speech_rate
+            self._text = ""
+            self._is_first_audio = True
+            self._is_closed = False
+
+        def _bind_engine(self) -> None:
+            pass
+
+        def _synthesize(self, text: str) -> Optional[Sequence[int]]:
+            self._check_open()
+            self._text += self._orca._check_text(text, is_stream=True)
+
+            words = self._text.split(" ")
+            num_complete_words = len(words) - 1
+            if num_complete_words <= self._orca._lookahead_words:
+                self._orca._wait(self._orca._profile.call_sec)
+                return None
+
+            head = " ".join(words[:num_complete_words - self._orca._lookahead_words]) + " "
+            self._text = self._text[len(head):]
+            return self._generate(head)
+
+        def _flush(self) -> Sequence[int]:
+            self._check_open()
+            text = self._text
+            self._text = ""
+            if len(text) == 0:
+                self._orca._wait(self._orca._profile.call_sec)
+                return []
+            return self._generate(text)
+
+        def _close(self) -> None:
+            if self._is_closed:
+                return
+            self._is_closed = True
+            self._orca._on_stream_closed()
+
+        def _generate(self, text: str) -> Sequence[int]:
+            pcm = self._orca._pcm(text, self._speech_rate)
+            num_seconds = self._orca._processing_sec(len(pcm))
+            if self._is_first_audio:
+                num_seconds += self._orca._profile.first_audio_sec
+                self._is_first_audio = False
+            self._orca._wait(num_seconds)
+            return pcm.tolist()
+
+        def _check_open(self) -> None:
+            if self._is_closed:
+                raise OrcaInvalidStateError("Orca stream has been closed.")
+
+    def __init__(
+            self,
+            profile: Profile = INSTANT,
+            sample_rate: int = DEFAULT_SAMPLE_RATE,
+            character_duration_sec: float = DEFAULT_CHARACTER_DURATION_SEC,
+            lookahead_words: int = 2,
+            max_character_limit: int = 2000,
+            valid_characters: Optional[Set[str]] = None) -> None:
+        """
+        Constructor.
+
+        :param profile: How long initialization and each call take.
+        :param sample_rate: Audio sample rate of generated audio.
+        :param character_duration_sec: Duration of the audio generated per character at a speech rate of 1.
+        :param lookahead_words: Number of words a stream holds back until more text arrives or it is flushed.
+        :param max_character_limit: Maximum number of characters allowed in a single synthesis request.
+        :param valid_characters: Set of characters supported. Defaults to ASCII letters, digits and punctuation.
+        """
+
+        if profile.real_time_factor <= 0:
+            raise OrcaInvalidArgumentError("`real_time_factor` should be a positive number.")
+        if sample_rate <= 0:
+            raise OrcaInvalidArgumentError("`sample_rate` should be a positive integer.")
+        if character_duration_sec <= 0:
+            raise OrcaInvalidArgumentError("`character_duration_sec` should be a positive number.")
+        if lookahead_words < 0:
+            raise OrcaInvalidArgumentError("`lookahead_words` should be a non-negative integer.")
+
+        if valid_characters is None:
+            valid_characters = set(string.ascii_letters + string.digits + string.punctuation + " \n")
+
+        self._set_engine_info(
+            valid_characters=set(valid_characters),
+            sample_rate=sample_rate,
+            max_character_limit=max_character_limit,
+            version="fake")
+
+        self._profile = profile
+        self._character_duration_sec = character_duration_sec
+        self._lookahead_words = lookahead_words
+
+        self._tones: Dict[Tuple[str, int], array] = dict()
+        self._lock = threading.Lock()
+        self._num_open_streams = 0
+        self._is_deleted = False
+
+        self._wait(profile.init_sec)
+
+    def delete(self) -> None:
+        self._is_deleted = True
+
+    @property
+    def num_open_streams(self) -> int:
+        """Number of streams opened and not yet closed."""
+
+        return self._num_open_streams
+
+    def synthesize(
+            self,
+            text: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> Tuple[Sequence[int], Sequence[Orca.WordAlignment]]:
+        self._check_speech_rate(speech_rate)
+        text = self._check_text(text)
+        pcm = self._pcm(text, speech_rate)
+        self._wait(self._processing_sec(len(pcm)))
+        return pcm.tolist(), self._alignments(text, speech_rate)
+
+    def synthesize_to_file(
+            self,
+            text: str,
+            output_path: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> Sequence[Orca.WordAlignment]:
+        self._check_speech_rate(speech_rate)
+        text = self._check_text(text)
+        pcm = self._pcm(text, speech_rate)
+        self._wait(self._processing_sec(len(pcm)))
+
+        with wave.open(output_path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(pcm.tobytes())
+
+        return self._alignments(text, speech_rate)
+
+    def stream_open(
+            self,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            coalescing: Optional[Orca.Coalescing] = None) -> Orca.OrcaStream:
+        self._check_alive()
+        self._check_speech_rate(speech_rate)
+        self._check_coalescing(coalescing)
+
+        self._wait(self._profile.call_sec)
+        with self._lock:
+            self._num_open_streams += 1
+        return self.FakeStream(self, speech_rate, coalescing=coalescing)
+
+    def _on_stream_closed(self) -> None:
+        with self._lock:
+            self._num_open_streams -= 1
+
+    def _check_alive(self) -> None:
+        if self._is_deleted:
+            raise OrcaInvalidStateError("Orca has been deleted.")
+
+    @staticmethod
+    def _check_speech_rate(speech_rate: Optional[float]) -> None:
+        if speech_rate is not None and not 0.7 <= speech_rate <= 1.3:
+            raise OrcaInvalidArgumentError("`speech_rate` should be within [0.7, 1.3].")
+
+    def _check_text(self, text: str, is_stream: bool = False) -> str:
+        self._check_alive()
+        if not is_stream and len(text) > self.max_character_limit:
+            raise OrcaInvalidArgumentError(
+                "Text is %d characters long, the limit is %d." % (len(text), self.max_character_limit))
+
+        text = _PRONUNCIATION_PATTERN.sub(r"\1", text)
+        invalid_characters = set(text) - self.valid_characters
+        if len(invalid_characters) > 0:
+            raise OrcaInvalidArgumentError("Invalid characters in text: %s" % sorted(invalid_characters))
+
+        return text
+
+    def _processing_sec(self, num_samples: int) -> float:
+        return self._profile.call_sec + num_samples / (self.sample_rate * self._profile.real_time_factor)
+
+    def _character_num_samples(self, speech_rate: Optional[float]) -> int:
+        rate = 1. if speech_rate is None else speech_rate
+        return max(1, int(self.sample_rate * self._character_duration_sec / rate))
+
+    def _pcm(self, text: str, speech_rate: Optional[float]) -> array:
+        num_samples = self._character_num_samples(speech_rate)
+        pcm = array('h')
+        for character in text:
+            pcm.extend(self._tone(character, num_samples))
+        return pcm
+
+    def _tone(self, character: str, num_samples: int) -> array:
+        key = (character, num_samples)
+        tone = self._tones.get(key)
+        if tone is None:
+            if character.isspace():
+                tone = array('h', bytes(2 * num_samples))
+            else:
+                frequency = 100 + 4 * (ord(character) % 128)
+                tone = array('h', [
+                    int(8000 * math.sin(2 * math.pi * frequency * i / self.sample_rate)) for i in range(num_samples)
+                ])
+            self._tones[key] = tone
+        return tone
+
+    def _alignments(self, text: str, speech_rate: Optional[float]) -> Sequence[Orca.WordAlignment]:
+        num_seconds_per_character = self._character_num_samples(speech_rate) / self.sample_rate
+
+        alignments: List[Orca.WordAlignment] = []
+        for match in re.finditer(r"\S+", text):
+            start_sec = match.start() * num_seconds_per_character
+            phonemes = [
+                self.PhonemeAlignment(
+                    phoneme=character.upper(),
+                    start_sec=start_sec + i * num_seconds_per_character,
+                    end_sec=start_sec + (i + 1) * num_seconds_per_character)
+                for i, character in enumerate(match.group()) if character.isalnum()
+            ]
+            alignments.append(self.WordAlignment(
+                word=match.group(),
+                start_sec=start_sec,
+                end_sec=match.end() * num_seconds_per_character,
+                phonemes=phonemes))
+
+        return alignments
+
+    @staticmethod
+    def _wait(num_seconds: float) -> None:
+        if num_seconds > 0:
+            time.sleep(num_seconds)
+
+
+__all__ = [
+    "FakeOrca",
+]
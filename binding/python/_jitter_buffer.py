@@ -0,0 +1,235 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import math
+import time
+from statistics import NormalDist
+from typing import Optional
+
+from ._orca import OrcaInvalidArgumentError
+
+
+class _RunningStats:
+    """Exponentially weighted running mean and variance."""
+
+    def __init__(self, smoothing: float) -> None:
+        self._smoothing = smoothing
+        self._mean = 0.
+        self._variance = 0.
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        if self._count == 0:
+            self._mean = value
+            self._variance = 0.
+        else:
+            alpha = max(self._smoothing, 1 / (self._count + 1))
+            delta = value - self._mean
+            self._mean += alpha * delta
+            self._variance = (1 - alpha) * (self._variance + alpha * delta * delta)
+        self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._variance)
+
+
+class AdaptiveJitterBuffer:
+    """
+    Chooses how long to hold back the first audio chunk of a streaming utterance before starting playback.
+
+    Playback of a stream runs dry when the next audio chunk arrives after the audio buffered so far has been played.
+    The buffer measures, online and across utterances, the time between incoming text chunks (i.e. the token rate of
+    the text source), the number of text chunks Orca consumes per audio chunk, and Orca's processing time per second of
+    audio. When the first audio chunk of an utterance arrives, it predicts when the next chunk will arrive and returns
+    the smallest delay for which the next chunk is on time with probability `target_probability`. The bias and spread of
+    the prediction error observed on previous utterances are folded into the estimate, so the delay shrinks on fast
+    hosts and grows on slow ones.
+    """
+
+    DEFAULT_TEXT_CHUNKS_PER_AUDIO_CHUNK = 4
+
+    def __init__(
+            self,
+            sample_rate: int,
+            target_probability: float = 0.95,
+            smoothing: float = 0.1,
+            min_delay_sec: float = 0.,
+            max_delay_sec: float = 2.) -> None:
+        """
+        Constructor.
+
+        :param sample_rate: Sample rate of the audio produced by Orca.
+        :param target_probability: Probability with which the chosen delay should avoid an underrun between the first
+        and second audio chunk. Valid values are within (0, 1).
+        :param smoothing: Weight of new measurements in the running statistics. Valid values are within (0, 1].
+        :param min_delay_sec: Lower bound for the returned delay.
+        :param max_delay_sec: Upper bound for the returned delay.
+        """
+
+        if sample_rate <= 0:
+            raise OrcaInvalidArgumentError("`sample_rate` should be a positive integer.")
+        if not 0 < target_probability < 1:
+            raise OrcaInvalidArgumentError("`target_probability` should be within (0, 1).")
+        if not 0 < smoothing <= 1:
+            raise OrcaInvalidArgumentError("`smoothing` should be within (0, 1].")
+        if not 0 <= min_delay_sec <= max_delay_sec:
+            raise OrcaInvalidArgumentError("`min_delay_sec` and `max_delay_sec` should satisfy 0 <= min <= max.")
+
+        self._sample_rate = sample_rate
+        self._z_score = NormalDist().inv_cdf(target_probability)
+        self._min_delay_sec = min_delay_sec
+        self._max_delay_sec = max_delay_sec
+
+        self._text_interval = _RunningStats(smoothing)
+        self._text_chunks_per_audio_chunk = _RunningStats(smoothing)
+        self._processing_ratio = _RunningStats(smoothing)
+        self._prediction_error = _RunningStats(smoothing)
+
+        self._num_utterances = 0
+        self._num_underruns = 0
+
+        self._time_last_text = None
+        self._time_last_audio = None
+        self._num_text_chunks_since_audio = 0
+        self._predicted_gap_sec = None
+        self._delay_sec = None
+        self._time_playback_start = None
+        self._num_seconds_scheduled = 0.
+
+    def reset(self) -> None:
+        """Starts a new utterance. Statistics gathered so far are kept."""
+
+        if self._time_last_audio is not None:
+            self._num_utterances += 1
+
+        self._time_last_text = None
+        self._time_last_audio = None
+        self._num_text_chunks_since_audio = 0
+        self._predicted_gap_sec = None
+        self._delay_sec = None
+        self._time_playback_start = None
+        self._num_seconds_scheduled = 0.
+
+    def log_text(self, num_chunks: int = 1) -> None:
+        """
+        Records that text has been passed to the stream.
+
+        :param num_chunks: Number of text chunks (e.g. LLM tokens) passed in the call.
+        """
+
+        now = time.perf_counter()
+        if self._time_last_text is not None and num_chunks > 0:
+            self._text_interval.add((now - self._time_last_text) / num_chunks)
+        self._time_last_text = now
+        self._num_text_chunks_since_audio += num_chunks
+
+    def log_audio(self, num_samples: int, processing_sec: float) -> float:
+        """
+        Records that the stream returned an audio chunk.
+
+        :param num_samples: Number of samples in the chunk.
+        :param processing_sec: Time Orca spent in the call that returned the chunk.
+        :return: Number of seconds to wait before playing the chunk. Only the first chunk of an utterance is delayed,
+        `0` is returned for every other chunk.
+        """
+
+        now = time.perf_counter()
+        num_seconds = num_samples / self._sample_rate
+        if num_seconds <= 0:
+            return 0.
+
+        self._processing_ratio.add(processing_sec / num_seconds)
+        if self._num_text_chunks_since_audio > 0:
+            self._text_chunks_per_audio_chunk.add(self._num_text_chunks_since_audio)
+        self._num_text_chunks_since_audio = 0
+
+        if self._time_last_audio is None:
+            self._time_last_audio = now
+            self._predicted_gap_sec = self._predict_gap(num_seconds)
+            if self._prediction_error.count > 1:
+                gap_sec = self._predicted_gap_sec + self._prediction_error.mean
+                spread = self._prediction_error.std
+            else:
+                gap_sec = self._predicted_gap_sec
+                spread = self._predicted_gap_sec / 2
+            self._delay_sec = min(
+                max(gap_sec + self._z_score * spread - num_seconds, self._min_delay_sec),
+                self._max_delay_sec)
+            self._time_playback_start = now + self._delay_sec
+            self._num_seconds_scheduled = num_seconds
+            return self._delay_sec
+
+        if self._predicted_gap_sec is not None:
+            self._prediction_error.add((now - self._time_last_audio) - self._predicted_gap_sec)
+            self._predicted_gap_sec = None
+
+        if now > self._time_playback_start + self._num_seconds_scheduled:
+            self._num_underruns += 1
+            self._time_playback_start = now - self._num_seconds_scheduled
+        self._num_seconds_scheduled += num_seconds
+        self._time_last_audio = now
+
+        return 0.
+
+    def _predict_gap(self, num_seconds_first_chunk: float) -> float:
+        text_chunks_per_audio_chunk = \
+            self._text_chunks_per_audio_chunk.mean if self._text_chunks_per_audio_chunk.count > 0 else \
+            self.DEFAULT_TEXT_CHUNKS_PER_AUDIO_CHUNK
+        text_interval = self._text_interval.mean if self._text_interval.count > 0 else 0.
+        return text_chunks_per_audio_chunk * text_interval + self._processing_ratio.mean * num_seconds_first_chunk
+
+    @property
+    def delay_sec(self) -> Optional[float]:
+        """Delay chosen for the current utterance, `None` if no audio has been produced yet."""
+
+        return self._delay_sec
+
+    @property
+    def text_chunks_per_second(self) -> float:
+        """Running estimate of the rate at which text chunks are passed to the stream."""
+
+        mean = self._text_interval.mean
+        return 1 / mean if mean > 0 else 0.
+
+    @property
+    def processing_ratio(self) -> float:
+        """
+        Running estimate of the processing time per second of generated audio, i.e. the inverse of Orca's real-time
+        factor.
+        """
+
+        return self._processing_ratio.mean
+
+    @property
+    def num_utterances(self) -> int:
+        """Number of completed utterances that produced audio."""
+
+        return self._num_utterances
+
+    @property
+    def num_underruns(self) -> int:
+        """Number of times an audio chunk arrived after the audio scheduled before it had finished playing."""
+
+        return self._num_underruns
+
+
+__all__ = [
+    "AdaptiveJitterBuffer",
+]
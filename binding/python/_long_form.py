@@ -0,0 +1,354 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from array import array
+from collections import (
+    Counter,
+    deque,
+    namedtuple,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    wait,
+)
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._orca import (
+    _check_pronunciation_lengths,
+    _split_text,
+    Orca,
+    OrcaInvalidArgumentError,
+)
+from ._pool import (
+    OrcaPool,
+    OrcaPriority,
+)
+from ._process_pool import OrcaProcessPool
+from ._wav_writer import OrcaWavWriter
+
+DEFAULT_CHAPTER_PATTERN = r"^[ \t]*(?:#+[ \t]+\S.*|chapter\b.*)$"
+
+_READ_NUM_SAMPLES = 65536
+
+
+def split_chapters(document: str, pattern: str = DEFAULT_CHAPTER_PATTERN) -> List[str]:
+    """
+    Splits a document into chapters at heading lines. Each chapter starts with its heading, and text before the first
+    heading is a chapter of its own.
+
+    :param document: Text of the document.
+    :param pattern: Regular expression matching a heading line. Defaults to Markdown headings and lines starting with
+    `Chapter`, in any case.
+    :return: Chapters that contain text, in document order.
+    """
+
+    starts = [match.start() for match in re.finditer(pattern, document, flags=re.MULTILINE | re.IGNORECASE)]
+    bounds = [0] + starts + [len(document)]
+
+    chapters = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        chapter = document[start:end].strip()
+        if len(chapter) > 0:
+            chapters.append(chapter)
+    return chapters
+
+
+def split_segments(text: str, max_length: int) -> List[str]:
+    """
+    Splits text into segments of at most `max_length` characters for `Orca.synthesize()`.
+
+    Segments end at the last sentence boundary that fits, or at the last clause boundary if no sentence does, or at a
+    word boundary otherwise. A single word longer than `max_length` is split between characters. Custom pronunciations
+    of the form `{word|pronunciation}` are never split.
+
+    :param text: Text to split.
+    :param max_length: Maximum number of characters in a segment, usually `Orca.max_character_limit`.
+    :return: Segments of text, without leading or trailing whitespace.
+    """
+
+    if max_length < 1:
+        raise OrcaInvalidArgumentError("`max_length` should be a positive integer.")
+    _check_pronunciation_lengths(text, max_length)
+
+    return list(_split_text(text, itertools.repeat(max_length)))
+
+
+class LongFormRenderer:
+    """
+    Renders long documents (e.g. audiobooks) to one WAV file per chapter, resuming where an interrupted job stopped.
+
+    Chapters are split into segments of at most `Orca.max_character_limit` characters ending at sentence boundaries
+    (see `split_segments()`), and the segments are synthesized as batch jobs of an `OrcaPool` or an `OrcaProcessPool`.
+    Each completed segment is saved to the checkpoint directory (raw PCM and word alignments) under a hash of its text
+    and synthesis parameters, so running the same job again, after a crash or on another machine sharing the
+    directory, only synthesizes the segments that are missing. Segments of an edited document that did not change are
+    reused as well.
+
+    As soon as all segments of a chapter are saved, the chapter is assembled into `chapter_${INDEX}.wav` by streaming
+    the checkpoints into an `OrcaWavWriter`, along with `chapter_${INDEX}.json` holding the word alignments shifted to
+    the chapter's timeline. Only a bounded number of segments is in flight at a time, so memory use does not depend on
+    the length of the document.
+
+    The renderer does not own the pool.
+    """
+
+    Progress = namedtuple(
+        'Progress',
+        [
+            'num_segments',
+            'num_completed_segments',
+            'num_resumed_segments',
+            'num_completed_chapters',
+            'audio_sec',
+            'elapsed_sec',
+            'audio_sec_per_sec',
+        ])
+
+    def __init__(
+            self,
+            pool: Union[OrcaPool, OrcaProcessPool],
+            checkpoint_dir: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            max_segment_length: Optional[int] = None,
+            max_num_pending_segments: Optional[int] = None,
+            on_progress: Optional[Callable[['LongFormRenderer.Progress'], None]] = None) -> None:
+        """
+        Constructor.
+
+        :param pool: Pool of Orca instances synthesizing the segments, in threads (`OrcaPool`) or worker processes
+        (`OrcaProcessPool`).
+        :param checkpoint_dir: Directory holding the completed segments. Created if it does not exist.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process. Set it so that resumed chapters sound the same as
+        if they were rendered in one go.
+        :param max_segment_length: Maximum number of characters in a segment. Defaults to the pool's
+        `max_character_limit`.
+        :param max_num_pending_segments: Maximum number of segments queued in the pool at a time. Defaults to twice the
+        number of instances.
+        :param on_progress: Called after each segment is saved, on the thread calling `.render()`.
+        """
+
+        if max_segment_length is None:
+            max_segment_length = pool.max_character_limit
+        if not 0 < max_segment_length <= pool.max_character_limit:
+            raise OrcaInvalidArgumentError(
+                "`max_segment_length` should be within [1, %d]." % pool.max_character_limit)
+        if max_num_pending_segments is None:
+            max_num_pending_segments = 2 * pool.num_instances
+        if max_num_pending_segments < 1:
+            raise OrcaInvalidArgumentError("`max_num_pending_segments` should be a positive integer.")
+
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+        self._pool = pool
+        self._checkpoint_dir = checkpoint_dir
+        self._speech_rate = speech_rate
+        self._random_state = random_state
+        self._max_segment_length = max_segment_length
+        self._max_num_pending_segments = max_num_pending_segments
+        self._on_progress = on_progress
+
+    def render(self, chapters: Sequence[str], output_dir: str) -> List[str]:
+        """
+        Renders chapters to WAV files, reusing the segments saved by earlier runs.
+
+        :param chapters: Text of each chapter, e.g. from `split_chapters()`.
+        :param output_dir: Directory the chapter files are written to. Created if it does not exist.
+        :return: Paths of the chapter WAV files, in chapter order.
+        """
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        texts: Dict[str, str] = dict()
+        keys: List[List[str]] = []
+        for chapter in chapters:
+            segments = split_segments(chapter, self._max_segment_length)
+            keys.append([self._key(segment) for segment in segments])
+            texts.update(zip(keys[-1], segments))
+
+        counts = Counter(key for chapter_keys in keys for key in chapter_keys)
+        completed = set(key for key in counts if self._is_saved(key))
+        missing = deque(key for key in counts if key not in completed)
+        num_resumed = sum(counts[key] for key in completed)
+        num_completed = num_resumed
+
+        paths = [os.path.join(output_dir, "chapter_%03d.wav" % (i + 1)) for i in range(len(chapters))]
+        num_assembled = 0
+        audio_sec = 0.
+        start = time.perf_counter()
+
+        def assemble_ready() -> int:
+            index = num_assembled
+            while index < len(chapters) and all(key in completed for key in keys[index]):
+                self._assemble(keys[index], paths[index])
+                index += 1
+            return index
+
+        def report() -> None:
+            if self._on_progress is not None:
+                elapsed_sec = time.perf_counter() - start
+                self._on_progress(self.Progress(
+                    num_segments=sum(counts.values()),
+                    num_completed_segments=num_completed,
+                    num_resumed_segments=num_resumed,
+                    num_completed_chapters=num_assembled,
+                    audio_sec=audio_sec,
+                    elapsed_sec=elapsed_sec,
+                    audio_sec_per_sec=audio_sec / elapsed_sec if elapsed_sec > 0 else 0.))
+
+        num_assembled = assemble_ready()
+        report()
+
+        pending: Dict[Future, str] = dict()
+        error = None
+        while len(missing) > 0 or len(pending) > 0:
+            while error is None and len(missing) > 0 and len(pending) < self._max_num_pending_segments:
+                key = missing.popleft()
+                future = self._pool.synthesize(
+                    texts[key],
+                    speech_rate=self._speech_rate,
+                    random_state=self._random_state,
+                    priority=OrcaPriority.BATCH)
+                pending[future] = key
+
+            if len(pending) == 0:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    pcm, alignments = future.result()
+                except Exception as e:
+                    if error is None:
+                        error = e
+                    continue
+                self._save(key, pcm, alignments)
+                completed.add(key)
+                num_completed += counts[key]
+                audio_sec += len(pcm) / self._pool.sample_rate
+
+            if error is None:
+                num_assembled = assemble_ready()
+            report()
+
+        if error is not None:
+            raise error
+
+        return paths
+
+    def _key(self, text: str) -> str:
+        parameters = json.dumps([text, self._speech_rate, self._random_state, self._pool.version])
+        return hashlib.sha256(parameters.encode("utf-8")).hexdigest()
+
+    def _checkpoint_paths(self, key: str) -> Tuple[str, str]:
+        path = os.path.join(self._checkpoint_dir, key)
+        return path + ".pcm", path + ".json"
+
+    def _is_saved(self, key: str) -> bool:
+        pcm_path, alignments_path = self._checkpoint_paths(key)
+        try:
+            with open(alignments_path, "r") as f:
+                num_samples = json.load(f)["num_samples"]
+            return os.path.getsize(pcm_path) == 2 * num_samples
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def _save(self, key: str, pcm: Sequence[int], alignments: Sequence[Orca.WordAlignment]) -> None:
+        pcm_path, alignments_path = self._checkpoint_paths(key)
+
+        samples = array('h', pcm)
+        if sys.byteorder == "big":
+            samples.byteswap()
+        _write_atomic(pcm_path, samples.tobytes())
+
+        checkpoint = {
+            "num_samples": len(samples),
+            "alignments": [
+                [
+                    alignment.word,
+                    alignment.start_sec,
+                    alignment.end_sec,
+                    [[phoneme.phoneme, phoneme.start_sec, phoneme.end_sec] for phoneme in alignment.phonemes],
+                ]
+                for alignment in alignments
+            ],
+        }
+        _write_atomic(alignments_path, json.dumps(checkpoint).encode("utf-8"))
+
+    def _assemble(self, keys: Sequence[str], path: str) -> None:
+        sample_rate = self._pool.sample_rate
+        alignments = []
+        offset_sec = 0.
+
+        with OrcaWavWriter(path + ".tmp", sample_rate) as writer:
+            for key in keys:
+                pcm_path, alignments_path = self._checkpoint_paths(key)
+                with open(alignments_path, "r") as f:
+                    checkpoint = json.load(f)
+                for word, start_sec, end_sec, phonemes in checkpoint["alignments"]:
+                    alignments.append({
+                        "word": word,
+                        "start_sec": offset_sec + start_sec,
+                        "end_sec": offset_sec + end_sec,
+                        "phonemes": [
+                            {"phoneme": phoneme, "start_sec": offset_sec + x, "end_sec": offset_sec + y}
+                            for phoneme, x, y in phonemes
+                        ],
+                    })
+
+                with open(pcm_path, "rb") as f:
+                    while True:
+                        data = f.read(2 * _READ_NUM_SAMPLES)
+                        if len(data) == 0:
+                            break
+                        samples = array('h', data)
+                        if sys.byteorder == "big":
+                            samples.byteswap()
+                        writer.write(samples)
+                offset_sec += checkpoint["num_samples"] / sample_rate
+
+        os.replace(path + ".tmp", path)
+        _write_atomic(os.path.splitext(path)[0] + ".json", json.dumps(alignments, indent=2).encode("utf-8"))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+__all__ = [
+    "DEFAULT_CHAPTER_PATTERN",
+    "LongFormRenderer",
+    "split_chapters",
+    "split_segments",
+]
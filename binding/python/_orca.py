@@ -10,10 +10,20 @@
 #
 
 import os
+import re
+import threading
 from collections import namedtuple
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from ctypes import *
 from enum import Enum
+from time import perf_counter
 from typing import (
+    Dict,
+    Iterator,
+    List,
     Optional,
     Sequence,
     Set,
@@ -136,6 +146,10 @@ class COrcaWordAlignment(Structure):
     ]
 
 
+_SENTENCE_END_CHARACTERS = frozenset(".!?\n。！？")
+_CLAUSE_END_CHARACTERS = frozenset(",;:、，；：")
+
+
 class Orca:
     """
     Python binding for Orca Text-to-Speech engine.
@@ -152,12 +166,45 @@ class Orca:
 
     class OrcaStream:
         """
-        Orca Stream object that converts a stream of text to a stream of audio.
+        Orca Stream object that converts a stream of text to a stream of audio. A stream reuses its native
+        out-parameters across calls, so it must only be used by one thread at a time.
         """
 
-        def __init__(self, handle: POINTER('Orca.COrcaStream'), orca: 'Orca') -> None:
+        # Characters ending a sentence or clause, in English and CJK text. Shared by every layer that looks for a
+        # boundary (`TextSegmenter`, `StallPolicy`), so that they agree on where text may be cut.
+        BOUNDARY_CHARACTERS = _SENTENCE_END_CHARACTERS | _CLAUSE_END_CHARACTERS
+
+        def __init__(
+                self,
+                handle: POINTER('Orca.COrcaStream'),
+                orca: 'Orca',
+                coalescing: Optional['Orca.Coalescing'] = None) -> None:
             self._handle = handle
             self._orca = orca
+            self._coalescing = coalescing
+
+            self._pending: List[str] = []
+            self._pending_length = 0
+            self._is_pending_at_boundary = False
+            self._time_first_pending = 0.
+            self._time_last_call = -float("inf")
+
+            self._num_texts = 0
+            self._num_calls = 0
+
+            self._bind_engine()
+
+        @property
+        def num_texts(self) -> int:
+            """Number of text chunks added."""
+
+            return self._num_texts
+
+        @property
+        def num_calls(self) -> int:
+            """Number of calls made into the engine."""
+
+            return self._num_calls
 
         def synthesize(self, text: str) -> Optional[Sequence[int]]:
             """
@@ -177,25 +224,75 @@ class Orca:
             audio chunk has been produced.
             """
 
-            c_num_samples = c_int32()
-            c_pcm = POINTER(c_int16)()
+            self._num_texts += 1
+            if self._coalescing is None:
+                self._num_calls += 1
+                return self._synthesize(text)
 
-            status = self._orca._stream_synthesize_func(
-                self._handle,
-                text.encode("utf-8"),
-                byref(c_num_samples),
-                byref(c_pcm)
-            )
+            now = perf_counter()
+            if self._pending_length == 0:
+                self._time_first_pending = now
+            self._pending.append(text)
+            self._pending_length += len(text)
+            stripped = text.rstrip()
+            if len(stripped) > 0:
+                self._is_pending_at_boundary = stripped[-1] in self.BOUNDARY_CHARACTERS
+
+            return self._synthesize_pending(now)
+
+        def poll(self) -> Optional[Sequence[int]]:
+            """
+            Passes text held back by coalescing to the engine once its window or delay bound has expired. To keep the
+            delay bound while no text arrives, call this function periodically. Does nothing if coalescing is off.
+
+            :return: The generated audio as a sequence of 16-bit linearly-encoded integers, `None` if no
+            audio chunk has been produced.
+            """
+
+            return self._synthesize_pending(perf_counter())
+
+        def _synthesize_pending(self, now: float, force: bool = False) -> Optional[Sequence[int]]:
+            if self._pending_length == 0:
+                return None
+
+            coalescing = self._coalescing
+            if not force and not self._is_pending_at_boundary and \
+                    now - self._time_first_pending < coalescing.max_delay_sec:
+                if self._pending_length < coalescing.min_chunk_length or \
+                        now - self._time_last_call < coalescing.window_sec:
+                    return None
+
+            text = self._pending[0] if len(self._pending) == 1 else "".join(self._pending)
+            self._pending.clear()
+            self._pending_length = 0
+            self._is_pending_at_boundary = False
+            self._time_last_call = now
+
+            self._num_calls += 1
+            return self._synthesize(text)
+
+        # `_bind_engine()`, `_synthesize()`, `_flush()` and `_close()` are the only methods calling into the engine.
+        # Stand-ins that do not load the library, such as `FakeOrca.FakeStream`, override them.
+
+        def _bind_engine(self) -> None:
+            self._synthesize_func = self._orca._stream_synthesize_func
+            self._flush_func = self._orca._stream_flush_func
+            self._pcm_delete_func = self._orca._pcm_delete_func
+            self._c_num_samples = c_int32()
+            self._c_pcm = POINTER(c_int16)()
+            self._c_num_samples_ref = byref(self._c_num_samples)
+            self._c_pcm_ref = byref(self._c_pcm)
+
+        def _synthesize(self, text: str) -> Optional[Sequence[int]]:
+            status = self._synthesize_func(self._handle, text.encode("utf-8"), self._c_num_samples_ref, self._c_pcm_ref)
             if status is not PicovoiceStatuses.SUCCESS:
                 raise _PICOVOICE_STATUS_TO_EXCEPTION[status](
                     message="Unable to synthesize text in Orca stream",
                     message_stack=self._orca._get_error_stack())
 
-            pcm = None
-            if c_num_samples.value > 0:
-                pcm = [c_pcm[i] for i in range(c_num_samples.value)]
-
-            self._orca._pcm_delete_func(c_pcm)
+            num_samples = self._c_num_samples.value
+            pcm = self._c_pcm[:num_samples] if num_samples > 0 else None
+            self._pcm_delete_func(self._c_pcm)
 
             return pcm
 
@@ -209,29 +306,36 @@ class Orca:
             audio chunk has been produced.
             """
 
-            c_num_samples = c_int32()
-            c_pcm = POINTER(c_int16)()
+            pending_pcm = self._synthesize_pending(perf_counter(), force=True)
+            self._num_calls += 1
+            pcm = self._flush()
+            if pending_pcm is not None:
+                pcm = list(pending_pcm) + pcm
 
-            status = self._orca._stream_flush_func(
-                self._handle,
-                byref(c_num_samples),
-                byref(c_pcm)
-            )
+            return pcm
+
+        def _flush(self) -> Sequence[int]:
+            status = self._flush_func(self._handle, self._c_num_samples_ref, self._c_pcm_ref)
             if status is not PicovoiceStatuses.SUCCESS:
                 raise _PICOVOICE_STATUS_TO_EXCEPTION[status](
                     message="Unable to flush Orca stream",
                     message_stack=self._orca._get_error_stack())
 
-            pcm = [c_pcm[i] for i in range(c_num_samples.value)]
-            self._orca._pcm_delete_func(c_pcm)
+            pcm = self._c_pcm[:self._c_num_samples.value]
+            self._pcm_delete_func(self._c_pcm)
 
             return pcm
 
         def close(self) -> None:
             """
-            Releases the resources acquired by the OrcaStream object.
+            Releases the resources acquired by the OrcaStream object. Text held back by coalescing is discarded.
             """
 
+            self._pending.clear()
+            self._pending_length = 0
+            self._close()
+
+        def _close(self) -> None:
             self._orca._stream_close_func(self._handle)
 
     def __init__(
@@ -266,7 +370,7 @@ class Orca:
         if not os.path.exists(library_path):
             raise OrcaIOError("Could not find Orca's dynamic library at `%s`." % library_path)
 
-        library = cdll.LoadLibrary(library_path)
+        library = _load_library(library_path)
 
         set_sdk_func = library.pv_set_sdk
         set_sdk_func.argtypes = [c_char_p]
@@ -327,7 +431,7 @@ class Orca:
 
         num_characters = c_num_characters.value
         characters_array_pointer = cast(c_characters, POINTER(c_char_p * num_characters))
-        self._valid_characters = set([symbol.decode('utf-8') for symbol in list(characters_array_pointer.contents)])
+        valid_characters = set([symbol.decode('utf-8') for symbol in list(characters_array_pointer.contents)])
         valid_characters_delete_func(c_characters)
 
         sample_rate_func = library.pv_orca_sample_rate
@@ -340,7 +444,6 @@ class Orca:
             raise _PICOVOICE_STATUS_TO_EXCEPTION[status](
                 message="Unable to get Orca sample rate",
                 message_stack=self._get_error_stack())
-        self._sample_rate = c_sample_rate.value
 
         max_character_limit_func = library.pv_orca_max_character_limit
         max_character_limit_func.argtypes = [POINTER(self.COrca), POINTER(c_int32)]
@@ -352,7 +455,6 @@ class Orca:
             raise _PICOVOICE_STATUS_TO_EXCEPTION[status](
                 message="Unable to get Orca maximum character limit",
                 message_stack=self._get_error_stack())
-        self._max_character_limit = c_max_character_limit.value
 
         self._synthesize_params_init_func = library.pv_orca_synthesize_params_init
         self._synthesize_params_init_func.argtypes = [POINTER(POINTER(self.COrcaSynthesizeParams))]
@@ -433,10 +535,35 @@ class Orca:
         version_func = library.pv_orca_version
         version_func.argtypes = []
         version_func.restype = c_char_p
-        self._version = version_func().decode("utf-8")
+
+        self._set_engine_info(
+            valid_characters=valid_characters,
+            sample_rate=c_sample_rate.value,
+            max_character_limit=c_max_character_limit.value,
+            version=version_func().decode("utf-8"))
+
+    DEFAULT_FIRST_SEGMENT_LENGTH = 64
+    DEFAULT_GROWTH_FACTOR = 2.
 
     PhonemeAlignment = namedtuple('Phoneme', ['phoneme', 'start_sec', 'end_sec'])
     WordAlignment = namedtuple('Word', ['word', 'start_sec', 'end_sec', 'phonemes'])
+    Coalescing = namedtuple(
+        'Coalescing',
+        ['window_sec', 'min_chunk_length', 'max_delay_sec'],
+        defaults=[0.02, 8, 0.1])
+
+    def _set_engine_info(
+            self,
+            valid_characters: Set[str],
+            sample_rate: int,
+            max_character_limit: int,
+            version: str) -> None:
+        # Called once the engine is initialized. Stand-ins that do not load the library, such as `FakeOrca`, call it
+        # instead of the constructor.
+        self._valid_characters = valid_characters
+        self._sample_rate = sample_rate
+        self._max_character_limit = max_character_limit
+        self._version = version
 
     def delete(self) -> None:
         """Releases resources acquired by Orca."""
@@ -501,7 +628,7 @@ class Orca:
                 message="Unable to synthesize speech",
                 message_stack=self._get_error_stack())
 
-        pcm = [c_pcm[i] for i in range(c_num_samples.value)]
+        pcm = c_pcm[:c_num_samples.value]
         self._pcm_delete_func(c_pcm)
 
         alignments = self._get_alignments(c_num_alignments=c_num_alignments, c_alignments=c_alignments)
@@ -553,15 +680,118 @@ class Orca:
 
         return alignments
 
-    def stream_open(self, speech_rate: Optional[float] = None, random_state: Optional[int] = None) -> 'Orca.OrcaStream':
+    def synthesize_progressive(
+            self,
+            text: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            first_segment_length: int = DEFAULT_FIRST_SEGMENT_LENGTH,
+            growth_factor: float = DEFAULT_GROWTH_FACTOR) -> Iterator[Tuple[Sequence[int], Sequence[WordAlignment]]]:
+        """
+        Generates audio from text in segments of growing length, so that the audio of the first words is available
+        long before the whole text has been synthesized.
+
+        The text is split into segments at sentence, clause or word boundaries. The first segment holds at most
+        `first_segment_length` characters, and each following segment up to `growth_factor` times as many as the one
+        before, up to `self.max_character_limit`. While the caller consumes a segment, the next one is synthesized on a
+        background thread. Unlike streaming synthesis, each segment comes with its word alignments, shifted so that they
+        are relative to the start of the whole text. Do not use this instance from other threads until the generator is
+        exhausted or closed.
+
+        :param text: Text to be converted to audio. It may be longer than `self.max_character_limit`. Custom
+        pronunciations of the form `{word|pronunciation}` are never split; a segment grows beyond its maximum length to
+        hold one whole, and a custom pronunciation longer than `self.max_character_limit` is rejected.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param first_segment_length: Maximum number of characters in the first segment.
+        :param growth_factor: Factor by which the maximum length grows from one segment to the next.
+        :return: A generator of tuples of the audio of a segment (a sequence of 16-bit linearly-encoded integers) and
+        its word alignments.
+        """
+
+        if first_segment_length < 1:
+            raise OrcaInvalidArgumentError("`first_segment_length` should be a positive integer.")
+        if growth_factor < 1:
+            raise OrcaInvalidArgumentError("`growth_factor` should be at least 1.")
+
+        def max_lengths() -> Iterator[int]:
+            max_length = float(first_segment_length)
+            while True:
+                yield min(int(max_length), self.max_character_limit)
+                max_length *= growth_factor
+
+        _check_pronunciation_lengths(text, self.max_character_limit)
+
+        return self._synthesize_progressive(_split_text(text, max_lengths()), speech_rate, random_state)
+
+    def _synthesize_progressive(
+            self,
+            segments: Iterator[str],
+            speech_rate: Optional[float],
+            random_state: Optional[int]) -> Iterator[Tuple[Sequence[int], Sequence[WordAlignment]]]:
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        def submit() -> Optional[Future]:
+            segment = next(segments, None)
+            if segment is None:
+                return None
+            return executor.submit(self.synthesize, segment, speech_rate, random_state)
+
+        try:
+            offset_sec = 0.
+            future = submit()
+            while future is not None:
+                pcm, alignments = future.result()
+                future = submit()
+                yield pcm, self._offset_alignments(alignments, offset_sec)
+                offset_sec += len(pcm) / self.sample_rate
+        finally:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _offset_alignments(
+            cls,
+            alignments: Sequence[WordAlignment],
+            offset_sec: float) -> Sequence[WordAlignment]:
+        if offset_sec == 0:
+            return alignments
+
+        return [
+            cls.WordAlignment(
+                word=alignment.word,
+                start_sec=alignment.start_sec + offset_sec,
+                end_sec=alignment.end_sec + offset_sec,
+                phonemes=[
+                    cls.PhonemeAlignment(
+                        phoneme=phoneme.phoneme,
+                        start_sec=phoneme.start_sec + offset_sec,
+                        end_sec=phoneme.end_sec + offset_sec)
+                    for phoneme in alignment.phonemes
+                ])
+            for alignment in alignments
+        ]
+
+    def stream_open(
+            self,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            coalescing: Optional['Orca.Coalescing'] = None) -> 'Orca.OrcaStream':
         """
         Opens a stream for streaming text synthesis.
 
         :param speech_rate: Rate of speech of the generated audio.
         :param random_state: Random seed for the synthesis process.
+        :param coalescing: Merges text chunks arriving in quick succession into a single call into the engine. Text is
+        held back while fewer than `min_chunk_length` characters are pending, or while less than `window_sec` seconds
+        have passed since the previous call. Text ending at a punctuation mark is passed on right away, and no text is
+        held back for longer than `max_delay_sec` seconds as long as `.synthesize()` or `.poll()` is called. Off if
+        not set. Leave it off when the text is already coalesced by a `TextSegmenter`, as in `OrcaStreamInput` and
+        `StreamingSession`.
         :return: An instance of Orca.OrcaStream.
         """
 
+        self._check_coalescing(coalescing)
+
         c_synthesize_params = self._get_c_synthesize_params(speech_rate=speech_rate, random_state=random_state)
 
         stream_handle = POINTER(Orca.COrcaStream)()
@@ -576,7 +806,7 @@ class Orca:
 
         self._synthesize_params_delete_func(c_synthesize_params)
 
-        return self.OrcaStream(stream_handle, self)
+        return self.OrcaStream(stream_handle, self, coalescing=coalescing)
 
     @property
     def version(self) -> str:
@@ -584,6 +814,16 @@ class Orca:
 
         return self._version
 
+    @staticmethod
+    def _check_coalescing(coalescing: Optional['Orca.Coalescing']) -> None:
+        if coalescing is not None:
+            if coalescing.window_sec < 0:
+                raise OrcaInvalidArgumentError("`window_sec` should be a non-negative number.")
+            if coalescing.min_chunk_length < 1:
+                raise OrcaInvalidArgumentError("`min_chunk_length` should be a positive integer.")
+            if coalescing.max_delay_sec < coalescing.window_sec:
+                raise OrcaInvalidArgumentError("`max_delay_sec` should not be smaller than `window_sec`.")
+
     def _get_alignments(
             self,
             c_num_alignments: c_int32,
@@ -666,16 +906,95 @@ class Orca:
         return message_stack
 
 
-def list_hardware_devices(library_path: str) -> Sequence[str]:
-    dll_dir_obj = None
-    if hasattr(os, "add_dll_directory"):
-        dll_dir_obj = os.add_dll_directory(os.path.dirname(library_path))
+_WORD_PATTERN = re.compile(r"(?:\{[^{}]*\}|\S)+\s*")
+_UNIT_PATTERN = re.compile(r"\{[^{}]*\}|.", flags=re.DOTALL)
+_PRONUNCIATION_PATTERN = re.compile(r"\{[^{}]*\}")
+
+
+def _word_priority(word: str) -> int:
+    stripped = word.rstrip(" \t")
+    if len(stripped) == 0 or stripped[-1] in _SENTENCE_END_CHARACTERS or "\n" in word:
+        return 2
+    if stripped[-1] in _CLAUSE_END_CHARACTERS:
+        return 1
+    return 0
+
+
+def _check_pronunciation_lengths(text: str, max_length: int) -> None:
+    for match in _PRONUNCIATION_PATTERN.finditer(text):
+        if len(match.group()) > max_length:
+            raise OrcaInvalidArgumentError(
+                "Custom pronunciation `%s` is longer than %d characters." % (match.group(), max_length))
+
+
+def _split_text(text: str, max_lengths: Iterator[int]) -> Iterator[str]:
+    max_length = next(max_lengths)
+    words: List[str] = []
+    length = 0
+
+    for word in _WORD_PATTERN.findall(text.strip()):
+        while length + len(word.rstrip()) > max_length and len(words) > 0:
+            priorities = [_word_priority(x) for x in words]
+            best = max(priorities)
+            cut = len(priorities) - priorities[::-1].index(best) if best > 0 else len(words)
+            segment = "".join(words[:cut]).strip()
+            if len(segment) > 0:
+                yield segment
+                max_length = next(max_lengths)
+            words = words[cut:]
+            length = sum(len(x) for x in words)
+
+        if len(word.rstrip()) > max_length:
+            # Split between characters, but keep each custom pronunciation whole even if it is longer than the segment,
+            # and keep punctuation with the characters before it.
+            piece = ""
+            for unit in _UNIT_PATTERN.findall(word):
+                is_breakable = unit.isalnum() or unit.startswith("{")
+                if is_breakable and len(piece) + len(unit) > max_length and len(piece) > 0:
+                    yield piece
+                    piece = ""
+                    max_length = next(max_lengths)
+                piece += unit
+            word = piece
+
+        words.append(word)
+        length += len(word)
+
+    segment = "".join(words).strip()
+    if len(segment) > 0:
+        yield segment
+
+
+_libraries: Dict[str, CDLL] = dict()
+_hardware_devices: Dict[str, Tuple[str, ...]] = dict()
+_libraries_lock = threading.Lock()
 
-    library = cdll.LoadLibrary(library_path)
 
-    if dll_dir_obj is not None:
-        dll_dir_obj.close()
+def _library_key(library_path: str) -> str:
+    return os.path.realpath(library_path)
 
+
+def _load_library(library_path: str) -> CDLL:
+    key = _library_key(library_path)
+    with _libraries_lock:
+        library = _libraries.get(key)
+        if library is None:
+            dll_dir_obj = None
+            if hasattr(os, "add_dll_directory"):
+                dll_dir_obj = os.add_dll_directory(os.path.dirname(library_path))
+
+            try:
+                library = cdll.LoadLibrary(library_path)
+            finally:
+                if dll_dir_obj is not None:
+                    dll_dir_obj.close()
+
+            _libraries[key] = library
+
+    return library
+
+
+def _query_hardware_devices(library: CDLL) -> Tuple[str, ...]:
     list_hardware_devices_func = library.pv_orca_list_hardware_devices
     list_hardware_devices_func.argtypes = [POINTER(POINTER(c_char_p)), POINTER(c_int32)]
     list_hardware_devices_func.restype = PicovoiceStatuses
@@ -684,7 +1003,7 @@ def list_hardware_devices(library_path: str) -> Sequence[str]:
     status = list_hardware_devices_func(byref(c_hardware_devices), byref(c_num_hardware_devices))
     if status is not PicovoiceStatuses.SUCCESS:
         raise _PICOVOICE_STATUS_TO_EXCEPTION[status](message='`pv_orca_list_hardware_devices` failed.')
-    res = [c_hardware_devices[i].decode() for i in range(c_num_hardware_devices.value)]
+    res = tuple(c_hardware_devices[i].decode() for i in range(c_num_hardware_devices.value))
 
     free_hardware_devices_func = library.pv_orca_free_hardware_devices
     free_hardware_devices_func.argtypes = [POINTER(c_char_p), c_int32]
@@ -694,7 +1013,43 @@ def list_hardware_devices(library_path: str) -> Sequence[str]:
     return res
 
 
+def list_hardware_devices(library_path: str, refresh: bool = False) -> Sequence[str]:
+    """
+    Lists the devices Orca can use for inference. The library is queried once per library path; later calls return
+    the cached list until `invalidate_hardware_devices()` is called or `refresh` is set.
+
+    :param library_path: Absolute path to Orca's dynamic library.
+    :param refresh: Query the library again instead of returning the cached list.
+    :return: List of device strings.
+    """
+
+    key = _library_key(library_path)
+    devices = None if refresh else _hardware_devices.get(key)
+    if devices is None:
+        devices = _query_hardware_devices(_load_library(library_path))
+        with _libraries_lock:
+            _hardware_devices[key] = devices
+
+    return list(devices)
+
+
+def invalidate_hardware_devices(library_path: Optional[str] = None) -> None:
+    """
+    Drops the cached device list, so the next call to `list_hardware_devices()` queries the library again (e.g. after a
+    GPU has been added or its driver restarted).
+
+    :param library_path: Library whose list is dropped. If not set, the lists of all libraries are dropped.
+    """
+
+    with _libraries_lock:
+        if library_path is None:
+            _hardware_devices.clear()
+        else:
+            _hardware_devices.pop(_library_key(library_path), None)
+
+
 __all__ = [
+    "invalidate_hardware_devices",
     "list_hardware_devices",
     "Orca",
     "OrcaActivationError",
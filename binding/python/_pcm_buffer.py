@@ -0,0 +1,356 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import threading
+import time
+from array import array
+from enum import Enum
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+)
+
+from ._orca import (
+    OrcaInvalidArgumentError,
+    OrcaMemoryError,
+)
+
+
+class OrcaOverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+
+
+class OrcaBufferFullError(OrcaMemoryError):
+    pass
+
+
+class PcmRingBuffer:
+    """
+    Single-producer, single-consumer ring buffer of 16-bit PCM with a fixed capacity, used as a playback sink.
+
+    One thread writes audio (e.g. from `Orca.OrcaStream`) and one thread reads it (e.g. an audio device callback), and
+    any thread may call `.clear()`. The sides share the total numbers of samples written, read and discarded. A lock
+    guards updates to these counts but not the copying of audio, so neither side waits on the other for longer than a
+    few assignments, and the buffer is allocated once. The consumer can copy into its output buffer with `.read_into()`
+    or hand out contiguous views with `.peek()` and `.advance()`. Samples in a view returned by `.peek()` are not
+    overwritten before `.advance()`, not even by `DROP_OLDEST` writes or by writes following `.clear()`.
+
+    Reads that come up short while the producer has not called `.finish()` are counted as underruns, writes that do not
+    fit are counted as overruns. What happens to audio that does not fit is chosen per write with an
+    `OrcaOverflowPolicy`. `.wait_drained()` blocks until the consumer has read everything, without polling.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Constructor.
+
+        :param capacity: Maximum number of buffered samples.
+        """
+
+        if capacity < 1:
+            raise OrcaInvalidArgumentError("`capacity` should be a positive integer.")
+
+        self._capacity = capacity
+        self._buffer = array('h', bytes(2 * capacity))
+        self._view = memoryview(self._buffer)
+        self._zeros = memoryview(array('h'))
+
+        self._lock = threading.Lock()
+        self._num_written = 0
+        self._num_read = 0
+        self._discard_until = 0
+        self._peek_start: Optional[int] = None
+        self._num_clears = 0
+        self._is_finished = True
+
+        self._num_underruns = 0
+        self._num_overruns = 0
+        self._num_dropped_samples = 0
+        self._max_fill_level = 0
+
+        self._drained = threading.Event()
+        self._drained.set()
+        self._space_available = threading.Event()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of buffered samples."""
+
+        return self._capacity
+
+    @property
+    def fill_level(self) -> int:
+        """Number of buffered samples."""
+
+        return self._num_written - max(self._num_read, self._discard_until)
+
+    @property
+    def num_samples_written(self) -> int:
+        """Total number of samples written."""
+
+        return self._num_written
+
+    @property
+    def num_samples_consumed(self) -> int:
+        """Total number of samples read or dropped from the buffer."""
+
+        return max(self._num_read, self._discard_until)
+
+    @property
+    def max_fill_level(self) -> int:
+        """Largest number of samples buffered at once."""
+
+        return self._max_fill_level
+
+    @property
+    def num_underruns(self) -> int:
+        """Number of reads that returned fewer samples than requested before `.finish()` was called."""
+
+        return self._num_underruns
+
+    @property
+    def num_overruns(self) -> int:
+        """Number of writes that did not fit into the buffer."""
+
+        return self._num_overruns
+
+    @property
+    def num_dropped_samples(self) -> int:
+        """Number of samples dropped by overruns."""
+
+        return self._num_dropped_samples
+
+    def write(
+            self,
+            pcm: Sequence[int],
+            timeout: Optional[float] = 0.,
+            overflow_policy: OrcaOverflowPolicy = OrcaOverflowPolicy.BLOCK) -> int:
+        """
+        Appends audio. Called by the producer only.
+
+        :param pcm: Audio as a sequence of 16-bit linearly-encoded integers. Buffers of 16-bit samples, such as
+        `array('h')` or one-dimensional `numpy.int16` arrays, are copied without conversion.
+        :param timeout: Maximum number of seconds to wait for the consumer to make room. `0` does not wait, `None` waits
+        indefinitely.
+        :param overflow_policy: What to do with audio that does not fit. `BLOCK` waits for room and drops the rest of
+        the audio once the timeout expires. `DROP_OLDEST` does not wait and drops the oldest buffered audio to make
+        room, or the newest audio where the oldest is in a view returned by `.peek()`. `RAISE` waits for room for all of
+        the audio and raises `OrcaBufferFullError` without writing any of it once the timeout expires. If `.clear()` is
+        called while the write waits, the rest of the audio is dropped and the write returns right away.
+        :return: Number of samples written. If fewer than `len(pcm)` for any reason other than `.clear()`, the write is
+        counted as an overrun.
+        """
+
+        try:
+            source = memoryview(pcm)
+        except TypeError:
+            source = None
+        if source is None or source.format != 'h' or source.ndim != 1:
+            source = memoryview(array('h', pcm))
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        num_clears = self._num_clears
+
+        self._is_finished = False
+
+        if overflow_policy is OrcaOverflowPolicy.DROP_OLDEST:
+            return self._write_drop_oldest(source)
+
+        if overflow_policy is OrcaOverflowPolicy.RAISE:
+            while len(source) > self._num_free():
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if len(source) > self._capacity or (remaining is not None and remaining <= 0):
+                    self._num_overruns += 1
+                    self._num_dropped_samples += len(source)
+                    raise OrcaBufferFullError(
+                        "No room for %d samples in PCM buffer holding %d of %d samples." %
+                        (len(source), self.fill_level, self._capacity))
+                self._space_available.wait(remaining)
+                self._space_available.clear()
+                if self._num_clears != num_clears:
+                    return 0
+            return self._write_available(source)
+
+        offset = 0
+        while offset < len(source):
+            offset += self._write_available(source[offset:])
+            if offset == len(source):
+                break
+
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                break
+            self._space_available.wait(remaining)
+            self._space_available.clear()
+            if self._num_clears != num_clears:
+                return offset
+
+        if offset < len(source):
+            self._num_overruns += 1
+            self._num_dropped_samples += len(source) - offset
+
+        return offset
+
+    def finish(self) -> None:
+        """Marks the end of the audio written so far. Reads coming up short afterwards are not underruns."""
+
+        self._is_finished = True
+
+    def clear(self) -> None:
+        """
+        Drops all buffered audio, e.g. on barge-in. A producer waiting for room in `.write()` drops the rest of its
+        audio and returns, so that audio from before the barge-in does not refill the buffer.
+        """
+
+        with self._lock:
+            self._num_clears += 1
+            self._discard_until = self._num_written
+        self._is_finished = True
+        self._drained.set()
+        self._space_available.set()
+
+    def read_into(self, output: Any) -> int:
+        """
+        Copies buffered audio into `output` and fills the rest of it with silence. Called by the consumer only; safe to
+        call from an audio callback.
+
+        :param output: Writable buffer of 16-bit samples, e.g. an `array('h')` or a one-dimensional `numpy.int16`
+        array.
+        :return: Number of samples copied from the buffer.
+        """
+
+        target = memoryview(output)
+        if target.format != 'h' or target.ndim != 1:
+            target = target.cast('B').cast('h')
+        num_requested = len(target)
+
+        num_copied = 0
+        while num_copied < num_requested:
+            view = self.peek(num_requested - num_copied)
+            if len(view) == 0:
+                break
+            target[num_copied:num_copied + len(view)] = view
+            num_copied += len(view)
+            self.advance(len(view))
+
+        if num_copied < num_requested:
+            if len(self._zeros) < num_requested - num_copied:
+                self._zeros = memoryview(array('h', bytes(2 * num_requested)))
+            target[num_copied:] = self._zeros[:num_requested - num_copied]
+            if not self._is_finished:
+                self._num_underruns += 1
+
+        return num_copied
+
+    def peek(self, max_num_samples: Optional[int] = None) -> memoryview:
+        """
+        Returns a view of the next contiguous buffered samples without consuming them. Called by the consumer only.
+
+        :param max_num_samples: Maximum number of samples in the view.
+        :return: A view of up to `max_num_samples` samples. It may hold fewer samples than are buffered when the
+        buffered audio wraps around the end of the ring. It is not overwritten before `.advance()` is called.
+        """
+
+        with self._lock:
+            if self._num_read < self._discard_until:
+                self._num_read = self._discard_until
+            self._peek_start = self._num_read
+            num_available = self._num_written - self._num_read
+
+        start = self._num_read % self._capacity
+        length = min(num_available, self._capacity - start)
+        if max_num_samples is not None:
+            length = min(length, max_num_samples)
+
+        return self._view[start:start + length]
+
+    def advance(self, num_samples: int) -> None:
+        """
+        Consumes samples returned by `.peek()`. Called by the consumer only.
+
+        :param num_samples: Number of samples to consume.
+        """
+
+        with self._lock:
+            self._num_read += num_samples
+            self._peek_start = None
+        self._space_available.set()
+        if self._num_read >= self._num_written:
+            self._drained.set()
+
+    def wait_drained(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the consumer has read all buffered audio.
+
+        :param timeout: Maximum number of seconds to wait. Waits indefinitely if not set.
+        :return: `True` if the buffer is empty, `False` if the timeout expired.
+        """
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.fill_level > 0:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._drained.wait(remaining)
+            self._drained.clear()
+        return True
+
+    def _write_drop_oldest(self, source: memoryview) -> int:
+        num_dropped = max(len(source) - self._capacity, 0)
+        source = source[num_dropped:]
+
+        with self._lock:
+            num_consumed = max(self._num_read, self._discard_until)
+            num_excess = self._num_written - num_consumed + len(source) - self._capacity
+            if num_excess > 0:
+                self._discard_until = num_consumed + num_excess
+                num_dropped += num_excess
+
+        # Writes only as much as the view the consumer holds, if any, leaves room for.
+        num_written = self._write_available(source)
+        num_dropped += len(source) - num_written
+
+        if num_dropped > 0:
+            self._num_overruns += 1
+            self._num_dropped_samples += num_dropped
+
+        return num_written
+
+    def _num_free(self) -> int:
+        with self._lock:
+            num_kept = max(self._num_read, self._discard_until)
+            if self._peek_start is not None:
+                num_kept = min(num_kept, self._peek_start)
+            return self._capacity - (self._num_written - num_kept)
+
+    def _write_available(self, source: memoryview) -> int:
+        length = min(len(source), self._num_free())
+        if length == 0:
+            return 0
+
+        start = self._num_written % self._capacity
+        first = min(length, self._capacity - start)
+        self._view[start:start + first] = source[:first]
+        if length > first:
+            self._view[:length - first] = source[first:length]
+        with self._lock:
+            self._num_written += length
+        self._max_fill_level = max(self._max_fill_level, self.fill_level)
+        return length
+
+
+__all__ = [
+    "OrcaBufferFullError",
+    "OrcaOverflowPolicy",
+    "PcmRingBuffer",
+]
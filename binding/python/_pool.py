@@ -0,0 +1,853 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import bisect
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import (
+    deque,
+    namedtuple,
+)
+from concurrent.futures import Future
+from enum import Enum
+from queue import Queue
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ._affinity import _pin_current_thread
+from ._orca import (
+    Orca,
+    OrcaError,
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+)
+
+
+class OrcaScheduling(Enum):
+    ROUND_ROBIN = "round_robin"
+    DEADLINE = "deadline"
+
+
+class OrcaPriority(Enum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class OrcaLatencyHistogram:
+    """Histogram of the time requests of one priority class waited before an instance started serving them."""
+
+    BUCKET_BOUNDS_SEC = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1., 2., 5., 10.)
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(self.BUCKET_BOUNDS_SEC) + 1)
+        self._count = 0
+        self._sum_sec = 0.
+
+    def add(self, latency_sec: float) -> None:
+        self._counts[bisect.bisect_left(self.BUCKET_BOUNDS_SEC, latency_sec)] += 1
+        self._count += 1
+        self._sum_sec += latency_sec
+
+    def copy(self) -> 'OrcaLatencyHistogram':
+        histogram = OrcaLatencyHistogram()
+        histogram._counts = list(self._counts)
+        histogram._count = self._count
+        histogram._sum_sec = self._sum_sec
+        return histogram
+
+    @property
+    def buckets(self) -> Sequence[Tuple[float, int]]:
+        """Cumulative buckets as `(upper bound in seconds, number of requests)`. The last bound is infinity."""
+
+        return list(zip(self.BUCKET_BOUNDS_SEC + (math.inf,), itertools.accumulate(self._counts)))
+
+    @property
+    def count(self) -> int:
+        """Number of requests."""
+
+        return self._count
+
+    @property
+    def sum_sec(self) -> float:
+        """Total latency of all requests."""
+
+        return self._sum_sec
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Upper bound of the bucket containing the given percentile.
+
+        :param percentile: Percentile within [0, 100].
+        :return: Latency in seconds, `0` if no request has been recorded.
+        """
+
+        if self._count == 0:
+            return 0.
+
+        rank = math.ceil(self._count * percentile / 100)
+        for bound, count in self.buckets:
+            if count >= rank:
+                return bound
+        return math.inf
+
+
+class _RequestType(Enum):
+    SYNTHESIZE = 0
+    FLUSH = 1
+    CLOSE = 2
+
+
+_Request = namedtuple('_Request', ['type', 'text', 'time_enqueued', 'deadline', 'future'])
+
+
+class _ReadyQueue:
+    """Entries (sessions or jobs) waiting for an instance, ordered round-robin or by deadline."""
+
+    def __init__(self, scheduling: OrcaScheduling) -> None:
+        self._is_deadline = scheduling is OrcaScheduling.DEADLINE
+        self._entries = [] if self._is_deadline else deque()
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, entry) -> None:
+        if self._is_deadline:
+            heapq.heappush(self._entries, (entry.head_deadline, next(self._counter), entry))
+        else:
+            self._entries.append(entry)
+
+    def peek(self):
+        return self._entries[0][2] if self._is_deadline else self._entries[0]
+
+    def pop(self):
+        return heapq.heappop(self._entries)[2] if self._is_deadline else self._entries.popleft()
+
+    def sort_key(self) -> float:
+        entry = self.peek()
+        return entry.head_deadline if self._is_deadline else entry.head_time_enqueued
+
+
+class _Job:
+    """Synthesis of a complete text, served by any instance of the pool."""
+
+    def __init__(
+            self,
+            text: str,
+            output_path: Optional[str],
+            speech_rate: Optional[float],
+            random_state: Optional[int],
+            deadline_sec: float) -> None:
+        self.text = text
+        self.output_path = output_path
+        self.speech_rate = speech_rate
+        self.random_state = random_state
+        self.future: Future = Future()
+        self.head_time_enqueued = time.perf_counter()
+        self.head_deadline = self.head_time_enqueued + deadline_sec
+
+    @property
+    def num_pending(self) -> int:
+        return 0
+
+    def pop_request(self) -> Tuple['_Job', float]:
+        return self, time.perf_counter() - self.head_time_enqueued
+
+    def execute(self, orca: Orca, request: '_Job') -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            if self.output_path is None:
+                result = orca.synthesize(self.text, speech_rate=self.speech_rate, random_state=self.random_state)
+            else:
+                result = orca.synthesize_to_file(
+                    self.text,
+                    self.output_path,
+                    speech_rate=self.speech_rate,
+                    random_state=self.random_state)
+        except Exception as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+    def release(self, worker: '_Worker', request: '_Job') -> None:
+        pass
+
+    def abort(self) -> None:
+        if self.future.set_running_or_notify_cancel():
+            self.future.set_exception(OrcaInvalidStateError("Pool has been deleted."))
+
+
+class _Worker:
+    """Thread that owns one Orca instance and serves the sessions bound to it and the jobs of the pool."""
+
+    def __init__(
+            self,
+            pool: 'OrcaPool',
+            index: int,
+            orca_factory: Callable[[], Orca],
+            cpu_set: Optional[AbstractSet[int]] = None) -> None:
+        self.index = index
+        self._pool = pool
+        self._orca_factory = orca_factory
+        self._cpu_set = cpu_set
+
+        self.orca: Optional[Orca] = None
+        self.init_error: Optional[BaseException] = None
+        self.ready = threading.Event()
+
+        self.sessions: Set['OrcaPool.Session'] = set()
+        self.ready_sessions = {priority: _ReadyQueue(pool.scheduling) for priority in OrcaPriority}
+
+        self._standby = deque()
+        self._standby_requests = deque([(None, None)] * pool._num_standby_streams)
+
+        self._thread = threading.Thread(target=self._run, name="orca-pool-worker-%d" % index, daemon=True)
+        self._thread.start()
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def has_standby_stream(self, key: Tuple[Optional[float], Optional[int]]) -> bool:
+        """Must be called with the pool's `._condition` held."""
+
+        return any(k == key for k, _ in self._standby) or key in self._standby_requests
+
+    def request_standby_stream(self, key: Tuple[Optional[float], Optional[int]]) -> None:
+        """Must be called with the pool's `._condition` held."""
+
+        if self._pool._num_standby_streams == 0:
+            return
+        self._standby_requests.append(key)
+        while len(self._standby_requests) > self._pool._num_standby_streams:
+            self._standby_requests.popleft()
+        self._pool._condition.notify_all()
+
+    def open_stream(self, speech_rate: Optional[float], random_state: Optional[int]) -> Orca.OrcaStream:
+        """
+        Takes a standby stream opened with the same parameters, or opens a new one. Either way, a replacement is opened
+        once the worker is idle. Must be called on the worker thread.
+        """
+
+        key = (speech_rate, random_state)
+        stream = None
+        with self._pool._condition:
+            for i, (k, standby_stream) in enumerate(self._standby):
+                if k == key:
+                    stream = standby_stream
+                    del self._standby[i]
+                    break
+            if self._pool._num_standby_streams > 0:
+                if stream is None:
+                    self._pool._num_standby_misses += 1
+                else:
+                    self._pool._num_standby_hits += 1
+            self.request_standby_stream(key)
+
+        if stream is None:
+            stream = self.orca.stream_open(speech_rate=speech_rate, random_state=random_state)
+        return stream
+
+    def _open_standby_stream(self, key: Tuple[Optional[float], Optional[int]]) -> None:
+        try:
+            stream = self.orca.stream_open(speech_rate=key[0], random_state=key[1])
+        except OrcaError:
+            return
+
+        with self._pool._condition:
+            self._standby.append((key, stream))
+            evicted = []
+            while len(self._standby) > self._pool._num_standby_streams:
+                evicted.append(self._standby.popleft()[1])
+        for evicted_stream in evicted:
+            evicted_stream.close()
+
+    def _run(self) -> None:
+        try:
+            _pin_current_thread(self._cpu_set)
+            self.orca = self._orca_factory()
+        except BaseException as e:
+            self.init_error = e
+            return
+        finally:
+            self.ready.set()
+
+        pool = self._pool
+        try:
+            while True:
+                with pool._condition:
+                    picked = pool._pick(self)
+                    while picked is None and not pool._is_deleted and len(self._standby_requests) == 0:
+                        pool._condition.wait()
+                        picked = pool._pick(self)
+                    if picked is None:
+                        if pool._is_deleted:
+                            break
+                        standby_key = self._standby_requests.popleft()
+                    else:
+                        entry, priority = picked
+                        request, wait_sec = entry.pop_request()
+                        if entry.num_pending > 0:
+                            self.ready_sessions[priority].push(entry)
+                        pool._histograms[priority].add(wait_sec)
+                        if priority is OrcaPriority.BATCH:
+                            pool._num_batch_running += 1
+
+                if picked is None:
+                    self._open_standby_stream(standby_key)
+                    continue
+
+                entry.execute(self.orca, request)
+
+                with pool._condition:
+                    if priority is OrcaPriority.BATCH:
+                        pool._num_batch_running -= 1
+                        pool._condition.notify_all()
+                    entry.release(self, request)
+        finally:
+            with pool._condition:
+                sessions = list(self.sessions)
+                self.sessions.clear()
+            for session in sessions:
+                session.abort()
+            for _, stream in self._standby:
+                stream.close()
+            self._standby.clear()
+            self.orca.delete()
+
+
+class OrcaPool:
+    """
+    Multiplexes many streaming sessions and synthesis jobs over a fixed set of Orca instances.
+
+    Each instance is owned by a worker thread. When a session starts an utterance it is bound to the instance serving
+    the fewest utterances, and its stream lives on that instance until the utterance is flushed, so its audio is
+    produced in order. Jobs (`.synthesize()` and `.synthesize_to_file()`) are served by any instance. A worker serves
+    one request (a chunk of text, a flush or a job) at a time and picks the next one either round-robin or by earliest
+    deadline, so that no session waits behind the whole utterance of another.
+
+    Interactive requests are always picked before batch requests. Batch requests run on at most a share of the
+    instances at a time, and a batch request that has waited longer than `batch_aging_sec` is picked before interactive
+    requests so that batch work cannot starve.
+    """
+
+    SessionStats = namedtuple(
+        'SessionStats',
+        ['num_requests', 'num_pending', 'max_num_pending', 'mean_wait_sec', 'max_wait_sec'])
+    StandbyStats = namedtuple('StandbyStats', ['num_hits', 'num_misses'])
+
+    class Session:
+        """
+        Streaming session of an `OrcaPool`. Mirrors `Orca.OrcaStream`, but requests are queued and served by the pool.
+        A flush ends the current utterance, and the next chunk of text may be served by a different instance.
+        """
+
+        def __init__(
+                self,
+                pool: 'OrcaPool',
+                speech_rate: Optional[float],
+                random_state: Optional[int],
+                deadline_sec: float,
+                priority: OrcaPriority,
+                on_audio: Optional[Callable[[Sequence[int]], None]]) -> None:
+            self._pool = pool
+            self._speech_rate = speech_rate
+            self._random_state = random_state
+            self._deadline_sec = deadline_sec
+            self._priority = priority
+            self._on_audio = on_audio
+
+            self._worker: Optional[_Worker] = None
+            self._requests = deque()
+            self._output: Queue = Queue()
+            self._stream: Optional[Orca.OrcaStream] = None
+            self._is_closed = False
+            self._error: Optional[BaseException] = None
+
+            self._num_requests = 0
+            self._max_num_pending = 0
+            self._total_wait_sec = 0.
+            self._max_wait_sec = 0.
+
+        def synthesize(self, text: str) -> Future:
+            """
+            Queues a chunk of text. See `Orca.OrcaStream.synthesize()`.
+
+            :param text: A chunk of text from a text input stream.
+            :return: A future resolving to the audio generated for the chunk, once it has been delivered.
+            """
+
+            return self._enqueue(_RequestType.SYNTHESIZE, text)
+
+        def flush(self) -> Future:
+            """
+            Queues a flush of the current utterance. See `Orca.OrcaStream.flush()`.
+
+            :return: A future resolving to the remaining audio of the utterance, once it has been delivered.
+            """
+
+            return self._enqueue(_RequestType.FLUSH, None)
+
+        def prepare(self) -> None:
+            """
+            Binds the session to an instance ahead of its next utterance, e.g. while the user is still speaking, so that
+            the instance can open a standby stream for it before the first chunk of text arrives.
+            """
+
+            with self._pool._condition:
+                if self._is_closed or self._pool._is_deleted or self._worker is not None:
+                    return
+                self._worker = self._pool._least_loaded_worker()
+                self._worker.sessions.add(self)
+                key = (self._speech_rate, self._random_state)
+                if not self._worker.has_standby_stream(key):
+                    self._worker.request_standby_stream(key)
+
+        def close(self) -> None:
+            """Closes the session. Requests queued before are still served."""
+
+            if self._is_closed:
+                return
+            self._enqueue(_RequestType.CLOSE, None)
+            self._is_closed = True
+
+        def read(self, timeout: Optional[float] = None) -> Optional[Sequence[int]]:
+            """
+            Returns the next audio chunk of the session. Only available if the session was opened without `on_audio`.
+
+            :param timeout: Maximum number of seconds to wait. Waits indefinitely if not set.
+            :return: The next audio chunk as a sequence of 16-bit linearly-encoded integers, `None` once the session
+            is closed and all its audio has been read.
+            """
+
+            if self._on_audio is not None:
+                raise OrcaInvalidStateError("Audio of this session is delivered to `on_audio`.")
+
+            item = self._output.get(timeout=timeout)
+            if isinstance(item, BaseException):
+                raise item
+            return item
+
+        def __iter__(self) -> Iterator[Sequence[int]]:
+            while True:
+                pcm = self.read()
+                if pcm is None:
+                    return
+                yield pcm
+
+        @property
+        def priority(self) -> OrcaPriority:
+            """Priority class of the session."""
+
+            return self._priority
+
+        @property
+        def stats(self) -> 'OrcaPool.SessionStats':
+            """Queue-depth and wait-time statistics of the session."""
+
+            with self._pool._condition:
+                return OrcaPool.SessionStats(
+                    num_requests=self._num_requests,
+                    num_pending=len(self._requests),
+                    max_num_pending=self._max_num_pending,
+                    mean_wait_sec=self._total_wait_sec / self._num_requests if self._num_requests > 0 else 0.,
+                    max_wait_sec=self._max_wait_sec)
+
+        @property
+        def num_pending(self) -> int:
+            return len(self._requests)
+
+        @property
+        def head_time_enqueued(self) -> float:
+            return self._requests[0].time_enqueued
+
+        @property
+        def head_deadline(self) -> float:
+            return self._requests[0].deadline
+
+        def pop_request(self) -> Tuple[_Request, float]:
+            request = self._requests.popleft()
+            wait_sec = time.perf_counter() - request.time_enqueued
+            self._num_requests += 1
+            self._total_wait_sec += wait_sec
+            self._max_wait_sec = max(self._max_wait_sec, wait_sec)
+            return request, wait_sec
+
+        def execute(self, orca: Orca, request: _Request) -> None:
+            if request.type is _RequestType.CLOSE:
+                self._close_stream()
+                self._output.put(None)
+                return
+            if self._error is not None:
+                if request.future is not None:
+                    request.future.set_exception(self._error)
+                return
+
+            try:
+                if self._stream is None:
+                    self._stream = self._worker.open_stream(self._speech_rate, self._random_state)
+                if request.type is _RequestType.SYNTHESIZE:
+                    pcm = self._stream.synthesize(request.text)
+                else:
+                    pcm = self._stream.flush()
+                    self._close_stream()
+                if pcm is not None and len(pcm) > 0:
+                    if self._on_audio is not None:
+                        self._on_audio(pcm)
+                    else:
+                        self._output.put(pcm)
+            except Exception as e:
+                self._error = e
+                self._close_stream()
+                self._output.put(e)
+                if request.future is not None:
+                    request.future.set_exception(e)
+                return
+
+            if request.future is not None:
+                request.future.set_result(pcm)
+
+        def release(self, worker: _Worker, request: _Request) -> None:
+            if request.type is _RequestType.SYNTHESIZE:
+                return
+            if len(self._requests) == 0 and self._worker is worker:
+                self._worker = None
+                worker.sessions.discard(self)
+
+        def abort(self) -> None:
+            for request in self._requests:
+                if request.future is not None:
+                    request.future.set_exception(OrcaInvalidStateError("Pool has been deleted."))
+            self._requests.clear()
+            self._close_stream()
+            self._output.put(None)
+
+        def _close_stream(self) -> None:
+            if self._stream is not None:
+                try:
+                    self._stream.close()
+                except OrcaError:
+                    pass
+                self._stream = None
+
+        def _enqueue(self, request_type: _RequestType, text: Optional[str]) -> Optional[Future]:
+            if self._is_closed:
+                raise OrcaInvalidStateError("Session is closed.")
+            if self._error is not None:
+                raise self._error
+
+            now = time.perf_counter()
+            request = _Request(
+                type=request_type,
+                text=text,
+                time_enqueued=now,
+                deadline=now + self._deadline_sec,
+                future=Future() if request_type is not _RequestType.CLOSE else None)
+            with self._pool._condition:
+                if self._pool._is_deleted:
+                    raise OrcaInvalidStateError("Pool has been deleted.")
+                if self._worker is None:
+                    if request_type is _RequestType.CLOSE:
+                        self._output.put(None)
+                        return None
+                    if request_type is _RequestType.FLUSH:
+                        request.future.set_result([])
+                        return request.future
+                    self._worker = self._pool._least_loaded_worker()
+                    self._worker.sessions.add(self)
+                self._requests.append(request)
+                self._max_num_pending = max(self._max_num_pending, len(self._requests))
+                if len(self._requests) == 1:
+                    self._worker.ready_sessions[self._priority].push(self)
+                    self._pool._condition.notify_all()
+
+            return request.future
+
+    DEFAULT_DEADLINE_SEC = 0.5
+    DEFAULT_BATCH_DEADLINE_SEC = 10.
+
+    def __init__(
+            self,
+            orca_factory: Callable[[], Orca],
+            num_instances: int,
+            scheduling: OrcaScheduling = OrcaScheduling.ROUND_ROBIN,
+            batch_share: float = 0.5,
+            batch_aging_sec: float = 5.,
+            num_standby_streams: int = 1,
+            cpu_sets: Optional[Sequence[AbstractSet[int]]] = None) -> None:
+        """
+        Constructor.
+
+        :param orca_factory: Function that creates an Orca instance, e.g. `lambda: pvorca.create(access_key)`. It is
+        called once per instance, on the thread that will own the instance.
+        :param num_instances: Number of Orca instances in the pool.
+        :param scheduling: Policy for picking the next request within a priority class. `OrcaScheduling.ROUND_ROBIN`
+        serves ready sessions in turn, `OrcaScheduling.DEADLINE` serves the request with the earliest deadline first.
+        :param batch_share: Share of the instances that may serve batch requests at the same time. At least one instance
+        can always serve batch requests. Valid values are within (0, 1].
+        :param batch_aging_sec: Number of seconds after which a waiting batch request is picked before interactive
+        requests.
+        :param num_standby_streams: Number of streams each instance keeps open ahead of time, so that an utterance
+        starts without waiting for `Orca.stream_open()`. Standby streams are opened while the instance is idle, with
+        the parameters of the streams taken most recently. Set to `0` to open streams on demand.
+        :param cpu_sets: If set, the worker of the i-th instance is pinned to the CPUs of the i-th set (modulo the
+        number of sets) before the instance is created, so that the instance's inference threads stay on them. See
+        `plan_cpu_sets()`. Only supported on Linux; ignored elsewhere.
+        """
+
+        if not isinstance(num_instances, int) or num_instances < 1:
+            raise OrcaInvalidArgumentError("`num_instances` should be a positive integer.")
+        if not isinstance(scheduling, OrcaScheduling):
+            raise OrcaInvalidArgumentError("`scheduling` should be an `OrcaScheduling` value.")
+        if not 0 < batch_share <= 1:
+            raise OrcaInvalidArgumentError("`batch_share` should be within (0, 1].")
+        if batch_aging_sec <= 0:
+            raise OrcaInvalidArgumentError("`batch_aging_sec` should be a positive number.")
+        if not isinstance(num_standby_streams, int) or num_standby_streams < 0:
+            raise OrcaInvalidArgumentError("`num_standby_streams` should be a non-negative integer.")
+        if cpu_sets is not None and (len(cpu_sets) == 0 or any(len(cpu_set) == 0 for cpu_set in cpu_sets)):
+            raise OrcaInvalidArgumentError("`cpu_sets` should be a non-empty sequence of non-empty sets.")
+
+        self.scheduling = scheduling
+        self._max_num_batch_running = max(1, int(batch_share * num_instances))
+        self._batch_aging_sec = batch_aging_sec
+
+        self._condition = threading.Condition()
+        self._is_deleted = False
+        self._jobs = {priority: _ReadyQueue(scheduling) for priority in OrcaPriority}
+        self._num_batch_running = 0
+        self._histograms = {priority: OrcaLatencyHistogram() for priority in OrcaPriority}
+        self._num_standby_streams = num_standby_streams
+        self._num_standby_hits = 0
+        self._num_standby_misses = 0
+
+        self._workers = [
+            _Worker(self, i, orca_factory, cpu_set=None if cpu_sets is None else cpu_sets[i % len(cpu_sets)])
+            for i in range(num_instances)]
+
+        init_error = None
+        for worker in self._workers:
+            worker.ready.wait()
+            if init_error is None and worker.init_error is not None:
+                init_error = worker.init_error
+        if init_error is not None:
+            self.delete()
+            raise init_error
+
+        orca = self._workers[0].orca
+        self._sample_rate = orca.sample_rate
+        self._valid_characters = orca.valid_characters
+        self._max_character_limit = orca.max_character_limit
+        self._version = orca.version
+
+    def open_session(
+            self,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            deadline_sec: float = DEFAULT_DEADLINE_SEC,
+            priority: OrcaPriority = OrcaPriority.INTERACTIVE,
+            on_audio: Optional[Callable[[Sequence[int]], None]] = None) -> 'OrcaPool.Session':
+        """
+        Opens a streaming session. The session does not hold an instance until text is queued.
+
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param deadline_sec: Number of seconds within which each request of the session should be served. Only used
+        with `OrcaScheduling.DEADLINE`.
+        :param priority: Priority class of the session.
+        :param on_audio: Callback receiving the audio chunks of the session, called on a worker thread. If not set,
+        audio is read with `Session.read()`.
+        :return: An instance of `OrcaPool.Session`.
+        """
+
+        if deadline_sec <= 0:
+            raise OrcaInvalidArgumentError("`deadline_sec` should be a positive number.")
+        if not isinstance(priority, OrcaPriority):
+            raise OrcaInvalidArgumentError("`priority` should be an `OrcaPriority` value.")
+
+        return self.Session(
+            pool=self,
+            speech_rate=speech_rate,
+            random_state=random_state,
+            deadline_sec=deadline_sec,
+            priority=priority,
+            on_audio=on_audio)
+
+    def synthesize(
+            self,
+            text: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            priority: OrcaPriority = OrcaPriority.BATCH,
+            deadline_sec: float = DEFAULT_BATCH_DEADLINE_SEC) -> Future:
+        """
+        Queues a synthesis job. See `Orca.synthesize()`.
+
+        :param text: Text to be converted to audio.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param priority: Priority class of the job.
+        :param deadline_sec: Number of seconds within which the job should be started. Only used with
+        `OrcaScheduling.DEADLINE`.
+        :return: A future resolving to the result of `Orca.synthesize()`.
+        """
+
+        return self._submit(_Job(text, None, speech_rate, random_state, deadline_sec), priority)
+
+    def synthesize_to_file(
+            self,
+            text: str,
+            output_path: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            priority: OrcaPriority = OrcaPriority.BATCH,
+            deadline_sec: float = DEFAULT_BATCH_DEADLINE_SEC) -> Future:
+        """
+        Queues a synthesis job writing to a file. See `Orca.synthesize_to_file()`.
+
+        :param text: Text to be converted to audio.
+        :param output_path: Absolute path to the output audio file.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param priority: Priority class of the job.
+        :param deadline_sec: Number of seconds within which the job should be started. Only used with
+        `OrcaScheduling.DEADLINE`.
+        :return: A future resolving to the result of `Orca.synthesize_to_file()`.
+        """
+
+        return self._submit(_Job(text, output_path, speech_rate, random_state, deadline_sec), priority)
+
+    @property
+    def num_instances(self) -> int:
+        """Number of Orca instances in the pool."""
+
+        return len(self._workers)
+
+    @property
+    def num_active_sessions(self) -> Sequence[int]:
+        """Number of sessions with an utterance in progress, per instance."""
+
+        with self._condition:
+            return [len(worker.sessions) for worker in self._workers]
+
+    @property
+    def latency_histograms(self) -> Dict[OrcaPriority, OrcaLatencyHistogram]:
+        """Snapshot of the time requests waited for an instance, per priority class."""
+
+        with self._condition:
+            return {priority: histogram.copy() for priority, histogram in self._histograms.items()}
+
+    @property
+    def standby_stats(self) -> 'OrcaPool.StandbyStats':
+        """Number of utterances that started on a standby stream (hits) and that had to open one (misses)."""
+
+        with self._condition:
+            return OrcaPool.StandbyStats(num_hits=self._num_standby_hits, num_misses=self._num_standby_misses)
+
+    @property
+    def sample_rate(self) -> int:
+        """Audio sample rate of generated audio."""
+
+        return self._sample_rate
+
+    @property
+    def valid_characters(self) -> Set[str]:
+        """Set of characters supported by Orca."""
+
+        return self._valid_characters
+
+    @property
+    def max_character_limit(self) -> int:
+        """Maximum number of characters allowed in a single synthesis request."""
+
+        return self._max_character_limit
+
+    @property
+    def version(self) -> str:
+        """Version."""
+
+        return self._version
+
+    def delete(self) -> None:
+        """Stops the workers and releases the Orca instances. Requests that have not been served are dropped."""
+
+        with self._condition:
+            self._is_deleted = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+        with self._condition:
+            jobs = []
+            for queue in self._jobs.values():
+                while len(queue) > 0:
+                    jobs.append(queue.pop())
+        for job in jobs:
+            job.abort()
+
+    def _submit(self, job: _Job, priority: OrcaPriority) -> Future:
+        if not isinstance(priority, OrcaPriority):
+            raise OrcaInvalidArgumentError("`priority` should be an `OrcaPriority` value.")
+
+        with self._condition:
+            if self._is_deleted:
+                raise OrcaInvalidStateError("Pool has been deleted.")
+            self._jobs[priority].push(job)
+            self._condition.notify_all()
+
+        return job.future
+
+    def _least_loaded_worker(self) -> _Worker:
+        return min(self._workers, key=lambda w: (len(w.sessions), w.index))
+
+    def _pick(self, worker: _Worker) -> Optional[Tuple[object, OrcaPriority]]:
+        """Picks the queue the worker serves next. Must be called with `._condition` held."""
+
+        if self._is_deleted:
+            return None
+
+        can_serve_batch = self._num_batch_running < self._max_num_batch_running
+        batch_queues = [q for q in (worker.ready_sessions[OrcaPriority.BATCH], self._jobs[OrcaPriority.BATCH]) if q]
+        if can_serve_batch and len(batch_queues) > 0:
+            oldest = min(batch_queues, key=lambda q: q.peek().head_time_enqueued)
+            if time.perf_counter() - oldest.peek().head_time_enqueued >= self._batch_aging_sec:
+                return oldest.pop(), OrcaPriority.BATCH
+
+        queues: List[_ReadyQueue] = \
+            [q for q in (worker.ready_sessions[OrcaPriority.INTERACTIVE], self._jobs[OrcaPriority.INTERACTIVE]) if q]
+        priority = OrcaPriority.INTERACTIVE
+        if len(queues) == 0 and can_serve_batch:
+            queues = batch_queues
+            priority = OrcaPriority.BATCH
+        if len(queues) == 0:
+            return None
+
+        return min(queues, key=lambda q: q.sort_key()).pop(), priority
+
+
+__all__ = [
+    "OrcaLatencyHistogram",
+    "OrcaPool",
+    "OrcaPriority",
+    "OrcaScheduling",
+]
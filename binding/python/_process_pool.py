@@ -0,0 +1,392 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import itertools
+import multiprocessing
+import pickle
+import threading
+import time
+from array import array
+from concurrent.futures import Future
+from queue import Empty
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._affinity import _pin_current_thread
+from ._orca import (
+    Orca,
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+    OrcaRuntimeError,
+)
+from ._pool import OrcaPriority
+from ._shared_pcm import SharedPcmRing
+
+_READY = "ready"
+_CHUNK = "chunk"
+_DONE = "done"
+_ERROR = "error"
+
+_LIVENESS_INTERVAL_SEC = 0.1
+
+
+def _pack_alignments(alignments: Sequence[Orca.WordAlignment]) -> List[Tuple]:
+    return [
+        (alignment.word, alignment.start_sec, alignment.end_sec, [tuple(phoneme) for phoneme in alignment.phonemes])
+        for alignment in alignments
+    ]
+
+
+def _unpack_alignments(alignments: Sequence[Tuple]) -> List[Orca.WordAlignment]:
+    return [
+        Orca.WordAlignment(
+            word=word,
+            start_sec=start_sec,
+            end_sec=end_sec,
+            phonemes=[Orca.PhonemeAlignment(*phoneme) for phoneme in phonemes])
+        for word, start_sec, end_sec, phonemes in alignments
+    ]
+
+
+def _put_result(results, kind: str, job_id: Optional[int], value) -> None:
+    # The queue pickles on a feeder thread, where a failure would be lost and the job would never complete.
+    try:
+        pickle.dumps(value)
+    except Exception as e:
+        kind = _ERROR
+        value = OrcaRuntimeError("Could not send the result of job `%s` to the pool: %s" % (job_id, e))
+    results.put((kind, job_id, value))
+
+
+def _worker_main(
+        index: int,
+        orca_factory: Callable[[], Orca],
+        ring: SharedPcmRing,
+        tasks,
+        results,
+        running,
+        cpu_set: Optional[AbstractSet[int]] = None) -> None:
+    try:
+        _pin_current_thread(cpu_set)
+        orca = orca_factory()
+    except Exception as e:
+        _put_result(results, _ERROR, None, e)
+        return
+    results.put((_READY, None, (orca.sample_rate, orca.max_character_limit, orca.version)))
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            job_id, text, output_path, speech_rate, random_state = task
+            # Shared memory rather than a message, so the parent sees it even if this process dies before the queue's
+            # feeder thread flushes.
+            running[index] = job_id
+            try:
+                if output_path is None:
+                    pcm, alignments = orca.synthesize(text, speech_rate=speech_rate, random_state=random_state)
+                    for slot, length in ring.write(pcm):
+                        results.put((_CHUNK, job_id, (slot, length)))
+                else:
+                    alignments = orca.synthesize_to_file(
+                        text,
+                        output_path,
+                        speech_rate=speech_rate,
+                        random_state=random_state)
+            except Exception as e:
+                _put_result(results, _ERROR, job_id, e)
+            else:
+                _put_result(results, _DONE, job_id, _pack_alignments(alignments))
+    finally:
+        orca.delete()
+        ring.close()
+
+
+class OrcaProcessPool:
+    """
+    Runs synthesis jobs on Orca instances living in worker processes, for parallelism beyond what threads sharing one
+    process achieve. Audio is returned through a `SharedPcmRing`, so only slot descriptors and alignments cross the
+    process boundary.
+
+    Jobs run in submission order. The pool has the members of `OrcaPool` that batch jobs use, so it can be passed to
+    `LongFormRenderer`. If a worker process exits unexpectedly (e.g. it crashes or is killed), the job it was running
+    fails with `OrcaRuntimeError`, and once no worker is left, so do all pending jobs.
+    """
+
+    def __init__(
+            self,
+            orca_factory: Callable[[], Orca],
+            num_processes: int,
+            num_slots: int = 32,
+            slot_num_samples: int = 16384,
+            context: Optional[multiprocessing.context.BaseContext] = None,
+            cpu_sets: Optional[Sequence[AbstractSet[int]]] = None) -> None:
+        """
+        Constructor.
+
+        :param orca_factory: Picklable function that creates an Orca instance, e.g.
+        `functools.partial(pvorca.create, access_key)`. It is called once in each worker process.
+        :param num_processes: Number of worker processes.
+        :param num_slots: Number of slots of the shared PCM ring. Workers wait for a free slot once all are in use.
+        :param slot_num_samples: Number of samples per slot.
+        :param context: Multiprocessing context used to start the workers. Defaults to the default context.
+        :param cpu_sets: If set, the i-th worker process is pinned to the CPUs of the i-th set (modulo the number of
+        sets) before it creates its instance. See `plan_cpu_sets()`. Only supported on Linux; ignored elsewhere.
+        """
+
+        if not isinstance(num_processes, int) or num_processes < 1:
+            raise OrcaInvalidArgumentError("`num_processes` should be a positive integer.")
+        if cpu_sets is not None and (len(cpu_sets) == 0 or any(len(cpu_set) == 0 for cpu_set in cpu_sets)):
+            raise OrcaInvalidArgumentError("`cpu_sets` should be a non-empty sequence of non-empty sets.")
+
+        if context is None:
+            context = multiprocessing.get_context()
+
+        self._ring = SharedPcmRing(num_slots=num_slots, slot_num_samples=slot_num_samples, context=context)
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._futures: Dict[int, Future] = dict()
+        self._pcm: Dict[int, array] = dict()
+        self._running = context.Array("q", [-1] * num_processes, lock=False)
+        self._is_deleted = False
+
+        self._processes = [
+            context.Process(
+                target=_worker_main,
+                args=(
+                    i,
+                    orca_factory,
+                    self._ring,
+                    self._tasks,
+                    self._results,
+                    self._running,
+                    None if cpu_sets is None else cpu_sets[i % len(cpu_sets)]),
+                daemon=True)
+            for i in range(num_processes)]
+        for process in self._processes:
+            process.start()
+
+        self._num_alive = num_processes
+
+        self._sample_rate = None
+        self._max_character_limit = None
+        self._version = None
+        init_error = None
+        for _ in self._processes:
+            kind, _, value = self._results.get()
+            if kind == _READY:
+                self._sample_rate, self._max_character_limit, self._version = value
+            elif init_error is None:
+                init_error = value
+        if init_error is not None:
+            self.delete()
+            raise init_error
+
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    @property
+    def num_processes(self) -> int:
+        """Number of worker processes."""
+
+        return len(self._processes)
+
+    @property
+    def num_instances(self) -> int:
+        """Number of Orca instances, one per worker process. Same as `.num_processes`."""
+
+        return len(self._processes)
+
+    @property
+    def sample_rate(self) -> int:
+        """Audio sample rate of generated audio."""
+
+        return self._sample_rate
+
+    @property
+    def max_character_limit(self) -> int:
+        """Maximum number of characters allowed in a single synthesis request."""
+
+        return self._max_character_limit
+
+    @property
+    def version(self) -> str:
+        """Version."""
+
+        return self._version
+
+    def synthesize(
+            self,
+            text: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            priority: Optional[OrcaPriority] = None) -> Future:
+        """
+        Queues a synthesis job. See `Orca.synthesize()`.
+
+        :param text: Text to be converted to audio.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param priority: Accepted for compatibility with `OrcaPool.synthesize()` and ignored; jobs run in submission
+        order.
+        :return: A future resolving to a tuple of the generated audio, as an `array` of 16-bit integers, and the word
+        alignments.
+        """
+
+        return self._submit(text, None, speech_rate, random_state)
+
+    def synthesize_to_file(
+            self,
+            text: str,
+            output_path: str,
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None) -> Future:
+        """
+        Queues a synthesis job writing to a file. See `Orca.synthesize_to_file()`.
+
+        :param text: Text to be converted to audio.
+        :param output_path: Absolute path to the output audio file.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :return: A future resolving to the word alignments.
+        """
+
+        return self._submit(text, output_path, speech_rate, random_state)
+
+    def delete(self) -> None:
+        """Stops the worker processes and frees the shared memory. Jobs that have not finished fail."""
+
+        with self._lock:
+            if self._is_deleted:
+                return
+            self._is_deleted = True
+            futures = list(self._futures.values())
+            self._futures.clear()
+
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join()
+        self._results.put((None, None, None))
+        if hasattr(self, "_collector"):
+            self._collector.join()
+        self._ring.close()
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(OrcaInvalidStateError("Process pool has been deleted."))
+
+    def _submit(
+            self,
+            text: str,
+            output_path: Optional[str],
+            speech_rate: Optional[float],
+            random_state: Optional[int]) -> Future:
+        future = Future()
+        with self._lock:
+            if self._is_deleted:
+                raise OrcaInvalidStateError("Process pool has been deleted.")
+            if self._num_alive == 0:
+                raise OrcaRuntimeError("All worker processes of the pool have exited.")
+            job_id = next(self._job_ids)
+            self._futures[job_id] = future
+            if output_path is None:
+                self._pcm[job_id] = array('h')
+        self._tasks.put((job_id, text, output_path, speech_rate, random_state))
+        return future
+
+    def _collect(self) -> None:
+        time_liveness_check = time.monotonic()
+        while True:
+            try:
+                kind, job_id, value = self._results.get(timeout=_LIVENESS_INTERVAL_SEC)
+            except Empty:
+                kind = None
+            else:
+                if kind is None:
+                    break
+                self._handle_result(kind, job_id, value)
+
+            if time.monotonic() - time_liveness_check >= _LIVENESS_INTERVAL_SEC:
+                self._check_processes()
+                time_liveness_check = time.monotonic()
+
+    def _check_processes(self) -> None:
+        with self._lock:
+            if self._is_deleted:
+                return
+        dead = [i for i, process in enumerate(self._processes) if process.exitcode is not None]
+        if len(dead) == self.num_processes - self._num_alive:
+            return
+
+        # Results a worker sent before it exited are handled first, so only jobs it did not finish fail.
+        while True:
+            try:
+                kind, job_id, value = self._results.get_nowait()
+            except Empty:
+                break
+            if kind is not None:
+                self._handle_result(kind, job_id, value)
+
+        failed = []
+        with self._lock:
+            self._num_alive = self.num_processes - len(dead)
+            for index in dead:
+                job_id = self._running[index]
+                if job_id in self._futures:
+                    failed.append(self._futures.pop(job_id))
+                    self._pcm.pop(job_id, None)
+            if self._num_alive == 0:
+                failed.extend(self._futures.values())
+                self._futures.clear()
+                self._pcm.clear()
+
+        for future in failed:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(OrcaRuntimeError("Worker process of the pool exited unexpectedly."))
+
+    def _handle_result(self, kind: str, job_id: Optional[int], value) -> None:
+        if kind == _CHUNK:
+            slot, length = value
+            with self._lock:
+                pcm = self._pcm.get(job_id)
+            if pcm is None:
+                self._ring.release(slot)
+            else:
+                self._ring.read(slot, length, pcm)
+            return
+
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+            pcm = self._pcm.pop(job_id, None)
+        if future is None or not future.set_running_or_notify_cancel():
+            return
+        if kind == _ERROR:
+            future.set_exception(value)
+        elif pcm is None:
+            future.set_result(_unpack_alignments(value))
+        else:
+            future.set_result((pcm, _unpack_alignments(value)))
+
+
+__all__ = [
+    "OrcaProcessPool",
+]
@@ -0,0 +1,158 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+from typing import (
+    List,
+    Optional,
+)
+
+from ._orca import (
+    Orca,
+    OrcaInvalidArgumentError,
+)
+
+
+class TextSegmenter:
+    """
+    Incrementally groups text deltas (e.g. LLM tokens) into chunks for `Orca.OrcaStream.synthesize()`.
+
+    Deltas are buffered until at least `min_chunk_length` characters are available or a punctuation mark that lets
+    Orca generate audio arrives, so that tiny deltas do not each cost a call into the engine. Custom pronunciations of
+    the form `{word|pronunciation}` are never split across chunks, unless a `{` is not closed within
+    `max_pronunciation_length` characters, in which case it is treated as plain text. Every character is inspected
+    once, so the cost of segmenting a stream is linear in its length.
+    """
+
+    DEFAULT_MIN_CHUNK_LENGTH = 8
+    DEFAULT_MAX_PRONUNCIATION_LENGTH = 256
+    BOUNDARY_CHARACTERS = Orca.OrcaStream.BOUNDARY_CHARACTERS
+
+    def __init__(
+            self,
+            min_chunk_length: int = DEFAULT_MIN_CHUNK_LENGTH,
+            max_pronunciation_length: int = DEFAULT_MAX_PRONUNCIATION_LENGTH) -> None:
+        """
+        Constructor.
+
+        :param min_chunk_length: Minimum number of characters in a chunk. Chunks ending at a punctuation mark and the
+        chunk returned by `.flush()` can be shorter. Set to `1` to only keep custom pronunciations together.
+        :param max_pronunciation_length: Maximum number of characters held back for a custom pronunciation whose `}`
+        has not arrived yet. Once exceeded, the text is released as is, so an unclosed `{` does not stall the stream.
+        """
+
+        if min_chunk_length < 1:
+            raise OrcaInvalidArgumentError("`min_chunk_length` should be a positive integer.")
+        if max_pronunciation_length < 1:
+            raise OrcaInvalidArgumentError("`max_pronunciation_length` should be a positive integer.")
+
+        self._min_chunk_length = min_chunk_length
+        self._max_pronunciation_length = max_pronunciation_length
+
+        self._pending: List[str] = []
+        self._pending_length = 0
+        self._ready_length = 0
+        self._ready_at_boundary = False
+        self._in_custom_pronunciation = False
+        self._pronunciation_start = 0
+
+    def add(self, text: str) -> Optional[str]:
+        """
+        Adds a text delta.
+
+        :param text: Text delta.
+        :return: A chunk of text ready to be passed to the stream, `None` if more text is needed.
+        """
+
+        if len(text) == 0:
+            return None
+
+        offset = self._pending_length
+        self._pending.append(text)
+        self._pending_length += len(text)
+
+        index = 0
+        while index < len(text):
+            if self._in_custom_pronunciation:
+                end = text.find("}", index)
+                if end < 0:
+                    if self._pending_length - self._pronunciation_start > self._max_pronunciation_length:
+                        self._in_custom_pronunciation = False
+                        self._ready_length = self._pending_length
+                        self._ready_at_boundary = text[-1] in self.BOUNDARY_CHARACTERS
+                    break
+                self._in_custom_pronunciation = False
+                index = end + 1
+                self._ready_length = offset + index
+                self._ready_at_boundary = False
+            else:
+                start = text.find("{", index)
+                stop = len(text) if start < 0 else start
+                if stop > index:
+                    self._ready_length = offset + stop
+                    self._ready_at_boundary = text[stop - 1] in self.BOUNDARY_CHARACTERS
+                if start < 0:
+                    break
+                self._in_custom_pronunciation = True
+                self._pronunciation_start = offset + start
+                index = start + 1
+
+        if self._ready_length >= self._min_chunk_length or (self._ready_length > 0 and self._ready_at_boundary):
+            return self._pop(self._ready_length)
+
+        return None
+
+    def flush(self) -> Optional[str]:
+        """
+        Returns all buffered text, including an incomplete custom pronunciation.
+
+        :return: Remaining text, `None` if nothing is buffered.
+        """
+
+        self._in_custom_pronunciation = False
+        if self._pending_length == 0:
+            return None
+        return self._pop(self._pending_length)
+
+    def reset(self) -> None:
+        """Discards all buffered text."""
+
+        self._pending.clear()
+        self._pending_length = 0
+        self._ready_length = 0
+        self._ready_at_boundary = False
+        self._in_custom_pronunciation = False
+        self._pronunciation_start = 0
+
+    @property
+    def pending_length(self) -> int:
+        """Number of buffered characters."""
+
+        return self._pending_length
+
+    def _pop(self, length: int) -> str:
+        text = self._pending[0] if len(self._pending) == 1 else "".join(self._pending)
+        chunk = text[:length]
+        remainder = text[length:]
+
+        self._pending.clear()
+        if len(remainder) > 0:
+            self._pending.append(remainder)
+        self._pending_length = len(remainder)
+        self._pronunciation_start = max(self._pronunciation_start - length, 0)
+        self._ready_length = 0
+        self._ready_at_boundary = False
+
+        return chunk
+
+
+__all__ = [
+    "TextSegmenter",
+]
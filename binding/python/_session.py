@@ -0,0 +1,519 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import math
+import threading
+import time
+from collections import (
+    deque,
+    namedtuple,
+)
+from queue import (
+    Empty,
+    Full,
+    Queue,
+)
+from typing import (
+    Callable,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ._jitter_buffer import AdaptiveJitterBuffer
+from ._orca import (
+    Orca,
+    OrcaError,
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+)
+from ._pcm_buffer import (
+    OrcaBufferFullError,
+    OrcaOverflowPolicy,
+    PcmRingBuffer,
+)
+from ._stream_input import (
+    OrcaStreamInput,
+    StallPolicy,
+)
+
+_FLUSH = object()
+_POLL = object()
+_STOP = object()
+
+
+class StreamingSession:
+    """
+    Streams text into an `Orca.OrcaStream` and delivers the generated audio to a sink, each on its own worker thread.
+
+    The caller adds text (e.g. LLM tokens) with `.synthesize()` and ends an utterance with `.flush()`; neither waits for
+    synthesis. A synthesis worker feeds the text through an `OrcaStreamInput` and writes the audio into a
+    `PcmRingBuffer`. A delivery worker hands the buffered audio to the sink as soon as the playback start delay chosen
+    by the jitter buffer has passed, so audio never backs up behind the arrival of text. The sink is a function
+    receiving a chunk of 16-bit PCM. It returns the number of samples it consumed, or `None` if it consumed all of them;
+    samples that were not consumed are offered again after `sink_retry_sec` seconds. Writers such as
+    `PvSpeaker.write` and `PcmRingBuffer.write` can be passed directly. To avoid a copy per chunk, the chunk is a
+    `memoryview` into the session's audio buffer that is only valid during the call; a sink that keeps the audio
+    afterwards must copy it, e.g. with `array('h', pcm)`.
+
+    Text is coalesced once, by the `TextSegmenter` of the `OrcaStreamInput`. The streams the session opens have
+    `Orca.Coalescing` off, so text is not held back a second time.
+
+    Both the text queue and the audio buffer have a fixed capacity. With the default `OrcaOverflowPolicy.BLOCK`, a sink
+    that falls behind fills the audio buffer, which holds up the synthesis worker, which fills the text queue, which
+    holds up `.synthesize()`; the memory held by a session is bounded either way. `.stats` reports the occupancy of both
+    stages.
+
+    The session does not own the Orca instance.
+    """
+
+    Stats = namedtuple(
+        'Stats',
+        [
+            'num_pending_texts',
+            'max_num_pending_texts',
+            'max_queue_size',
+            'num_dropped_texts',
+            'num_buffered_samples',
+            'max_num_buffered_samples',
+            'buffer_capacity',
+            'num_dropped_samples',
+            'num_standby_hits',
+            'num_standby_misses',
+            'num_stalls',
+            'num_stall_flushes',
+        ])
+
+    def __init__(
+            self,
+            orca: Orca,
+            sink: Callable[[Sequence[int]], Optional[int]],
+            speech_rate: Optional[float] = None,
+            random_state: Optional[int] = None,
+            max_queue_size: int = 256,
+            buffer_size_sec: float = 10.,
+            stall_policy: Optional[StallPolicy] = None,
+            jitter_buffer: Optional[AdaptiveJitterBuffer] = None,
+            num_start_chunks: Optional[int] = None,
+            on_first_audio: Optional[Callable[[float], None]] = None,
+            sink_retry_sec: float = 0.01,
+            text_overflow_policy: OrcaOverflowPolicy = OrcaOverflowPolicy.BLOCK,
+            audio_overflow_policy: OrcaOverflowPolicy = OrcaOverflowPolicy.BLOCK,
+            use_standby_stream: bool = True) -> None:
+        """
+        Constructor.
+
+        :param orca: Orca instance the stream is opened on.
+        :param sink: Function receiving the audio, see above. It is called from the delivery worker.
+        :param speech_rate: Rate of speech of the generated audio.
+        :param random_state: Random seed for the synthesis process.
+        :param max_queue_size: Maximum number of text chunks waiting for the synthesis worker.
+        :param buffer_size_sec: Number of seconds of audio buffered between the two workers.
+        :param stall_policy: If set, the stream is flushed early when no text arrives for `window_sec` seconds at a
+        sentence or clause boundary.
+        :param jitter_buffer: If set, the first audio chunk of each utterance is held back by the delay it chooses.
+        Otherwise, delivery starts with the first chunk.
+        :param num_start_chunks: If set, delivery of each utterance starts once more than this many audio chunks have
+        been synthesized, or once the utterance is flushed. Takes precedence over `jitter_buffer`.
+        :param on_first_audio: Called from the synthesis worker with the start delay, in seconds, when the first audio
+        chunk of an utterance has been synthesized.
+        :param sink_retry_sec: Number of seconds to wait before offering audio the sink did not consume again.
+        :param text_overflow_policy: What `.synthesize()` does when the text queue is full. `BLOCK` waits for room,
+        `DROP_OLDEST` drops the oldest queued text chunk and `RAISE` raises `OrcaBufferFullError`.
+        :param audio_overflow_policy: What the synthesis worker does when the audio buffer is full. `BLOCK` waits for
+        the sink, `DROP_OLDEST` drops the oldest buffered audio and `RAISE` drops the new audio and raises
+        `OrcaBufferFullError` from the next call into the session.
+        :param use_standby_stream: If set, the synthesis worker opens a spare stream while it is idle, and `.cancel()`
+        swaps it in instead of opening a new stream.
+        """
+
+        if max_queue_size < 1:
+            raise OrcaInvalidArgumentError("`max_queue_size` should be a positive integer.")
+        if buffer_size_sec <= 0:
+            raise OrcaInvalidArgumentError("`buffer_size_sec` should be a positive number.")
+        if num_start_chunks is not None and num_start_chunks < 0:
+            raise OrcaInvalidArgumentError("`num_start_chunks` should be a non-negative integer.")
+        if sink_retry_sec <= 0:
+            raise OrcaInvalidArgumentError("`sink_retry_sec` should be a positive number.")
+
+        self._orca = orca
+        self._sink = sink
+        self._speech_rate = speech_rate
+        self._random_state = random_state
+        self._stall_policy = stall_policy
+        self._jitter_buffer = jitter_buffer
+        self._num_start_chunks = num_start_chunks
+        self._on_first_audio = on_first_audio
+        self._sink_retry_sec = sink_retry_sec
+        self._text_overflow_policy = text_overflow_policy
+        self._audio_overflow_policy = audio_overflow_policy
+        self._use_standby_stream = use_standby_stream
+
+        self._queue: Queue = Queue(maxsize=max_queue_size)
+        self._buffer = PcmRingBuffer(capacity=max(1, int(buffer_size_sec * orca.sample_rate)))
+        self._audio_available = threading.Event()
+        self._stop = threading.Event()
+        self._condition = threading.Condition()
+        self._error: Optional[BaseException] = None
+        self._is_closed = False
+        self._max_num_pending_texts = 0
+        self._num_dropped_texts = 0
+        self._standby_stream: Optional[Orca.OrcaStream] = None
+        self._num_standby_hits = 0
+        self._num_standby_misses = 0
+        self._num_stalls = 0
+        self._num_stall_flushes = 0
+
+        self._num_flushes = 0
+        self._num_flushes_delivered = 0
+        self._flush_positions = deque()
+
+        self._stream = orca.stream_open(speech_rate=speech_rate, random_state=random_state)
+        self._stream_input = OrcaStreamInput(self._stream, stall_policy=stall_policy)
+        self._reset_state()
+        self._start_workers()
+
+    @property
+    def sample_rate(self) -> int:
+        """Audio sample rate of generated audio."""
+
+        return self._orca.sample_rate
+
+    @property
+    def num_pending_texts(self) -> int:
+        """Number of text chunks waiting for the synthesis worker."""
+
+        return self._queue.qsize()
+
+    @property
+    def num_buffered_samples(self) -> int:
+        """Number of synthesized samples waiting for the sink."""
+
+        return self._buffer.fill_level
+
+    @property
+    def stats(self) -> 'StreamingSession.Stats':
+        """Occupancy of the text queue and the audio buffer."""
+
+        return StreamingSession.Stats(
+            num_pending_texts=self._queue.qsize(),
+            max_num_pending_texts=self._max_num_pending_texts,
+            max_queue_size=self._queue.maxsize,
+            num_dropped_texts=self._num_dropped_texts,
+            num_buffered_samples=self._buffer.fill_level,
+            max_num_buffered_samples=self._buffer.max_fill_level,
+            buffer_capacity=self._buffer.capacity,
+            num_dropped_samples=self._buffer.num_dropped_samples,
+            num_standby_hits=self._num_standby_hits,
+            num_standby_misses=self._num_standby_misses,
+            num_stalls=self._num_stalls + self._stream_input.num_stalls,
+            num_stall_flushes=self._num_stall_flushes + self._stream_input.num_stall_flushes)
+
+    @property
+    def stream_input(self) -> OrcaStreamInput:
+        """Adapter feeding the current stream. Replaced by `.cancel()`."""
+
+        return self._stream_input
+
+    def synthesize(self, text: Union[str, bytes], timeout: Optional[float] = None) -> None:
+        """
+        Queues a chunk of text for synthesis. If the text queue is full, applies `text_overflow_policy`.
+
+        :param text: Chunk of text, either as a string or as UTF-8 encoded bytes.
+        :param timeout: Maximum number of seconds to wait for room under `OrcaOverflowPolicy.BLOCK`. Waits indefinitely
+        if not set.
+        """
+
+        self._check_state()
+
+        if self._text_overflow_policy is OrcaOverflowPolicy.DROP_OLDEST:
+            with self._queue.mutex:
+                if len(self._queue.queue) >= self._queue.maxsize:
+                    for i, item in enumerate(self._queue.queue):
+                        if item is not _FLUSH and item is not _STOP:
+                            del self._queue.queue[i]
+                            self._num_dropped_texts += 1
+                            break
+
+        try:
+            if self._text_overflow_policy is OrcaOverflowPolicy.RAISE:
+                self._queue.put_nowait(text)
+            else:
+                self._queue.put(text, timeout=timeout)
+        except Full:
+            self._num_dropped_texts += 1
+            raise OrcaBufferFullError("Text queue holds %d chunks already." % self._queue.maxsize)
+
+        self._max_num_pending_texts = max(self._max_num_pending_texts, self._queue.qsize())
+
+    def flush(self) -> None:
+        """Ends the current utterance. Use `.wait_delivered()` to wait until its audio has reached the sink."""
+
+        self._check_state()
+        with self._condition:
+            self._num_flushes += 1
+        self._queue.put(_FLUSH)
+
+    def wait_delivered(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the audio of every utterance flushed so far has been consumed by the sink.
+
+        :param timeout: Maximum number of seconds to wait. Waits indefinitely if not set.
+        :return: `True` if all flushed audio has been delivered, `False` if the timeout expired.
+        """
+
+        with self._condition:
+            num_flushes = self._num_flushes
+            is_delivered = self._condition.wait_for(
+                lambda: self._num_flushes_delivered >= num_flushes or self._error is not None,
+                timeout=timeout)
+        self._raise_error()
+        return is_delivered
+
+    def cancel(self) -> float:
+        """
+        Drops all pending text and audio. Waits only for the call into Orca and the call into the sink that are in
+        flight, then replaces the stream with a new one. The session keeps accepting text afterwards. A sink that
+        blocks while its device plays (e.g. `PcmRingBuffer.write` without a timeout) should be cancelled first, e.g.
+        with `PcmRingBuffer.clear()`, so that its call returns right away.
+
+        :return: Number of seconds it took to cancel.
+        """
+
+        start = time.perf_counter()
+
+        self._check_state()
+        self._stop_workers()
+
+        self._stream_input.reset()
+        self._num_stalls += self._stream_input.num_stalls
+        self._num_stall_flushes += self._stream_input.num_stall_flushes
+        self._stream.close()
+        if self._standby_stream is not None:
+            self._stream, self._standby_stream = self._standby_stream, None
+            self._num_standby_hits += 1
+        else:
+            self._stream = self._orca.stream_open(speech_rate=self._speech_rate, random_state=self._random_state)
+            if self._use_standby_stream:
+                self._num_standby_misses += 1
+        self._stream_input = OrcaStreamInput(self._stream, stall_policy=self._stall_policy)
+        self._reset_state()
+        self._start_workers()
+
+        return time.perf_counter() - start
+
+    def close(self, drain: bool = True) -> None:
+        """
+        Stops the workers and closes the stream.
+
+        :param drain: If set, pending text is flushed and its audio is delivered to the sink first. Otherwise, it is
+        dropped.
+        """
+
+        if self._is_closed:
+            return
+
+        try:
+            if drain:
+                self.flush()
+                self.wait_delivered()
+        finally:
+            self._is_closed = True
+            self._stop_workers()
+            self._stream.close()
+            if self._standby_stream is not None:
+                self._standby_stream.close()
+                self._standby_stream = None
+
+    def __enter__(self) -> 'StreamingSession':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(drain=exc_type is None)
+
+    def _check_state(self) -> None:
+        if self._is_closed:
+            raise OrcaInvalidStateError("Streaming session has been closed.")
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        with self._condition:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _set_error(self, error: BaseException) -> None:
+        with self._condition:
+            if self._error is None:
+                self._error = error
+            self._condition.notify_all()
+
+    def _reset_state(self) -> None:
+        self._buffer.clear()
+        if self._jitter_buffer is not None:
+            self._jitter_buffer.reset()
+        self._num_utterance_chunks = 0
+        self._is_in_utterance = False
+        self._playback_gate = (0, 0.)
+        with self._condition:
+            self._flush_positions.clear()
+            self._num_flushes_delivered = self._num_flushes
+            self._condition.notify_all()
+
+    def _start_workers(self) -> None:
+        self._stop.clear()
+        self._synthesis_thread = threading.Thread(target=self._synthesize_loop, name="orca-session-synthesis")
+        self._delivery_thread = threading.Thread(target=self._deliver_loop, name="orca-session-delivery")
+        self._synthesis_thread.start()
+        self._delivery_thread.start()
+
+    def _stop_workers(self) -> None:
+        self._stop.set()
+        with self._queue.mutex:
+            self._queue.queue.clear()
+            self._queue.not_full.notify_all()
+        self._queue.put(_STOP)
+        self._buffer.clear()
+        self._audio_available.set()
+        self._synthesis_thread.join()
+        self._delivery_thread.join()
+        with self._condition:
+            self._num_flushes_delivered = self._num_flushes
+            self._condition.notify_all()
+
+    def _synthesize_loop(self) -> None:
+        timeout = None if self._stall_policy is None else self._stall_policy.window_sec
+        while True:
+            if self._use_standby_stream and self._standby_stream is None and self._queue.empty():
+                try:
+                    self._standby_stream = self._orca.stream_open(
+                        speech_rate=self._speech_rate,
+                        random_state=self._random_state)
+                except OrcaError:
+                    self._use_standby_stream = False
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except Empty:
+                item = _POLL
+            if item is _STOP:
+                break
+            if self._stop.is_set():
+                continue
+
+            if item is not _POLL and not self._is_in_utterance:
+                self._is_in_utterance = True
+                self._num_utterance_chunks = 0
+                self._playback_gate = (self._buffer.num_samples_written, math.inf)
+
+            start = time.perf_counter()
+            try:
+                if item is _POLL:
+                    pcm = self._stream_input.poll()
+                elif item is _FLUSH:
+                    pcm = self._stream_input.flush()
+                else:
+                    if self._jitter_buffer is not None:
+                        self._jitter_buffer.log_text()
+                    pcm = self._stream_input.synthesize(item)
+            except Exception as e:
+                self._set_error(e)
+                pcm = None
+            processing_sec = time.perf_counter() - start
+
+            if pcm is not None and len(pcm) > 0 and not self._stop.is_set():
+                self._write(pcm, processing_sec)
+            if item is _FLUSH:
+                self._end_utterance()
+
+    def _write(self, pcm: Sequence[int], processing_sec: float) -> None:
+        self._num_utterance_chunks += 1
+        delay_sec = 0.
+        if self._jitter_buffer is not None:
+            delay_sec = self._jitter_buffer.log_audio(num_samples=len(pcm), processing_sec=processing_sec)
+
+        if self._num_utterance_chunks == 1 and self._on_first_audio is not None:
+            self._on_first_audio(delay_sec)
+
+        position, time_start = self._playback_gate
+        if time_start == math.inf:
+            if self._num_start_chunks is not None:
+                if self._num_utterance_chunks > self._num_start_chunks:
+                    self._playback_gate = (position, time.perf_counter())
+            elif self._num_utterance_chunks == 1:
+                self._playback_gate = (position, time.perf_counter() + delay_sec)
+
+        try:
+            self._buffer.write(
+                pcm,
+                timeout=None if self._audio_overflow_policy is OrcaOverflowPolicy.BLOCK else 0.,
+                overflow_policy=self._audio_overflow_policy)
+        except OrcaBufferFullError as e:
+            self._set_error(e)
+        self._audio_available.set()
+
+    def _end_utterance(self) -> None:
+        self._buffer.finish()
+        if self._jitter_buffer is not None:
+            self._jitter_buffer.reset()
+
+        position, time_start = self._playback_gate
+        if time_start == math.inf:
+            self._playback_gate = (position, time.perf_counter())
+        self._is_in_utterance = False
+
+        with self._condition:
+            self._flush_positions.append(self._buffer.num_samples_written)
+        self._audio_available.set()
+
+    def _deliver_loop(self) -> None:
+        while not self._stop.is_set():
+            self._audio_available.clear()
+            # `_stop_workers()` may have set the event between the check above and the `clear()`.
+            if self._stop.is_set():
+                break
+
+            if len(self._flush_positions) > 0 and self._flush_positions[0] <= self._buffer.num_samples_consumed:
+                with self._condition:
+                    while len(self._flush_positions) > 0 and \
+                            self._flush_positions[0] <= self._buffer.num_samples_consumed:
+                        self._flush_positions.popleft()
+                        self._num_flushes_delivered += 1
+                    self._condition.notify_all()
+
+            position, time_start = self._playback_gate
+            now = time.perf_counter()
+            if self._buffer.num_samples_consumed >= position and now < time_start:
+                self._audio_available.wait(None if time_start == math.inf else time_start - now)
+                continue
+
+            pcm = self._buffer.peek()
+            if len(pcm) == 0:
+                self._audio_available.wait()
+                continue
+
+            try:
+                num_consumed = self._sink(pcm)
+            except Exception as e:
+                self._set_error(e)
+                num_consumed = None
+            if num_consumed is None:
+                num_consumed = len(pcm)
+
+            if num_consumed > 0:
+                self._buffer.advance(num_consumed)
+            else:
+                self._stop.wait(self._sink_retry_sec)
+
+
+__all__ = [
+    "StreamingSession",
+]
@@ -0,0 +1,157 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import multiprocessing
+import os
+import sys
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+from typing import (
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._orca import OrcaInvalidArgumentError
+
+_SAMPLE_SIZE = 2
+
+
+class SharedPcmRing:
+    """
+    Ring of fixed-size slots of 16-bit PCM in shared memory, for passing audio from worker processes to their parent
+    without pickling it.
+
+    A writer takes a free slot, copies up to `slot_num_samples` samples into it and sends only the `(slot, length)`
+    descriptor to the reader, e.g. over a `multiprocessing.Queue`. The reader copies the samples out and recycles the
+    slot with `.release()`. A writer that finds no free slot blocks until the reader recycles one, so a slow reader
+    applies backpressure to its writers instead of letting memory grow.
+
+    The ring is created by the parent and handed to worker processes as an argument when they are started.
+    """
+
+    def __init__(
+            self,
+            num_slots: int = 32,
+            slot_num_samples: int = 16384,
+            context: Optional[multiprocessing.context.BaseContext] = None) -> None:
+        """
+        Constructor.
+
+        :param num_slots: Number of slots.
+        :param slot_num_samples: Number of samples per slot.
+        :param context: Multiprocessing context used to create the queue of free slots. Defaults to the default
+        context.
+        """
+
+        if num_slots < 1:
+            raise OrcaInvalidArgumentError("`num_slots` should be a positive integer.")
+        if slot_num_samples < 1:
+            raise OrcaInvalidArgumentError("`slot_num_samples` should be a positive integer.")
+
+        if context is None:
+            context = multiprocessing.get_context()
+
+        self._num_slots = num_slots
+        self._slot_num_samples = slot_num_samples
+        self._memory = SharedMemory(create=True, size=num_slots * slot_num_samples * _SAMPLE_SIZE)
+        self._owner_pid = os.getpid()
+        self._free_slots = context.Queue()
+        for slot in range(num_slots):
+            self._free_slots.put(slot)
+
+    def __getstate__(self):
+        return self._num_slots, self._slot_num_samples, self._memory.name, self._owner_pid, self._free_slots
+
+    def __setstate__(self, state) -> None:
+        self._num_slots, self._slot_num_samples, name, self._owner_pid, self._free_slots = state
+        self._memory = SharedMemory(name=name)
+
+    @property
+    def num_slots(self) -> int:
+        """Number of slots."""
+
+        return self._num_slots
+
+    @property
+    def slot_num_samples(self) -> int:
+        """Number of samples per slot."""
+
+        return self._slot_num_samples
+
+    def write(self, pcm: Sequence[int], timeout: Optional[float] = None) -> Iterator[Tuple[int, int]]:
+        """
+        Writes audio into as many slots as needed. Slots are taken one at a time, so the reader can recycle the first
+        slots while later ones are written.
+
+        :param pcm: Audio as a sequence of 16-bit linearly-encoded integers.
+        :param timeout: Maximum number of seconds to wait for each free slot. Waits indefinitely if not set.
+        :return: An iterator over the `(slot, length)` descriptors of the written slots. Each slot is written when its
+        descriptor is requested.
+        """
+
+        samples = pcm if isinstance(pcm, array) and pcm.typecode == 'h' else array('h', pcm)
+        if sys.byteorder == 'big':
+            samples = array('h', samples)
+            samples.byteswap()
+        data = memoryview(samples).cast('B')
+
+        for start in range(0, len(samples), self._slot_num_samples):
+            length = min(self._slot_num_samples, len(samples) - start)
+            try:
+                slot = self._free_slots.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError("No free slot in shared PCM ring.")
+            offset = slot * self._slot_num_samples * _SAMPLE_SIZE
+            self._memory.buf[offset:offset + length * _SAMPLE_SIZE] = \
+                data[start * _SAMPLE_SIZE:(start + length) * _SAMPLE_SIZE]
+            yield slot, length
+
+    def read(self, slot: int, length: int, output: array) -> None:
+        """
+        Appends the samples of a slot to `output` and recycles the slot.
+
+        :param slot: Slot index from a descriptor.
+        :param length: Number of samples from a descriptor.
+        :param output: Array of type code `h` receiving the samples.
+        """
+
+        offset = slot * self._slot_num_samples * _SAMPLE_SIZE
+        start = len(output)
+        output.frombytes(self._memory.buf[offset:offset + length * _SAMPLE_SIZE])
+        if sys.byteorder == 'big':
+            chunk = output[start:]
+            chunk.byteswap()
+            output[start:] = chunk
+        self.release(slot)
+
+    def release(self, slot: int) -> None:
+        """
+        Recycles a slot without reading it.
+
+        :param slot: Slot index from a descriptor.
+        """
+
+        self._free_slots.put(slot)
+
+    def close(self) -> None:
+        """Detaches from the shared memory. The process that created the ring also frees it."""
+
+        self._memory.close()
+        if os.getpid() == self._owner_pid:
+            self._memory.unlink()
+
+
+__all__ = [
+    "SharedPcmRing",
+]
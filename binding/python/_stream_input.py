@@ -0,0 +1,246 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import codecs
+import time
+from typing import (
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ._orca import (
+    Orca,
+    OrcaInvalidArgumentError,
+)
+from ._segmenter import TextSegmenter
+
+
+def _is_high_surrogate(character: str) -> bool:
+    return "\ud800" <= character <= "\udbff"
+
+
+class StallPolicy:
+    """
+    Policy for flushing a stream early when its text source stalls, e.g. while an LLM is calling a tool.
+
+    A stall is detected when no text has arrived for `window_sec` seconds while text is buffered. The stream is only
+    flushed if the buffered text ends at a sentence or clause boundary, so that a pause in the middle of a phrase does
+    not break it apart.
+    """
+
+    DEFAULT_WINDOW_SEC = 0.5
+
+    def __init__(
+            self,
+            window_sec: float = DEFAULT_WINDOW_SEC,
+            boundary_characters: FrozenSet[str] = TextSegmenter.BOUNDARY_CHARACTERS) -> None:
+        """
+        Constructor.
+
+        :param window_sec: Number of seconds without new text after which the text source is considered stalled.
+        :param boundary_characters: Characters that end a sentence or clause. Trailing whitespace is ignored.
+        """
+
+        if window_sec <= 0:
+            raise OrcaInvalidArgumentError("`window_sec` should be a positive number.")
+
+        self.window_sec = window_sec
+        self.boundary_characters = frozenset(boundary_characters)
+
+
+class OrcaStreamInput:
+    """
+    Feeds an `Orca.OrcaStream` from a text source that may split characters, such as the raw bytes of LLM tokens.
+
+    Raw bytes are decoded incrementally, so a multi-byte UTF-8 sequence split across chunks is held back until it is
+    complete. A UTF-16 surrogate pair split across string deltas is held back the same way. Whole characters are then
+    coalesced with a `TextSegmenter` before they are passed to the stream, which reduces the number of calls into the
+    engine for languages that are streamed character by character, such as Japanese and Korean. The stream should be
+    opened without `Orca.Coalescing`, which would hold the text back a second time.
+    """
+
+    def __init__(
+            self,
+            stream: Orca.OrcaStream,
+            segmenter: Optional[TextSegmenter] = None,
+            stall_policy: Optional[StallPolicy] = None) -> None:
+        """
+        Constructor.
+
+        :param stream: Stream to feed.
+        :param segmenter: Segmenter used to coalesce the text. If not set, a `TextSegmenter` with default settings is
+        used.
+        :param stall_policy: If set, `.poll()` flushes the stream when the text source stalls at a sentence or clause
+        boundary.
+        """
+
+        self._stream = stream
+        self._segmenter = TextSegmenter() if segmenter is None else segmenter
+        self._stall_policy = stall_policy
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+        self._pending_surrogate = ""
+        self._num_calls = 0
+
+        self._time_last_text = 0.
+        self._last_character = ""
+        self._has_unflushed_text = False
+        self._is_stalled = False
+        self._num_stalls = 0
+        self._num_stall_flushes = 0
+
+    def synthesize(self, text: Union[str, bytes]) -> Optional[Sequence[int]]:
+        """
+        Adds a chunk of text to the stream.
+
+        :param text: Chunk of text, either as a string or as UTF-8 encoded bytes. Byte chunks may end in the middle
+        of a character.
+        :return: The generated audio as a sequence of 16-bit linearly-encoded integers, `None` if no audio chunk has
+        been produced.
+        """
+
+        text = self._decode(text)
+        if len(text) == 0:
+            return None
+
+        self._time_last_text = time.perf_counter()
+        self._is_stalled = False
+        self._has_unflushed_text = True
+        stripped = text.rstrip()
+        if len(stripped) > 0:
+            self._last_character = stripped[-1]
+
+        text = self._segmenter.add(text)
+        if text is None:
+            return None
+
+        self._num_calls += 1
+        return self._stream.synthesize(text)
+
+    def flush(self) -> Sequence[int]:
+        """
+        Passes all buffered text to the stream and generates audio for it.
+
+        :return: The generated audio as a sequence of 16-bit linearly-encoded integers.
+        """
+
+        try:
+            text = self._pending_surrogate + self._decoder.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            self.reset()
+            raise OrcaInvalidArgumentError("Text stream ended with an incomplete UTF-8 sequence: `%s`." % e)
+        finally:
+            self._pending_surrogate = ""
+
+        return self._flush(text)
+
+    def poll(self) -> Optional[Sequence[int]]:
+        """
+        Checks whether the text source has stalled according to the stall policy. Meant to be called periodically
+        while no text arrives, e.g. whenever waiting for the next text chunk times out after `window_sec` seconds.
+        If the source has stalled and the buffered text ends at a sentence or clause boundary, the stream is flushed.
+        Text added afterwards continues the same stream.
+
+        :return: The generated audio as a sequence of 16-bit linearly-encoded integers, `None` if the stream was not
+        flushed.
+        """
+
+        if self._stall_policy is None or not self._has_unflushed_text or self._is_stalled:
+            return None
+        if time.perf_counter() - self._time_last_text < self._stall_policy.window_sec:
+            return None
+
+        self._is_stalled = True
+        self._num_stalls += 1
+        if self._last_character not in self._stall_policy.boundary_characters:
+            return None
+
+        self._num_stall_flushes += 1
+        return self._flush("")
+
+    def reset(self) -> None:
+        """Discards text that has not been passed to the stream yet."""
+
+        self._decoder.reset()
+        self._pending_surrogate = ""
+        self._segmenter.reset()
+        self._has_unflushed_text = False
+        self._is_stalled = False
+
+    @property
+    def num_calls(self) -> int:
+        """Number of calls made to the stream."""
+
+        return self._num_calls
+
+    @property
+    def num_stalls(self) -> int:
+        """Number of times the text source stalled while text was buffered."""
+
+        return self._num_stalls
+
+    @property
+    def num_stall_flushes(self) -> int:
+        """Number of stalls that ended at a sentence or clause boundary and flushed the stream."""
+
+        return self._num_stall_flushes
+
+    def _flush(self, text: str) -> Sequence[int]:
+        pcm: List[int] = []
+
+        text = self._segmenter.add(text) if len(text) > 0 else None
+        for chunk in (text, self._segmenter.flush()):
+            if chunk is not None:
+                self._num_calls += 1
+                pcm_chunk = self._stream.synthesize(chunk)
+                if pcm_chunk is not None:
+                    pcm.extend(pcm_chunk)
+
+        self._num_calls += 1
+        pcm.extend(self._stream.flush())
+        self._has_unflushed_text = False
+
+        return pcm
+
+    def _decode(self, text: Union[str, bytes]) -> str:
+        if isinstance(text, (bytes, bytearray, memoryview)):
+            try:
+                text = self._decoder.decode(text)
+            except UnicodeDecodeError as e:
+                self._decoder.reset()
+                raise OrcaInvalidArgumentError("Invalid UTF-8 sequence in text stream: `%s`." % e)
+
+        if len(self._pending_surrogate) > 0:
+            text = self._pending_surrogate + text
+            self._pending_surrogate = ""
+
+        if len(text) > 0 and _is_high_surrogate(text[-1]):
+            self._pending_surrogate = text[-1]
+            text = text[:-1]
+
+        if not text.isascii():
+            try:
+                text.encode("utf-8")
+            except UnicodeEncodeError:
+                try:
+                    text = text.encode("utf-16", "surrogatepass").decode("utf-16")
+                except UnicodeDecodeError as e:
+                    raise OrcaInvalidArgumentError("Invalid UTF-16 surrogate in text stream: `%s`." % e)
+
+        return text
+
+
+__all__ = [
+    "OrcaStreamInput",
+    "StallPolicy",
+]
@@ -0,0 +1,359 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import json
+import os
+import platform
+import threading
+import time
+from collections import namedtuple
+from enum import Enum
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._orca import (
+    list_hardware_devices,
+    Orca,
+    OrcaInvalidArgumentError,
+)
+from ._util import (
+    _linux_machine,
+    _RASPBERRY_PI_MACHINES,
+    default_library_path,
+    default_model_path,
+)
+
+DEFAULT_TUNING_TEXT = \
+    "Orca converts a stream of text into a stream of audio. " \
+    "It starts speaking as soon as the first few words arrive, long before the last sentence has been written."
+
+
+class OrcaWorkload(Enum):
+    STREAMING = "streaming"
+    BATCH = "batch"
+
+
+OrcaTuning = namedtuple(
+    'OrcaTuning',
+    ['workload', 'device', 'num_instances', 'first_audio_sec', 'real_time_factor'])
+
+
+def _host_machine() -> str:
+    if platform.system() == "Linux":
+        try:
+            return _linux_machine()
+        except (NotImplementedError, RuntimeError):
+            pass
+    return platform.machine().lower()
+
+
+def _num_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _host_key(model_path: str) -> str:
+    # The key counts all cores of the host rather than those the calling thread may run on, so that threads pinned to a
+    # subset of the cores (e.g. workers of a pool) find the configuration tuned for the host.
+    return "%s/%s/%s/%d/%s" % (
+        platform.node(),
+        platform.system().lower(),
+        _host_machine(),
+        os.cpu_count() or 1,
+        os.path.basename(model_path))
+
+
+def default_tuning_cache_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home is None:
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pvorca", "tuning.json")
+
+
+def _powers_of_two(maximum: int) -> List[int]:
+    values = []
+    value = 1
+    while value < maximum:
+        values.append(value)
+        value *= 2
+    values.append(maximum)
+    return values
+
+
+def _candidates(
+        devices: Sequence[str],
+        num_cores: int,
+        max_num_instances: int) -> List[Tuple[str, int]]:
+    candidates = []
+    for device in devices:
+        if device.split(":")[0] == "cpu":
+            for num_threads in _powers_of_two(num_cores):
+                for num_instances in _powers_of_two(min(num_cores // num_threads, max_num_instances)):
+                    candidates.append(("cpu:%d" % num_threads, num_instances))
+        else:
+            for num_instances in _powers_of_two(max_num_instances):
+                candidates.append((device, num_instances))
+    return candidates
+
+
+def _measure_stream(orca: Orca, words: Sequence[str]) -> Tuple[float, int]:
+    stream = orca.stream_open()
+    try:
+        start = time.perf_counter()
+        first_audio_sec = None
+        num_samples = 0
+        for word in words:
+            pcm = stream.synthesize(word)
+            if pcm is not None:
+                if first_audio_sec is None:
+                    first_audio_sec = time.perf_counter() - start
+                num_samples += len(pcm)
+        pcm = stream.flush()
+        if first_audio_sec is None:
+            first_audio_sec = time.perf_counter() - start
+        num_samples += len(pcm)
+    finally:
+        stream.close()
+
+    return first_audio_sec, num_samples
+
+
+def _measure(
+        orca_factory: Callable[[str], Orca],
+        workload: OrcaWorkload,
+        device: str,
+        num_instances: int,
+        text: str,
+        num_iterations: int) -> OrcaTuning:
+    words = [word + " " for word in text.split()]
+    first_audio_secs = []
+    num_samples = [0] * num_instances
+    errors = []
+    barrier = threading.Barrier(num_instances + 1)
+
+    def run(index: int) -> None:
+        orca = orcas[index]
+        try:
+            _measure_stream(orca, words)
+            barrier.wait()
+            for _ in range(num_iterations):
+                if workload is OrcaWorkload.STREAMING:
+                    first_audio_sec, num_samples_iteration = _measure_stream(orca, words)
+                    first_audio_secs.append(first_audio_sec)
+                else:
+                    pcm, _ = orca.synthesize(text)
+                    num_samples_iteration = len(pcm)
+                num_samples[index] += num_samples_iteration
+        except Exception as e:
+            errors.append(e)
+            barrier.abort()
+
+    orcas = []
+    try:
+        for _ in range(num_instances):
+            orcas.append(orca_factory(device))
+        sample_rate = orcas[0].sample_rate
+
+        threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(num_instances)]
+        for thread in threads:
+            thread.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        num_seconds = time.perf_counter() - start
+    finally:
+        for orca in orcas:
+            orca.delete()
+
+    if len(errors) > 0:
+        raise errors[0]
+
+    return OrcaTuning(
+        workload=workload,
+        device=device,
+        num_instances=num_instances,
+        first_audio_sec=sum(first_audio_secs) / len(first_audio_secs) if len(first_audio_secs) > 0 else None,
+        real_time_factor=sum(num_samples) / sample_rate / num_seconds)
+
+
+def _read_cache(cache_path: str) -> Dict:
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return dict()
+    return cache if isinstance(cache, dict) else dict()
+
+
+def _write_cache(cache_path: str, cache: Dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    temp_path = "%s.%d.tmp" % (cache_path, os.getpid())
+    with open(temp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(temp_path, cache_path)
+
+
+def load_tuning(
+        workload: Optional[OrcaWorkload] = None,
+        model_path: Optional[str] = None,
+        cache_path: Optional[str] = None) -> Optional[OrcaTuning]:
+    """
+    Loads the configuration saved by `tune()` for this host and model.
+
+    :param workload: Workload the configuration was tuned for. If not set, the most recently tuned configuration is
+    returned.
+    :param model_path: Absolute path to the file containing model parameters. If not set it will be set to the default
+    location.
+    :param cache_path: Path to the cache file. If not set, `default_tuning_cache_path()` is used.
+    :return: The saved configuration, `None` if this host and model have not been tuned.
+    """
+
+    if model_path is None:
+        model_path = default_model_path()
+    if cache_path is None:
+        cache_path = default_tuning_cache_path()
+
+    entries = _read_cache(cache_path).get(_host_key(model_path), dict())
+    if workload is None:
+        if len(entries) == 0:
+            return None
+        entry = max(entries.values(), key=lambda x: x.get("time", 0))
+    else:
+        entry = entries.get(workload.value)
+        if entry is None:
+            return None
+
+    try:
+        return OrcaTuning(
+            workload=OrcaWorkload(entry["workload"]),
+            device=entry["device"],
+            num_instances=entry["num_instances"],
+            first_audio_sec=entry["first_audio_sec"],
+            real_time_factor=entry["real_time_factor"])
+    except (KeyError, ValueError):
+        return None
+
+
+def tune(
+        access_key: str,
+        workload: OrcaWorkload = OrcaWorkload.STREAMING,
+        model_path: Optional[str] = None,
+        library_path: Optional[str] = None,
+        devices: Optional[Sequence[str]] = None,
+        max_num_instances: Optional[int] = None,
+        text: str = DEFAULT_TUNING_TEXT,
+        num_iterations: int = 3,
+        cache_path: Optional[str] = None,
+        orca_factory: Optional[Callable[[str], Orca]] = None,
+        on_result: Optional[Callable[[OrcaTuning], None]] = None) -> OrcaTuning:
+    """
+    Benchmarks devices, thread counts and numbers of instances on this host and saves the best configuration to a cache
+    file, from which `create()` picks the device when none is given.
+
+    Every device returned by `available_devices()` is tried. CPU devices are tried with 1, 2, 4, ... threads up to the
+    number of cores available to the process, each with as many instances as fit into the remaining cores (e.g. 4
+    instances of `cpu:2` on 8 cores). Raspberry Pi models are told apart by their CPU part, so a tuned Pi 4 and Pi 5 do
+    not share a configuration.
+
+    :param access_key: AccessKey obtained from Picovoice Console (https://console.picovoice.ai/)
+    :param workload: `OrcaWorkload.STREAMING` picks the configuration with the shortest time to first audio while all
+    instances stream, `OrcaWorkload.BATCH` the one with the highest total real-time factor while all instances
+    synthesize.
+    :param model_path: Absolute path to the file containing model parameters. If not set it will be set to the default
+    location.
+    :param library_path: Absolute path to Orca's dynamic library. If not set it will be set to the default location.
+    :param devices: Devices to try. If not set, all available devices are tried.
+    :param max_num_instances: Maximum number of instances to try. Defaults to the number of cores.
+    :param text: Text synthesized by each benchmark iteration.
+    :param num_iterations: Number of benchmark iterations per instance and configuration.
+    :param cache_path: Path to the cache file. If not set, `default_tuning_cache_path()` is used.
+    :param orca_factory: Function that creates an Orca instance for a device. Defaults to `Orca` with the given
+    AccessKey, model and library.
+    :param on_result: Called with the result of each configuration as it is measured.
+    :return: The best configuration.
+    """
+
+    if num_iterations < 1:
+        raise OrcaInvalidArgumentError("`num_iterations` should be a positive integer.")
+    if max_num_instances is not None and max_num_instances < 1:
+        raise OrcaInvalidArgumentError("`max_num_instances` should be a positive integer.")
+    if len(text.split()) == 0:
+        raise OrcaInvalidArgumentError("`text` should not be empty.")
+
+    if model_path is None:
+        model_path = default_model_path()
+    if library_path is None:
+        library_path = default_library_path()
+    if cache_path is None:
+        cache_path = default_tuning_cache_path()
+
+    num_cores = _num_cores()
+    if max_num_instances is None:
+        max_num_instances = num_cores
+
+    if devices is None:
+        devices = list_hardware_devices(library_path=library_path)
+        if _host_machine() in _RASPBERRY_PI_MACHINES:
+            devices = [device for device in devices if device.split(":")[0] == "cpu"]
+
+    if orca_factory is None:
+        def orca_factory(device: str) -> Orca:
+            return Orca(access_key=access_key, model_path=model_path, device=device, library_path=library_path)
+
+    candidates = _candidates(devices, num_cores, max_num_instances)
+    if len(candidates) == 0:
+        raise OrcaInvalidArgumentError("No devices to tune.")
+
+    best = None
+    for device, num_instances in candidates:
+        result = _measure(orca_factory, workload, device, num_instances, text, num_iterations)
+        if on_result is not None:
+            on_result(result)
+
+        if best is None:
+            best = result
+        elif workload is OrcaWorkload.STREAMING and result.first_audio_sec < best.first_audio_sec:
+            best = result
+        elif workload is OrcaWorkload.BATCH and result.real_time_factor > best.real_time_factor:
+            best = result
+
+    cache = _read_cache(cache_path)
+    cache.setdefault(_host_key(model_path), dict())[workload.value] = {
+        "workload": workload.value,
+        "device": best.device,
+        "num_instances": best.num_instances,
+        "first_audio_sec": best.first_audio_sec,
+        "real_time_factor": best.real_time_factor,
+        "time": time.time(),
+    }
+    _write_cache(cache_path, cache)
+
+    return best
+
+
+__all__ = [
+    "default_tuning_cache_path",
+    "load_tuning",
+    "OrcaTuning",
+    "OrcaWorkload",
+    "tune",
+]
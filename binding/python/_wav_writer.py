@@ -0,0 +1,174 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import (
+    Optional,
+    Sequence,
+)
+
+from ._orca import (
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+    OrcaIOError,
+)
+
+_HEADER_NUM_BYTES = 44
+_MAX_DATA_NUM_BYTES = 0xFFFFFFFF - (_HEADER_NUM_BYTES - 8)
+
+
+class OrcaWavWriter:
+    """
+    Writes the audio of an `Orca.OrcaStream` to a single-channel 16-bit PCM WAV file as it is generated.
+
+    Each chunk passed to `.write()` is appended to the file, so memory use does not grow with the length of the stream.
+    The sizes in the RIFF header are patched when the writer is closed, and whenever the file is synced, so that the file
+    written so far is playable even if the process ends before `.close()`. Set `fsync_interval_sec` to sync the file to
+    disk at that interval while writing; otherwise the file is only synced on close.
+
+    `.write()` can be passed directly as the sink of a `StreamingSession`. The writer is not thread-safe.
+    """
+
+    def __init__(self, path: str, sample_rate: int, fsync_interval_sec: Optional[float] = None) -> None:
+        """
+        Constructor.
+
+        :param path: Path of the WAV file. An existing file is overwritten.
+        :param sample_rate: Audio sample rate of the stream, `Orca.sample_rate`.
+        :param fsync_interval_sec: Number of seconds between syncs of the file to disk. If not set, the file is only
+        synced on close.
+        """
+
+        if sample_rate <= 0:
+            raise OrcaInvalidArgumentError("`sample_rate` should be a positive integer.")
+        if fsync_interval_sec is not None and fsync_interval_sec <= 0:
+            raise OrcaInvalidArgumentError("`fsync_interval_sec` should be a positive number.")
+
+        try:
+            self._file = open(path, "wb")
+        except OSError as e:
+            raise OrcaIOError("Could not open `%s` for writing: %s" % (path, e))
+
+        self._path = path
+        self._sample_rate = sample_rate
+        self._fsync_interval_sec = fsync_interval_sec
+        self._num_data_bytes = 0
+        self._time_last_sync = time.monotonic()
+        self._is_closed = False
+
+        self._file.write(self._header())
+
+    @property
+    def path(self) -> str:
+        """Path of the WAV file."""
+
+        return self._path
+
+    @property
+    def num_samples(self) -> int:
+        """Number of samples written so far."""
+
+        return self._num_data_bytes // 2
+
+    @property
+    def duration_sec(self) -> float:
+        """Duration of the audio written so far, in seconds."""
+
+        return self.num_samples / self._sample_rate
+
+    def write(self, pcm: Optional[Sequence[int]]) -> None:
+        """
+        Appends a chunk of audio to the file.
+
+        :param pcm: Chunk of 16-bit PCM, e.g. the return value of `Orca.OrcaStream.synthesize()` or `.flush()`. `None`
+        is ignored, so the return value of `.synthesize()` can be passed as is.
+        """
+
+        if self._is_closed:
+            raise OrcaInvalidStateError("WAV writer has been closed.")
+        if pcm is None or len(pcm) == 0:
+            return
+
+        samples = pcm if isinstance(pcm, array) and pcm.typecode == 'h' else array('h', pcm)
+        if sys.byteorder == "big":
+            samples = array('h', samples)
+            samples.byteswap()
+
+        num_bytes = len(samples) * 2
+        if self._num_data_bytes + num_bytes > _MAX_DATA_NUM_BYTES:
+            raise OrcaIOError("WAV files hold at most %d samples." % (_MAX_DATA_NUM_BYTES // 2))
+
+        self._file.write(samples.tobytes())
+        self._num_data_bytes += num_bytes
+
+        if self._fsync_interval_sec is not None and \
+                time.monotonic() - self._time_last_sync >= self._fsync_interval_sec:
+            self.sync()
+
+    def sync(self) -> None:
+        """Patches the header with the sizes written so far and syncs the file to disk."""
+
+        if self._is_closed:
+            raise OrcaInvalidStateError("WAV writer has been closed.")
+
+        self._patch_header()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._time_last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Patches the header, syncs the file to disk and closes it."""
+
+        if self._is_closed:
+            return
+
+        try:
+            self.sync()
+        finally:
+            self._is_closed = True
+            self._file.close()
+
+    def __enter__(self) -> 'OrcaWavWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _patch_header(self) -> None:
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.seek(0, os.SEEK_END)
+
+    def _header(self) -> bytes:
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            _HEADER_NUM_BYTES - 8 + self._num_data_bytes,
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,
+            1,
+            self._sample_rate,
+            self._sample_rate * 2,
+            2,
+            16,
+            b"data",
+            self._num_data_bytes)
+
+
+__all__ = [
+    "OrcaWavWriter",
+]
@@ -0,0 +1,279 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+"""
+Orca daemon serving an `OrcaPool` over a Unix domain socket. Processes on the same host connect with
+`pvorca.OrcaClient`, which mirrors the API of `Orca`, so that forked workers share the engines of one daemon.
+
+Run with `python -m pvorca.daemon --access_key ${ACCESS_KEY}`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from typing import (
+    Dict,
+    Optional,
+    Sequence,
+)
+
+from ._client import (
+    default_socket_path,
+    _HEADER,
+    _MessageType,
+    _NUM_SAMPLES,
+    _PATH_LENGTH,
+    _decode_params,
+    _encode_alignments,
+    _encode_error,
+    _encode_pcm,
+)
+from ._factory import create
+from ._orca import (
+    OrcaInvalidArgumentError,
+    OrcaInvalidStateError,
+    OrcaIOError,
+)
+from ._pool import (
+    OrcaPool,
+    OrcaPriority,
+    OrcaScheduling,
+)
+from ._tune import (
+    load_tuning,
+    OrcaWorkload,
+)
+
+
+def _discard_audio(_: Sequence[int]) -> None:
+    pass
+
+
+def _make_private_dir(directory: str) -> None:
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.stat(directory)
+    if (hasattr(os, "getuid") and info.st_uid != os.getuid()) or info.st_mode & 0o077 != 0:
+        raise OrcaIOError(
+            "Socket directory `%s` should be owned by and only accessible to the current user." % directory)
+
+
+class OrcaDaemon:
+    """
+    Serves the requests of `OrcaClient` instances from an `OrcaPool`. Each connection may open several streams; its
+    requests are answered in order. A request larger than `max_message_size` is answered with an error and its
+    connection is closed without reading the payload.
+    """
+
+    DEFAULT_MAX_MESSAGE_SIZE = 1024 * 1024
+
+    def __init__(
+            self,
+            pool: OrcaPool,
+            max_streams_per_connection: int = 16,
+            max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+            output_dir: Optional[str] = None) -> None:
+        """
+        Constructor.
+
+        :param pool: Pool serving the requests. The daemon does not take ownership of it.
+        :param max_streams_per_connection: Maximum number of streams a connection may keep open.
+        :param max_message_size: Maximum number of payload bytes of a request.
+        :param output_dir: Directory `OrcaClient.synthesize_to_file()` writes to. Output paths are resolved relative to
+        it and rejected if they point outside of it. If not set, the daemon does not write files.
+        """
+
+        if max_streams_per_connection < 1:
+            raise OrcaInvalidArgumentError("`max_streams_per_connection` should be a positive integer.")
+        if max_message_size < 1:
+            raise OrcaInvalidArgumentError("`max_message_size` should be a positive integer.")
+
+        self._pool = pool
+        self._max_streams_per_connection = max_streams_per_connection
+        self._max_message_size = max_message_size
+        self._output_dir = None if output_dir is None else os.path.realpath(output_dir)
+        self._info = json.dumps({
+            "sample_rate": pool.sample_rate,
+            "max_character_limit": pool.max_character_limit,
+            "valid_characters": sorted(pool.valid_characters),
+            "version": pool.version,
+        }).encode("utf-8")
+
+    async def serve(self, socket_path: Optional[str] = None) -> None:
+        """
+        Serves until cancelled. The socket file is replaced if it exists and removed on exit.
+
+        :param socket_path: Path of the Unix domain socket. Defaults to `default_socket_path()`, whose directory is
+        created if needed and has to be owned by and only accessible to the current user.
+        """
+
+        if socket_path is None:
+            socket_path = default_socket_path()
+            _make_private_dir(os.path.dirname(socket_path))
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = await asyncio.start_unix_server(self._handle_connection, path=socket_path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        streams: Dict[int, OrcaPool.Session] = dict()
+        try:
+            while True:
+                message_type, stream_id, length = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+                if length > self._max_message_size:
+                    reply = _encode_error(OrcaInvalidArgumentError(
+                        "Message of %d bytes exceeds the limit of %d bytes." % (length, self._max_message_size)))
+                    writer.write(_HEADER.pack(_MessageType.ERROR, stream_id, len(reply)) + reply)
+                    await writer.drain()
+                    break
+                payload = await reader.readexactly(length)
+                try:
+                    reply_type, reply = _MessageType.OK, await self._dispatch(message_type, stream_id, payload, streams)
+                except Exception as e:
+                    reply_type, reply = _MessageType.ERROR, _encode_error(e)
+                writer.write(_HEADER.pack(reply_type, stream_id, len(reply)) + reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for session in streams.values():
+                session.close()
+            writer.close()
+
+    async def _dispatch(
+            self,
+            message_type: int,
+            stream_id: int,
+            payload: bytes,
+            streams: Dict[int, OrcaPool.Session]) -> bytes:
+        if message_type == _MessageType.INFO:
+            return self._info
+
+        if message_type == _MessageType.SYNTHESIZE:
+            speech_rate, random_state, text = _decode_params(payload)
+            pcm, alignments = await asyncio.wrap_future(self._pool.synthesize(
+                text.decode("utf-8"),
+                speech_rate=speech_rate,
+                random_state=random_state,
+                priority=OrcaPriority.INTERACTIVE))
+            return _NUM_SAMPLES.pack(len(pcm)) + _encode_pcm(pcm) + _encode_alignments(alignments)
+
+        if message_type == _MessageType.SYNTHESIZE_TO_FILE:
+            if self._output_dir is None:
+                raise OrcaInvalidStateError("Daemon does not write files. Start it with an output directory.")
+            speech_rate, random_state, rest = _decode_params(payload)
+            path_length, = _PATH_LENGTH.unpack_from(rest)
+            path_end = _PATH_LENGTH.size + path_length
+            output_path = rest[_PATH_LENGTH.size:path_end].decode("utf-8")
+            output_path = os.path.realpath(os.path.join(self._output_dir, output_path))
+            if os.path.commonpath([self._output_dir, output_path]) != self._output_dir:
+                raise OrcaInvalidArgumentError("`output_path` should be within the output directory of the daemon.")
+            alignments = await asyncio.wrap_future(self._pool.synthesize_to_file(
+                rest[path_end:].decode("utf-8"),
+                output_path,
+                speech_rate=speech_rate,
+                random_state=random_state))
+            return _encode_alignments(alignments)
+
+        if message_type == _MessageType.STREAM_OPEN:
+            if stream_id in streams:
+                raise OrcaInvalidStateError("Stream `%d` is already open." % stream_id)
+            if len(streams) >= self._max_streams_per_connection:
+                raise OrcaInvalidStateError("Too many open streams.")
+            speech_rate, random_state, _ = _decode_params(payload)
+            streams[stream_id] = self._pool.open_session(
+                speech_rate=speech_rate,
+                random_state=random_state,
+                on_audio=_discard_audio)
+            return b""
+
+        session = streams.get(stream_id)
+        if session is None:
+            raise OrcaInvalidStateError("Stream `%d` is not open." % stream_id)
+
+        if message_type == _MessageType.STREAM_SYNTHESIZE:
+            return _encode_pcm(await asyncio.wrap_future(session.synthesize(payload.decode("utf-8"))))
+        if message_type == _MessageType.STREAM_FLUSH:
+            return _encode_pcm(await asyncio.wrap_future(session.flush()))
+        if message_type == _MessageType.STREAM_CLOSE:
+            streams.pop(stream_id).close()
+            return b""
+
+        raise OrcaInvalidArgumentError("Unknown message type `%d`." % message_type)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--access_key',
+        required=True,
+        help='AccessKey obtained from Picovoice Console (https://console.picovoice.ai/)')
+    parser.add_argument(
+        '--model_path',
+        help='Absolute path to the model parameter file')
+    parser.add_argument(
+        '--device',
+        help='Device to run inference on (`best`, `cpu:{num_threads}` or `gpu:{gpu_index}`)')
+    parser.add_argument(
+        '--library_path',
+        help='Absolute path to dynamic library')
+    parser.add_argument(
+        '--socket_path',
+        help='Path of the Unix domain socket. Default: `pvorca.sock` in `$XDG_RUNTIME_DIR`, or in a per-user directory '
+             'of the temporary directory')
+    parser.add_argument(
+        '--output_dir',
+        help='Directory clients may write audio files to. Default: clients may not write files')
+    parser.add_argument(
+        '--num_instances',
+        type=int,
+        help='Number of Orca instances serving requests. Default: the number saved by `pvorca.tune()` for this host, '
+             'or 2')
+    parser.add_argument(
+        '--scheduling',
+        choices=[s.value for s in OrcaScheduling],
+        default=OrcaScheduling.DEADLINE.value,
+        help='Policy for picking the next request on an instance')
+    args = parser.parse_args()
+
+    num_instances = args.num_instances
+    if num_instances is None:
+        tuning = load_tuning(workload=OrcaWorkload.STREAMING, model_path=args.model_path)
+        num_instances = tuning.num_instances if tuning is not None else 2
+
+    pool = OrcaPool(
+        orca_factory=lambda: create(
+            access_key=args.access_key,
+            model_path=args.model_path,
+            device=args.device,
+            library_path=args.library_path),
+        num_instances=num_instances,
+        scheduling=OrcaScheduling(args.scheduling))
+    daemon = OrcaDaemon(pool, output_dir=args.output_dir)
+
+    socket_path = args.socket_path if args.socket_path is not None else default_socket_path()
+    print("Listening on %s (press Ctrl+C to stop)" % socket_path)
+    try:
+        asyncio.run(daemon.serve(socket_path=args.socket_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.delete()
+
+
+if __name__ == '__main__':
+    main()
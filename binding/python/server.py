@@ -0,0 +1,551 @@
+#
+# Copyright 2026 Picovoice Inc.
+#
+# You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+# file accompanying this source.
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+#
+
+"""
+HTTP and WebSocket server for Orca, built on `asyncio` and an `OrcaPool`.
+
+Endpoints:
+
+- `POST /synthesize`: The body is a JSON object with `text` and optionally `speech_rate`, `random_state` and `format`.
+  `format` is `wav` (default) or `pcm` (raw 16-bit little-endian samples) to return audio, or `json` to return an
+  object with `sample_rate`, base64-encoded WAV `audio` and word `alignments`.
+- `GET /stream`: WebSocket endpoint. The client sends text messages holding JSON objects, either `{"text": ...}` with a
+  text delta or `{"flush": true}`. The server pushes binary messages with raw PCM as soon as Orca produces it and a text
+  message `{"event": "flushed"}` once the audio of a flush has been sent. Query parameters `speech_rate` and
+  `random_state` configure the stream.
+- `GET /health`: Pool statistics as JSON.
+
+Run with `python -m pvorca.server --access_key ${ACCESS_KEY}`. The server listens on localhost by default.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import struct
+import sys
+import wave
+from array import array
+from concurrent.futures import Future
+from typing import (
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+from ._factory import create
+from ._orca import (
+    Orca,
+    OrcaError,
+    OrcaInvalidArgumentError,
+)
+from ._pool import (
+    OrcaPool,
+    OrcaPriority,
+    OrcaScheduling,
+)
+from ._tune import (
+    load_tuning,
+    OrcaWorkload,
+)
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OPCODE_CONTINUATION = 0x0
+_OPCODE_TEXT = 0x1
+_OPCODE_BINARY = 0x2
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _pcm_to_bytes(pcm: Sequence[int]) -> bytes:
+    samples = array('h', pcm)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _pcm_to_wav(pcm: Sequence[int], sample_rate: int) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(_pcm_to_bytes(pcm))
+    return output.getvalue()
+
+
+def _alignments_to_json(alignments: Sequence[Orca.WordAlignment]) -> list:
+    return [{
+        "word": word.word,
+        "start_sec": word.start_sec,
+        "end_sec": word.end_sec,
+        "phonemes": [{
+            "phoneme": phoneme.phoneme,
+            "start_sec": phoneme.start_sec,
+            "end_sec": phoneme.end_sec,
+        } for phoneme in word.phonemes],
+    } for word in alignments]
+
+
+def _get_synthesize_params(params: Dict) -> Tuple[Optional[float], Optional[int]]:
+    try:
+        speech_rate = None if params.get("speech_rate") is None else float(params["speech_rate"])
+        random_state = None if params.get("random_state") is None else int(params["random_state"])
+    except (TypeError, ValueError):
+        raise _HTTPError(400, "`speech_rate` should be a number and `random_state` an integer.")
+    return speech_rate, random_state
+
+
+class OrcaServer:
+    """
+    Serves single synthesis over HTTP and streaming synthesis over WebSocket from an `OrcaPool`.
+
+    Connections are kept alive between requests. At most `max_concurrency` synthesis requests and streams are in
+    progress at a time, further requests are rejected with status 503. A stream stops reading client messages while it
+    has `max_pending_requests` requests queued in the pool or as many messages waiting to be sent, and audio is only
+    sent as fast as the client reads it, so the memory held by a slow client is bounded.
+    """
+
+    MAX_HEADER_SIZE = 16 * 1024
+    MAX_BODY_SIZE = 1024 * 1024
+    MAX_MESSAGE_SIZE = 64 * 1024
+
+    def __init__(self, pool: OrcaPool, max_concurrency: int = 64, max_pending_requests: int = 16) -> None:
+        """
+        Constructor.
+
+        :param pool: Pool serving the requests. The server does not take ownership of it.
+        :param max_concurrency: Maximum number of synthesis requests and streams in progress at a time.
+        :param max_pending_requests: Maximum number of requests of a stream queued in the pool.
+        """
+
+        if max_concurrency < 1:
+            raise OrcaInvalidArgumentError("`max_concurrency` should be a positive integer.")
+        if max_pending_requests < 1:
+            raise OrcaInvalidArgumentError("`max_pending_requests` should be a positive integer.")
+
+        self._pool = pool
+        self._max_concurrency = max_concurrency
+        self._max_pending_requests = max_pending_requests
+        self._num_active = 0
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """
+        Serves until cancelled.
+
+        :param host: Address to listen on.
+        :param port: Port to listen on.
+        """
+
+        server = await asyncio.start_server(self._handle_connection, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except _HTTPError as e:
+                    await self._send_error(writer, e, keep_alive=False)
+                    break
+                if request is None:
+                    break
+
+                method, target, headers, body = request
+                path = urlsplit(target).path
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    if path == "/stream" and headers.get("upgrade", "").lower() == "websocket":
+                        await self._handle_websocket(reader, writer, target, headers)
+                        break
+                    await self._handle_http(writer, method, path, body, keep_alive)
+                except _HTTPError as e:
+                    await self._send_error(writer, e, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(413, "Request header is too large.")
+        if len(head) > self.MAX_HEADER_SIZE:
+            raise _HTTPError(413, "Request header is too large.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line.")
+
+        headers = dict()
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise _HTTPError(411, "Chunked request bodies are not supported.")
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise _HTTPError(400, "Invalid `Content-Length`.")
+        if content_length > self.MAX_BODY_SIZE:
+            raise _HTTPError(413, "Request body is too large.")
+        body = await reader.readexactly(content_length) if content_length > 0 else b""
+
+        return method, target, headers, body
+
+    async def _handle_http(
+            self,
+            writer: asyncio.StreamWriter,
+            method: str,
+            path: str,
+            body: bytes,
+            keep_alive: bool) -> None:
+        if path == "/health":
+            histograms = self._pool.latency_histograms
+            await self._send_response(writer, 200, "application/json", json.dumps({
+                "num_instances": self._pool.num_instances,
+                "num_active_sessions": self._pool.num_active_sessions,
+                "num_active_requests": self._num_active,
+                "wait_sec_p50": {p.value: h.percentile(50) for p, h in histograms.items()},
+                "wait_sec_p99": {p.value: h.percentile(99) for p, h in histograms.items()},
+            }).encode("utf-8"), keep_alive)
+            return
+
+        if path != "/synthesize":
+            raise _HTTPError(404, "Unknown path `%s`." % path)
+        if method != "POST":
+            raise _HTTPError(405, "Use POST.")
+
+        try:
+            params = json.loads(body.decode("utf-8"))
+            text = params["text"]
+        except (ValueError, KeyError, TypeError):
+            raise _HTTPError(400, "Body should be a JSON object with a `text` field.")
+        if not isinstance(text, str):
+            raise _HTTPError(400, "`text` should be a string.")
+        response_format = params.get("format", "wav")
+        if response_format not in ("wav", "pcm", "json"):
+            raise _HTTPError(400, "`format` should be `wav`, `pcm` or `json`.")
+        speech_rate, random_state = _get_synthesize_params(params)
+
+        with self._acquire():
+            future = self._pool.synthesize(
+                text,
+                speech_rate=speech_rate,
+                random_state=random_state,
+                priority=OrcaPriority.INTERACTIVE)
+            try:
+                pcm, alignments = await asyncio.wrap_future(future)
+            except OrcaError as e:
+                raise _HTTPError(400, str(e))
+
+        sample_rate = self._pool.sample_rate
+        if response_format == "pcm":
+            content_type = "audio/L16; rate=%d; channels=1" % sample_rate
+            content = _pcm_to_bytes(pcm)
+        elif response_format == "wav":
+            content_type = "audio/wav"
+            content = _pcm_to_wav(pcm, sample_rate)
+        else:
+            content_type = "application/json"
+            content = json.dumps({
+                "sample_rate": sample_rate,
+                "audio": base64.b64encode(_pcm_to_wav(pcm, sample_rate)).decode("ascii"),
+                "alignments": _alignments_to_json(alignments),
+            }).encode("utf-8")
+
+        await self._send_response(writer, 200, content_type, content, keep_alive)
+
+    async def _handle_websocket(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            target: str,
+            headers: Dict[str, str]) -> None:
+        key = headers.get("sec-websocket-key")
+        if key is None:
+            raise _HTTPError(400, "Missing `Sec-WebSocket-Key`.")
+        query = {k: v[-1] for k, v in parse_qs(urlsplit(target).query).items()}
+        speech_rate, random_state = _get_synthesize_params(query)
+
+        with self._acquire():
+            accept = base64.b64encode(hashlib.sha1((key + _WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+            writer.write((
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                "Sec-WebSocket-Accept: %s\r\n\r\n" % accept).encode("latin-1"))
+            await writer.drain()
+
+            loop = asyncio.get_running_loop()
+            # Each request queues at most two messages (audio and `flushed`), so reading client messages only while
+            # fewer than `max_pending_requests` requests and messages are pending keeps the queue below this size.
+            outgoing: asyncio.Queue = asyncio.Queue(maxsize=3 * self._max_pending_requests + 5)
+            progress = asyncio.Event()
+            session = self._pool.open_session(
+                speech_rate=speech_rate,
+                random_state=random_state,
+                on_audio=lambda pcm: loop.call_soon_threadsafe(outgoing.put_nowait, _pcm_to_bytes(pcm)))
+            sender = asyncio.ensure_future(self._send_websocket_audio(writer, outgoing, progress))
+            try:
+                await self._receive_websocket_messages(reader, writer, session, outgoing, progress)
+            finally:
+                session.close()
+                sender.cancel()
+
+    async def _receive_websocket_messages(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            session: OrcaPool.Session,
+            outgoing: asyncio.Queue,
+            progress: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+
+        def on_done(_: Future) -> None:
+            loop.call_soon_threadsafe(progress.set)
+
+        while True:
+            opcode, payload = await self._read_websocket_message(reader)
+            if opcode == _OPCODE_CLOSE:
+                self._write_websocket_frame(writer, _OPCODE_CLOSE, payload[:2])
+                await writer.drain()
+                return
+            if opcode == _OPCODE_PING:
+                self._write_websocket_frame(writer, _OPCODE_PONG, payload)
+                continue
+            if opcode != _OPCODE_TEXT:
+                continue
+
+            try:
+                message = json.loads(payload.decode("utf-8"))
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                await outgoing.put(json.dumps({"event": "error", "message": "Messages should be JSON objects."}))
+                continue
+
+            while True:
+                progress.clear()
+                if session.num_pending < self._max_pending_requests and \
+                        outgoing.qsize() < self._max_pending_requests:
+                    break
+                await progress.wait()
+            try:
+                if isinstance(message.get("text"), str):
+                    session.synthesize(message["text"]).add_done_callback(on_done)
+                if message.get("flush"):
+                    future = session.flush()
+                    future.add_done_callback(
+                        lambda _: loop.call_soon_threadsafe(outgoing.put_nowait, json.dumps({"event": "flushed"})))
+                    future.add_done_callback(on_done)
+            except OrcaError as e:
+                await outgoing.put(json.dumps({"event": "error", "message": str(e)}))
+
+    async def _send_websocket_audio(
+            self,
+            writer: asyncio.StreamWriter,
+            outgoing: asyncio.Queue,
+            progress: asyncio.Event) -> None:
+        while True:
+            item = await outgoing.get()
+            progress.set()
+            if isinstance(item, str):
+                self._write_websocket_frame(writer, _OPCODE_TEXT, item.encode("utf-8"))
+            else:
+                self._write_websocket_frame(writer, _OPCODE_BINARY, item)
+            await writer.drain()
+
+    async def _read_websocket_message(self, reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+        message_opcode = None
+        fragments = []
+        size = 0
+        while True:
+            first, second = await reader.readexactly(2)
+            is_final = (first & 0x80) != 0
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await reader.readexactly(8))[0]
+            if (second & 0x80) == 0:
+                raise ConnectionError("Client frames should be masked.")
+            mask = await reader.readexactly(4)
+            size += length
+            if size > self.MAX_MESSAGE_SIZE:
+                raise ConnectionError("WebSocket message is too large.")
+            payload = bytearray(await reader.readexactly(length))
+            for i in range(length):
+                payload[i] ^= mask[i % 4]
+
+            if opcode >= _OPCODE_CLOSE:
+                return opcode, bytes(payload)
+            if opcode != _OPCODE_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(bytes(payload))
+            if is_final:
+                return message_opcode, b"".join(fragments)
+
+    @staticmethod
+    def _write_websocket_frame(writer: asyncio.StreamWriter, opcode: int, payload: bytes) -> None:
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < (1 << 16):
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        writer.write(header + payload)
+
+    @staticmethod
+    async def _send_response(
+            writer: asyncio.StreamWriter,
+            status: int,
+            content_type: str,
+            content: bytes,
+            keep_alive: bool) -> None:
+        writer.write((
+            "HTTP/1.1 %d %s\r\n"
+            "Content-Type: %s\r\n"
+            "Content-Length: %d\r\n"
+            "Connection: %s\r\n\r\n" % (
+                status,
+                _REASONS.get(status, ""),
+                content_type,
+                len(content),
+                "keep-alive" if keep_alive else "close")).encode("latin-1") + content)
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, error: _HTTPError, keep_alive: bool) -> None:
+        content = json.dumps({"error": str(error)}).encode("utf-8")
+        await self._send_response(writer, error.status, "application/json", content, keep_alive)
+
+    def _acquire(self) -> '_Slot':
+        if self._num_active >= self._max_concurrency:
+            raise _HTTPError(503, "Server is at capacity.")
+        return _Slot(self)
+
+
+class _Slot:
+    def __init__(self, server: OrcaServer) -> None:
+        self._server = server
+
+    def __enter__(self) -> '_Slot':
+        self._server._num_active += 1
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._server._num_active -= 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--access_key',
+        required=True,
+        help='AccessKey obtained from Picovoice Console (https://console.picovoice.ai/)')
+    parser.add_argument(
+        '--model_path',
+        help='Absolute path to the model parameter file')
+    parser.add_argument(
+        '--device',
+        help='Device to run inference on (`best`, `cpu:{num_threads}` or `gpu:{gpu_index}`)')
+    parser.add_argument(
+        '--library_path',
+        help='Absolute path to dynamic library')
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen on')
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8080,
+        help='Port to listen on')
+    parser.add_argument(
+        '--num_instances',
+        type=int,
+        help='Number of Orca instances serving requests. Default: the number saved by `pvorca.tune()` for this host, '
+             'or 2')
+    parser.add_argument(
+        '--scheduling',
+        choices=[s.value for s in OrcaScheduling],
+        default=OrcaScheduling.DEADLINE.value,
+        help='Policy for picking the next request on an instance')
+    parser.add_argument(
+        '--max_concurrency',
+        type=int,
+        default=64,
+        help='Maximum number of synthesis requests and streams in progress at a time')
+    args = parser.parse_args()
+
+    num_instances = args.num_instances
+    if num_instances is None:
+        tuning = load_tuning(workload=OrcaWorkload.STREAMING, model_path=args.model_path)
+        num_instances = tuning.num_instances if tuning is not None else 2
+
+    pool = OrcaPool(
+        orca_factory=lambda: create(
+            access_key=args.access_key,
+            model_path=args.model_path,
+            device=args.device,
+            library_path=args.library_path),
+        num_instances=num_instances,
+        scheduling=OrcaScheduling(args.scheduling))
+    server = OrcaServer(pool, max_concurrency=args.max_concurrency)
+
+    print("Listening on http://%s:%d (press Ctrl+C to stop)" % (args.host, args.port))
+    try:
+        asyncio.run(server.serve(host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.delete()
+
+
+if __name__ == '__main__':
+    main()
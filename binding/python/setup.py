@@ -14,7 +14,28 @@ import shutil
 
 import setuptools
 
-INCLUDE_FILES = ('../../LICENSE', '__init__.py', '_factory.py', '_orca.py', '_util.py')
+INCLUDE_FILES = (
+    '../../LICENSE',
+    '__init__.py',
+    '_affinity.py',
+    '_client.py',
+    '_factory.py',
+    '_fake.py',
+    '_jitter_buffer.py',
+    '_long_form.py',
+    '_orca.py',
+    '_pcm_buffer.py',
+    '_pool.py',
+    '_process_pool.py',
+    '_segmenter.py',
+    '_session.py',
+    '_shared_pcm.py',
+    '_stream_input.py',
+    '_tune.py',
+    '_util.py',
+    '_wav_writer.py',
+    'daemon.py',
+    'server.py')
 INCLUDE_LIBS = ('linux', 'mac', 'raspberry-pi', 'windows')
 DEFAULT_MODEL_FILE = 'orca_params_en_female.pv'
 
@@ -49,7 +70,7 @@ with open(os.path.join(os.path.dirname(__file__), 'README.md'), 'r') as f:
 
 setuptools.setup(
     name="pvorca",
-    version="3.1.0",
+    version="3.2.0",
     author="Picovoice",
     author_email="hello@picovoice.ai",
     description="Orca Streaming Text-to-Speech Engine",
@@ -18,9 +18,12 @@ import dataclasses
 from parameterized import parameterized
 from typing import List, Sequence
 
-from _orca import Orca, OrcaError, OrcaInvalidArgumentError
-from _util import default_library_path, default_model_path
-from test_util import get_platform_and_architecture, get_model_path, get_test_data, read_wav_file
+from test_util import get_platform_and_architecture, get_model_path, get_test_data, load_package, read_wav_file
+
+load_package()
+
+from pvorca import Orca, OrcaError, OrcaInvalidArgumentError, TextSegmenter
+from pvorca._util import default_library_path, default_model_path
 
 
 test_data = get_test_data()
@@ -194,6 +197,32 @@ class OrcaTestCase(unittest.TestCase):
                     self.assertTrue(phoneme.end_sec >= phoneme.start_sec)
                     previous_phoneme_end_sec = phoneme.end_sec
 
+    @parameterized.expand([(t.language, t.models, t.random_state, t.text) for t in test_data.sentence_tests])
+    def test_synthesize_progressive(
+            self,
+            language: str,
+            models: List[str],
+            random_state: int,
+            text: str):
+
+        for orca, model in OrcaTestCase._orca_iter(models):
+            _, alignments_single = orca.synthesize(text, random_state=random_state)
+
+            pcm = []
+            alignments = []
+            for pcm_segment, alignments_segment in orca.synthesize_progressive(
+                    text,
+                    random_state=random_state,
+                    first_segment_length=16):
+                self.assertGreater(len(pcm_segment), 0)
+                pcm.extend(pcm_segment)
+                alignments.extend(alignments_segment)
+
+            self.assertEqual([x.word for x in alignments], [x.word for x in alignments_single])
+            for previous, word in zip(alignments[:-1], alignments[1:]):
+                self.assertGreaterEqual(word.start_sec, previous.end_sec)
+            self.assertLessEqual(alignments[-1].end_sec, len(pcm) / orca.sample_rate + 1e-3)
+
     @parameterized.expand([(t.language, t.models, t.random_state, t.text) for t in test_data.sentence_tests])
     def test_streaming_synthesis(
             self,
@@ -221,6 +250,41 @@ class OrcaTestCase(unittest.TestCase):
 
             self._test_audio(pcm=pcm, ground_truth=ground_truth)
 
+    @parameterized.expand([(t.language, t.models, t.random_state, t.text) for t in test_data.sentence_tests])
+    def test_streaming_synthesis_segmented(
+            self,
+            language: str,
+            models: List[str],
+            random_state: int,
+            text: str):
+
+        for orca, model in OrcaTestCase._orca_iter(models):
+            stream = orca.stream_open(random_state=random_state)
+            segmenter = TextSegmenter()
+            pcm = []
+            for c in text:
+                text_chunk = segmenter.add(c)
+                if text_chunk is not None:
+                    pcm_chunk = stream.synthesize(text_chunk)
+                    if pcm_chunk is not None:
+                        pcm.extend(pcm_chunk)
+            text_chunk = segmenter.flush()
+            if text_chunk is not None:
+                pcm_chunk = stream.synthesize(text_chunk)
+                if pcm_chunk is not None:
+                    pcm.extend(pcm_chunk)
+            pcm_chunk = stream.flush()
+            if pcm_chunk is not None:
+                pcm.extend(pcm_chunk)
+            stream.close()
+
+            ground_truth = self._get_pcm(
+                model=model,
+                audio_data_folder=test_data.audio_data_folder,
+                synthesis_type="stream")
+
+            self._test_audio(pcm=pcm, ground_truth=ground_truth)
+
 
     @parameterized.expand([(t.language, t.models, t.random_state, t.text_custom_pronunciation) for t in test_data.sentence_tests])
     def test_synthesize_custom_pron(
@@ -0,0 +1,940 @@
+#
+#    Copyright 2026 Picovoice Inc.
+#
+#    You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+#    file accompanying this source.
+#
+#    Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#    an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#    specific language governing permissions and limitations under the License.
+#
+
+import asyncio
+import functools
+import http.client
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+import wave
+from array import array
+from time import perf_counter, sleep
+from typing import List, Optional
+from unittest import mock
+
+from test_util import load_package
+
+
+pvorca = load_package()
+
+TEXT = "Hello world, this is a {test|T EH S T} of the offline stand-in. It speaks, and it stops."
+PLAIN_TEXT = "Hello world, this is a test of the offline stand-in. It speaks, and it stops."
+
+
+def _stream(stream, text: str) -> List[int]:
+    pcm = []
+    for word in text.split(" "):
+        chunk = stream.synthesize(word + " ")
+        if chunk is not None:
+            pcm.extend(chunk)
+    pcm.extend(stream.flush())
+    return pcm
+
+
+class _UnpicklableErrorOrca(pvorca.FakeOrca):
+    def synthesize(self, text, speech_rate=None, random_state=None):
+        error = pvorca.OrcaRuntimeError("Failed.")
+        error.callback = lambda: None
+        raise error
+
+
+class _CrashingOrca(pvorca.FakeOrca):
+    def synthesize(self, text, speech_rate=None, random_state=None):
+        if text == "crash":
+            os._exit(1)
+        return super().synthesize(text, speech_rate=speech_rate, random_state=random_state)
+
+
+class _Server:
+    def __init__(self, coroutine) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._task = self._loop.create_task(coroutine)
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._task.cancel)
+        asyncio.run_coroutine_threadsafe(asyncio.wait([self._task]), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _connect_client(socket_path: Optional[str] = None) -> Optional[pvorca.OrcaClient]:
+    for _ in range(50):
+        try:
+            return pvorca.OrcaClient(socket_path)
+        except pvorca.OrcaIOError:
+            threading.Event().wait(0.05)
+    return None
+
+
+def _send_websocket_text(client: socket.socket, text: str) -> None:
+    payload = text.encode("utf-8")
+    mask = os.urandom(4)
+    client.sendall(
+        bytes([0x81, 0x80 | len(payload)]) + mask + bytes(x ^ mask[i % 4] for i, x in enumerate(payload)))
+
+
+def _read_websocket_message(stream) -> tuple:
+    first, second = stream.read(2)
+    length = second & 0x7F
+    if length == 126:
+        length = int.from_bytes(stream.read(2), "big")
+    elif length == 127:
+        length = int.from_bytes(stream.read(8), "big")
+    return first & 0x0F, stream.read(length)
+
+
+class OrcaOfflineTestCase(unittest.TestCase):
+    orca: pvorca.FakeOrca
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.orca = pvorca.FakeOrca()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.orca.delete()
+
+    def test_fake_synthesize(self) -> None:
+        pcm, alignments = self.orca.synthesize(TEXT)
+        self.assertGreater(len(pcm), 0)
+        self.assertEqual(pcm, self.orca.synthesize(PLAIN_TEXT)[0])
+        self.assertEqual([a.word for a in alignments], PLAIN_TEXT.split())
+        for previous, current in zip(alignments[:-1], alignments[1:]):
+            self.assertLessEqual(previous.end_sec, current.start_sec)
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            self.orca.synthesize("Invalid ☃")
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            self.orca.synthesize("a" * (self.orca.max_character_limit + 1))
+
+    def test_fake_synthesize_to_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "output.wav")
+            self.orca.synthesize_to_file(TEXT, path)
+            self.assertGreater(os.path.getsize(path), 44)
+
+    def test_fake_stream(self) -> None:
+        stream = self.orca.stream_open()
+        try:
+            self.assertEqual(_stream(stream, PLAIN_TEXT), self.orca.synthesize(PLAIN_TEXT + " ")[0])
+            self.assertEqual(stream.num_calls, len(PLAIN_TEXT.split(" ")) + 1)
+        finally:
+            stream.close()
+        self.assertEqual(self.orca.num_open_streams, 0)
+        stream.close()
+        self.assertEqual(self.orca.num_open_streams, 0)
+
+        with self.assertRaises(pvorca.OrcaInvalidStateError):
+            stream.synthesize("closed")
+
+    def test_fake_profile(self) -> None:
+        profile = pvorca.FakeOrca.Profile(call_sec=0.01, real_time_factor=50.)
+        orca = pvorca.FakeOrca(profile=profile)
+        start = perf_counter()
+        pcm, _ = orca.synthesize(PLAIN_TEXT)
+        num_seconds = perf_counter() - start
+
+        self.assertEqual(pcm, self.orca.synthesize(PLAIN_TEXT)[0])
+        self.assertGreaterEqual(num_seconds, profile.call_sec + len(pcm) / orca.sample_rate / profile.real_time_factor)
+
+    def test_fake_synthesize_progressive(self) -> None:
+        pcm, alignments = self.orca.synthesize(PLAIN_TEXT)
+        segments = list(self.orca.synthesize_progressive(PLAIN_TEXT, first_segment_length=12))
+        self.assertGreater(len(segments), 2)
+        self.assertLessEqual(len(segments[0][0]), len(segments[-1][0]))
+
+        offset_sec = 0.
+        for pcm_segment, alignments_segment in segments:
+            self.assertGreaterEqual(alignments_segment[0].start_sec, offset_sec)
+            offset_sec += len(pcm_segment) / self.orca.sample_rate
+            self.assertAlmostEqual(alignments_segment[-1].end_sec, offset_sec, 3)
+        self.assertEqual([x.word for x in alignments], [x.word for _, y in segments for x in y])
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            self.orca.synthesize_progressive(PLAIN_TEXT, growth_factor=0.5)
+
+        text = "{tomato|T AH M EY T OW} soup is {delicious|D IH L IH SH AH S}."
+        texts = []
+        orca = pvorca.FakeOrca()
+        with mock.patch.object(orca, "synthesize", side_effect=lambda x, *_: texts.append(x) or ([0], [])):
+            list(orca.synthesize_progressive(text, first_segment_length=5))
+        self.assertEqual(texts, ["{tomato|T AH M EY T OW}", "soup is", "{delicious|D IH L IH SH AH S}."])
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.FakeOrca(max_character_limit=10).synthesize_progressive(text)
+
+        generator = self.orca.synthesize_progressive(PLAIN_TEXT, first_segment_length=12)
+        next(generator)
+        generator.close()
+
+    def test_coalescing(self) -> None:
+        stream = self.orca.stream_open()
+        coalescing_stream = self.orca.stream_open(coalescing=pvorca.Orca.Coalescing(window_sec=1., max_delay_sec=1.))
+        try:
+            text = " ".join(character for character in PLAIN_TEXT)
+            self.assertEqual(_stream(coalescing_stream, text), _stream(stream, text))
+            self.assertEqual(coalescing_stream.num_texts, stream.num_texts)
+            self.assertLess(coalescing_stream.num_calls, stream.num_calls)
+        finally:
+            stream.close()
+            coalescing_stream.close()
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            self.orca.stream_open(coalescing=pvorca.Orca.Coalescing(window_sec=1., max_delay_sec=0.1))
+
+        boundary_characters = pvorca.Orca.OrcaStream.BOUNDARY_CHARACTERS
+        self.assertTrue(set("。、，") <= boundary_characters)
+        self.assertEqual(pvorca.TextSegmenter.BOUNDARY_CHARACTERS, boundary_characters)
+        self.assertEqual(pvorca.StallPolicy().boundary_characters, boundary_characters)
+
+    def test_segmenter(self) -> None:
+        segmenter = pvorca.TextSegmenter(min_chunk_length=8)
+        chunks = []
+        for character in TEXT:
+            chunk = segmenter.add(character)
+            if chunk is not None:
+                chunks.append(chunk)
+        chunk = segmenter.flush()
+        if chunk is not None:
+            chunks.append(chunk)
+
+        self.assertEqual("".join(chunks), TEXT)
+        self.assertTrue(any("{test|T EH S T}" in chunk for chunk in chunks))
+
+        segmenter = pvorca.TextSegmenter(min_chunk_length=1, max_pronunciation_length=8)
+        self.assertEqual(segmenter.add("Hello {"), "Hello ")
+        self.assertIsNone(segmenter.add("world"))
+        self.assertEqual(segmenter.add(" again "), "{world again ")
+        self.assertEqual(segmenter.add("bye."), "bye.")
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.TextSegmenter(min_chunk_length=0)
+
+    def test_stream_input(self) -> None:
+        text = "Grüße, ça va?"
+        data = text.encode("utf-8")
+
+        orca = pvorca.FakeOrca(valid_characters=set(text))
+        stream = orca.stream_open()
+        stream_input = pvorca.OrcaStreamInput(stream)
+        try:
+            pcm = []
+            for i in range(len(data)):
+                chunk = stream_input.synthesize(data[i:i + 1])
+                if chunk is not None:
+                    pcm.extend(chunk)
+            pcm.extend(stream_input.flush())
+        finally:
+            stream.close()
+        self.assertEqual(pcm, orca.synthesize(text)[0])
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.StallPolicy(window_sec=0.)
+
+    def test_pcm_ring_buffer(self) -> None:
+        buffer = pvorca.PcmRingBuffer(capacity=8)
+        self.assertEqual(buffer.write(list(range(6))), 6)
+
+        output = array('h', [0] * 4)
+        self.assertEqual(buffer.read_into(output), 4)
+        self.assertEqual(list(output), [0, 1, 2, 3])
+
+        self.assertEqual(buffer.write(list(range(6, 12))), 6)
+        output = array('h', [0] * 8)
+        self.assertEqual(buffer.read_into(output), 8)
+        self.assertEqual(list(output), list(range(4, 12)))
+
+        self.assertEqual(buffer.write(list(range(10))), 8)
+        self.assertEqual(buffer.num_overruns, 1)
+        self.assertEqual(buffer.write(list(range(10, 12)), overflow_policy=pvorca.OrcaOverflowPolicy.DROP_OLDEST), 2)
+        output = array('h', [0] * 8)
+        buffer.read_into(output)
+        self.assertEqual(list(output), list(range(2, 8)) + [10, 11])
+
+        buffer.write(list(range(8)))
+        with self.assertRaises(pvorca.OrcaBufferFullError):
+            buffer.write([1], overflow_policy=pvorca.OrcaOverflowPolicy.RAISE)
+
+        written = []
+        writer = threading.Thread(target=lambda: written.append(buffer.write(list(range(12)), timeout=None)))
+        buffer.read_into(array('h', [0] * 4))
+        writer.start()
+        buffer.wait_drained(timeout=0.2)
+        buffer.clear()
+        writer.join(timeout=1)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(written, [4])
+        self.assertEqual(buffer.fill_level, 0)
+
+        buffer = pvorca.PcmRingBuffer(capacity=8)
+        buffer.write(list(range(4)))
+        view = buffer.peek()
+        self.assertEqual(buffer.write(list(range(4, 10)), overflow_policy=pvorca.OrcaOverflowPolicy.DROP_OLDEST), 4)
+        buffer.clear()
+        self.assertEqual(buffer.write(list(range(10, 18))), 0)
+        self.assertEqual(view.tolist(), [0, 1, 2, 3])
+        buffer.advance(len(view))
+        self.assertEqual(buffer.write(list(range(10, 18))), 8)
+        output = array('h', [0] * 8)
+        self.assertEqual(buffer.read_into(output), 8)
+        self.assertEqual(list(output), list(range(10, 18)))
+
+    def test_shared_pcm_ring(self) -> None:
+        ring = pvorca.SharedPcmRing(num_slots=2, slot_num_samples=4)
+        try:
+            pcm = list(range(-5, 5))
+            output = array('h')
+            for slot, length in ring.write(pcm, timeout=1.):
+                ring.read(slot, length, output)
+            self.assertEqual(list(output), pcm)
+        finally:
+            ring.close()
+
+    def test_jitter_buffer(self) -> None:
+        jitter_buffer = pvorca.AdaptiveJitterBuffer(self.orca.sample_rate, min_delay_sec=0.01, max_delay_sec=0.5)
+        for _ in range(3):
+            jitter_buffer.reset()
+            stream = self.orca.stream_open()
+            try:
+                for word in PLAIN_TEXT.split(" "):
+                    jitter_buffer.log_text()
+                    pcm = stream.synthesize(word + " ")
+                    if pcm is not None:
+                        delay_sec = jitter_buffer.log_audio(len(pcm), processing_sec=0.001)
+                        self.assertGreaterEqual(delay_sec, 0.)
+                        self.assertLessEqual(delay_sec, 0.5)
+            finally:
+                stream.close()
+        self.assertEqual(jitter_buffer.num_utterances, 2)
+        self.assertLess(jitter_buffer.processing_ratio, 1.)
+
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.AdaptiveJitterBuffer(self.orca.sample_rate, target_probability=1.)
+
+    def test_pool(self) -> None:
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=2)
+        try:
+            expected, _ = self.orca.synthesize(PLAIN_TEXT)
+            futures = [pool.synthesize(PLAIN_TEXT) for _ in range(4)]
+            for future in futures:
+                self.assertEqual(future.result(timeout=10)[0], expected)
+
+            expected = self.orca.synthesize(PLAIN_TEXT + " ")[0]
+            sessions = [pool.open_session() for _ in range(3)]
+            for session in sessions:
+                for word in PLAIN_TEXT.split(" "):
+                    session.synthesize(word + " ")
+                session.flush()
+                session.close()
+            for session in sessions:
+                self.assertEqual([sample for chunk in session for sample in chunk], expected)
+        finally:
+            pool.delete()
+
+    def test_pool_standby_streams(self) -> None:
+        expected = self.orca.synthesize(PLAIN_TEXT + " ")[0]
+
+        def speak(session: pvorca.OrcaPool.Session) -> List[int]:
+            for word in PLAIN_TEXT.split(" "):
+                session.synthesize(word + " ")
+            session.flush()
+            session.close()
+            return [sample for chunk in session for sample in chunk]
+
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=1, num_standby_streams=1)
+        try:
+            sleep(0.2)
+            self.assertEqual(speak(pool.open_session()), expected)
+            self.assertEqual(pool.standby_stats, pvorca.OrcaPool.StandbyStats(num_hits=1, num_misses=0))
+
+            self.assertEqual(
+                speak(pool.open_session(speech_rate=1.2)),
+                self.orca.synthesize(PLAIN_TEXT + " ", speech_rate=1.2)[0])
+            self.assertEqual(pool.standby_stats, pvorca.OrcaPool.StandbyStats(num_hits=1, num_misses=1))
+
+            session = pool.open_session(speech_rate=0.8)
+            session.prepare()
+            sleep(0.2)
+            speak(session)
+            self.assertEqual(pool.standby_stats, pvorca.OrcaPool.StandbyStats(num_hits=2, num_misses=1))
+        finally:
+            pool.delete()
+
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=1, num_standby_streams=0)
+        try:
+            self.assertEqual(speak(pool.open_session()), expected)
+            self.assertEqual(pool.standby_stats, pvorca.OrcaPool.StandbyStats(num_hits=0, num_misses=0))
+        finally:
+            pool.delete()
+
+        session = pvorca.StreamingSession(self.orca, sink=lambda pcm: None)
+        try:
+            for _ in range(2):
+                sleep(0.2)
+                session.synthesize(PLAIN_TEXT)
+                session.cancel()
+            self.assertEqual(session.stats.num_standby_hits, 2)
+            self.assertEqual(session.stats.num_standby_misses, 0)
+        finally:
+            session.close()
+
+    def test_latency_histogram(self) -> None:
+        histogram = pvorca.OrcaLatencyHistogram()
+        self.assertEqual(histogram.percentile(50), 0.)
+
+        for latency_sec in (0.0005, 0.003, 0.003, 0.5, 20.):
+            histogram.add(latency_sec)
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.sum_sec, 20.5065)
+        buckets = dict(histogram.buckets)
+        self.assertEqual(buckets[0.001], 1)
+        self.assertEqual(buckets[0.002], 1)
+        self.assertEqual(buckets[0.005], 3)
+        self.assertEqual(buckets[0.2], 3)
+        self.assertEqual(buckets[0.5], 4)
+        self.assertEqual(buckets[10.], 4)
+        self.assertEqual(buckets[math.inf], 5)
+        self.assertEqual(histogram.percentile(50), 0.005)
+        self.assertEqual(histogram.percentile(80), 0.5)
+        self.assertEqual(histogram.percentile(100), math.inf)
+
+        copy = histogram.copy()
+        histogram.add(0.)
+        self.assertEqual(copy.count, 5)
+
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=1)
+        try:
+            futures = [pool.synthesize(PLAIN_TEXT) for _ in range(3)]
+            futures.append(pool.synthesize(PLAIN_TEXT, priority=pvorca.OrcaPriority.INTERACTIVE))
+            for future in futures:
+                future.result(timeout=10)
+            histograms = pool.latency_histograms
+            self.assertEqual(histograms[pvorca.OrcaPriority.BATCH].count, 3)
+            self.assertEqual(histograms[pvorca.OrcaPriority.INTERACTIVE].count, 1)
+        finally:
+            pool.delete()
+
+    def test_pool_priority(self) -> None:
+        gate = threading.Event()
+
+        class GatedOrca(pvorca.FakeOrca):
+            def synthesize(self, text, speech_rate=None, random_state=None):
+                if text == "Wait.":
+                    gate.wait(timeout=10)
+                return super().synthesize(text, speech_rate=speech_rate, random_state=random_state)
+
+        def run(pool: pvorca.OrcaPool, num_interactive: int) -> List[str]:
+            gate.clear()
+            blocker = pool.synthesize("Wait.", priority=pvorca.OrcaPriority.INTERACTIVE)
+            futures = [("batch", pool.synthesize(PLAIN_TEXT, priority=pvorca.OrcaPriority.BATCH))]
+            futures.extend(
+                ("interactive", pool.synthesize(PLAIN_TEXT, priority=pvorca.OrcaPriority.INTERACTIVE))
+                for _ in range(num_interactive))
+            order = []
+            for name, future in futures:
+                future.add_done_callback(lambda _, name=name: order.append(name))
+            sleep(0.2)
+            gate.set()
+            blocker.result(timeout=10)
+            for _, future in futures:
+                future.result(timeout=10)
+            return order
+
+        pool = pvorca.OrcaPool(lambda: GatedOrca(), num_instances=1, batch_aging_sec=60.)
+        try:
+            self.assertEqual(run(pool, 2), ["interactive", "interactive", "batch"])
+        finally:
+            pool.delete()
+
+        pool = pvorca.OrcaPool(lambda: GatedOrca(), num_instances=1, batch_aging_sec=0.1)
+        try:
+            self.assertEqual(run(pool, 2), ["batch", "interactive", "interactive"])
+        finally:
+            pool.delete()
+
+    def test_pool_throughput(self) -> None:
+        profile = pvorca.FakeOrca.Profile(call_sec=0.001, real_time_factor=20.)
+        num_jobs = 8
+
+        real_time_factors = dict()
+        for num_instances in (1, 2, 4):
+            pool = pvorca.OrcaPool(
+                lambda: pvorca.FakeOrca(profile=profile),
+                num_instances=num_instances,
+                batch_share=1.)
+            try:
+                start = perf_counter()
+                futures = [pool.synthesize(PLAIN_TEXT) for _ in range(num_jobs)]
+                num_samples = sum(len(future.result(timeout=10)[0]) for future in futures)
+                num_seconds = perf_counter() - start
+            finally:
+                pool.delete()
+
+            real_time_factors[num_instances] = num_samples / self.orca.sample_rate / num_seconds
+
+        self.assertGreater(real_time_factors[2], real_time_factors[1])
+        self.assertGreater(real_time_factors[4], real_time_factors[2])
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs the fork start method")
+    def test_process_pool(self) -> None:
+        context = multiprocessing.get_context("fork")
+        pool = pvorca.OrcaProcessPool(pvorca.FakeOrca, num_processes=2, num_slots=4, context=context)
+        try:
+            expected_pcm, expected_alignments = self.orca.synthesize(PLAIN_TEXT)
+            futures = [pool.synthesize(PLAIN_TEXT) for _ in range(4)]
+            for future in futures:
+                pcm, alignments = future.result(timeout=10)
+                self.assertEqual(pcm.tolist(), expected_pcm)
+                self.assertEqual(alignments, expected_alignments)
+                self.assertIsInstance(alignments[0], pvorca.Orca.WordAlignment)
+                self.assertIsInstance(alignments[0].phonemes[0], pvorca.Orca.PhonemeAlignment)
+
+            with tempfile.TemporaryDirectory() as directory:
+                alignments = pool.synthesize_to_file(PLAIN_TEXT, os.path.join(directory, "a.wav")).result(timeout=10)
+                self.assertEqual(alignments, expected_alignments)
+        finally:
+            pool.delete()
+
+        pool = pvorca.OrcaProcessPool(_UnpicklableErrorOrca, num_processes=1, context=context)
+        try:
+            with self.assertRaises(pvorca.OrcaRuntimeError):
+                pool.synthesize(PLAIN_TEXT).result(timeout=10)
+        finally:
+            pool.delete()
+
+        pool = pvorca.OrcaProcessPool(_CrashingOrca, num_processes=2, context=context)
+        try:
+            with self.assertRaises(pvorca.OrcaRuntimeError):
+                pool.synthesize("crash").result(timeout=10)
+            self.assertEqual(pool.synthesize(PLAIN_TEXT).result(timeout=10)[0].tolist(), expected_pcm)
+            with self.assertRaises(pvorca.OrcaRuntimeError):
+                pool.synthesize("crash").result(timeout=10)
+            with self.assertRaises(pvorca.OrcaRuntimeError):
+                pool.synthesize(PLAIN_TEXT)
+        finally:
+            pool.delete()
+
+    def test_cpu_sets(self) -> None:
+        nodes = [frozenset(range(0, 8)), frozenset(range(8, 16))]
+        cpu_sets = pvorca.plan_cpu_sets(4, "cpu:4", nodes=nodes)
+        self.assertEqual(cpu_sets, [
+            frozenset(range(0, 4)),
+            frozenset(range(8, 12)),
+            frozenset(range(4, 8)),
+            frozenset(range(12, 16))])
+        self.assertEqual(pvorca.plan_cpu_sets(3, "cpu:8", nodes=nodes)[2], cpu_sets[0] | cpu_sets[2])
+        self.assertEqual(len(pvorca.plan_cpu_sets(2, "gpu", nodes=nodes)[0]), 8)
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.plan_cpu_sets(0, nodes=nodes)
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.plan_cpu_sets(2, nodes=[])
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(len(pvorca.numa_nodes(directory)), 1)
+
+        cpu_sets = pvorca.plan_cpu_sets(2, "cpu:1")
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=2, cpu_sets=cpu_sets)
+        try:
+            self.assertEqual(pool.synthesize(PLAIN_TEXT).result(timeout=10)[0], self.orca.synthesize(PLAIN_TEXT)[0])
+        finally:
+            pool.delete()
+
+    def test_available_devices_cache(self) -> None:
+        queries = []
+
+        def query_hardware_devices(library):
+            queries.append(library)
+            return "cpu", "gpu:0"
+
+        orca_module = sys.modules["pvorca._orca"]
+        with mock.patch.object(orca_module, "_load_library", lambda x: x), \
+                mock.patch.object(orca_module, "_query_hardware_devices", query_hardware_devices):
+            pvorca.invalidate_available_devices()
+            self.assertEqual(pvorca.available_devices("a.so"), ["cpu", "gpu:0"])
+            pvorca.available_devices("a.so").append("tpu")
+            self.assertEqual(pvorca.available_devices("a.so"), ["cpu", "gpu:0"])
+            self.assertEqual(len(queries), 1)
+
+            pvorca.available_devices("b.so")
+            pvorca.available_devices("a.so", refresh=True)
+            self.assertEqual(len(queries), 3)
+
+            pvorca.invalidate_available_devices("a.so")
+            pvorca.available_devices("a.so")
+            pvorca.available_devices("b.so")
+            self.assertEqual(len(queries), 4)
+
+            pvorca.invalidate_available_devices()
+            pvorca.available_devices("b.so")
+            self.assertEqual(len(queries), 5)
+        pvorca.invalidate_available_devices()
+
+    def test_streaming_session(self) -> None:
+        received = []
+        session = pvorca.StreamingSession(self.orca, sink=received.extend)
+        try:
+            for word in PLAIN_TEXT.split(" "):
+                session.synthesize(word + " ")
+            session.flush()
+            self.assertTrue(session.wait_delivered(timeout=10))
+        finally:
+            session.close()
+        self.assertEqual(received, self.orca.synthesize(PLAIN_TEXT + " ")[0])
+
+    def test_streaming_session_stall(self) -> None:
+        window_sec = 0.2
+        received = []
+        session = pvorca.StreamingSession(
+            self.orca,
+            sink=received.extend,
+            stall_policy=pvorca.StallPolicy(window_sec=window_sec))
+        try:
+            expected = self.orca.synthesize("Hello world, ")[0]
+            start = perf_counter()
+            for word in ["Hello ", "world, "]:
+                session.synthesize(word)
+            while len(received) < len(expected) and perf_counter() - start < 10:
+                sleep(0.01)
+            self.assertGreaterEqual(perf_counter() - start, window_sec)
+            self.assertEqual(received, expected)
+            self.assertEqual(session.stats.num_stalls, 1)
+            self.assertEqual(session.stats.num_stall_flushes, 1)
+
+            num_received = len(received)
+            session.synthesize("this is ")
+            sleep(3 * window_sec)
+            self.assertEqual(len(received), num_received)
+            self.assertEqual(session.stats.num_stalls, 2)
+            self.assertEqual(session.stats.num_stall_flushes, 1)
+
+            session.cancel()
+            self.assertEqual(session.stats.num_stalls, 2)
+            self.assertEqual(session.stream_input.num_stalls, 0)
+        finally:
+            session.close()
+
+    def test_streaming_session_cancel_and_close(self) -> None:
+        for _ in range(200):
+            session = pvorca.StreamingSession(self.orca, sink=lambda pcm: None)
+            session.synthesize(PLAIN_TEXT)
+            session.cancel()
+            session.close()
+
+    def test_streaming_session_cancel_blocking_sink(self) -> None:
+        device = pvorca.PcmRingBuffer(capacity=16)
+        is_cancelled = threading.Event()
+
+        def play(pcm: memoryview) -> None:
+            if not is_cancelled.is_set():
+                device.write(pcm, timeout=None)
+
+        session = pvorca.StreamingSession(self.orca, sink=play)
+        try:
+            session.synthesize(PLAIN_TEXT)
+            session.flush()
+            while device.fill_level < 16:
+                sleep(0.01)
+
+            is_cancelled.set()
+            device.clear()
+            start = perf_counter()
+            session.cancel()
+            self.assertLess(perf_counter() - start, 1.)
+            self.assertEqual(device.fill_level, 0)
+        finally:
+            session.close()
+
+    def test_wav_writer(self) -> None:
+        pcm = self.orca.synthesize(PLAIN_TEXT + " ")[0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stream.wav")
+            stream = self.orca.stream_open()
+            with pvorca.OrcaWavWriter(path, self.orca.sample_rate, fsync_interval_sec=0.001) as writer:
+                for word in PLAIN_TEXT.split(" "):
+                    writer.write(stream.synthesize(word + " "))
+                writer.sync()
+                with wave.open(path, "rb") as f:
+                    self.assertEqual(f.getnframes(), writer.num_samples)
+                writer.write(stream.flush())
+            stream.close()
+            with self.assertRaises(pvorca.OrcaInvalidStateError):
+                writer.write([0])
+
+            with wave.open(path, "rb") as f:
+                self.assertEqual(f.getframerate(), self.orca.sample_rate)
+                self.assertEqual(f.getsampwidth(), 2)
+                self.assertEqual(array('h', f.readframes(f.getnframes())).tolist(), pcm)
+
+            path = os.path.join(directory, "session.wav")
+            with pvorca.OrcaWavWriter(path, self.orca.sample_rate) as writer:
+                with pvorca.StreamingSession(self.orca, sink=writer.write) as session:
+                    session.synthesize(PLAIN_TEXT + " ")
+            with wave.open(path, "rb") as f:
+                self.assertEqual(array('h', f.readframes(f.getnframes())).tolist(), pcm)
+
+    def test_split_segments(self) -> None:
+        text = "One two three. Four {five|F AY V} six, seven eight nine ten."
+        segments = pvorca.split_segments(text, max_length=30)
+        self.assertEqual(segments, ["One two three.", "Four {five|F AY V} six,", "seven eight nine ten."])
+        self.assertEqual(pvorca.split_segments("abcdefgh ij", max_length=4), ["abcd", "efgh", "ij"])
+        self.assertEqual(
+            pvorca.split_segments("I like {tomato|T AH M EY T OW}s.", max_length=23),
+            ["I like", "{tomato|T AH M EY T OW}", "s."])
+        with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+            pvorca.split_segments("{tomato|T AH M EY T OW}", max_length=10)
+
+        document = "Preface.\n# One\nFirst chapter.\nChapter 2\nSecond chapter."
+        self.assertEqual(
+            pvorca.split_chapters(document),
+            ["Preface.", "# One\nFirst chapter.", "Chapter 2\nSecond chapter."])
+
+    def test_long_form(self) -> None:
+        chapters = [PLAIN_TEXT, "Chapter two. " + PLAIN_TEXT]
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(max_character_limit=40), num_instances=2)
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                checkpoint_dir = os.path.join(directory, "checkpoints")
+                output_dir = os.path.join(directory, "output")
+
+                progress = []
+                renderer = pvorca.LongFormRenderer(pool, checkpoint_dir, random_state=1, on_progress=progress.append)
+                paths = renderer.render(chapters, output_dir)
+                self.assertEqual(progress[-1].num_completed_segments, progress[-1].num_segments)
+                self.assertEqual(progress[-1].num_completed_chapters, 2)
+                self.assertEqual(progress[-1].num_resumed_segments, 0)
+                self.assertGreater(progress[-1].audio_sec_per_sec, 0)
+
+                for path, chapter in zip(paths, chapters):
+                    expected = []
+                    for segment in pvorca.split_segments(chapter, 40):
+                        expected.extend(self.orca.synthesize(segment)[0])
+                    with wave.open(path, "rb") as f:
+                        self.assertEqual(array('h', f.readframes(f.getnframes())).tolist(), expected)
+                    with open(os.path.splitext(path)[0] + ".json", "r") as f:
+                        alignments = json.load(f)
+                    self.assertEqual(" ".join(x["word"] for x in alignments), chapter)
+                    self.assertAlmostEqual(alignments[-1]["end_sec"], len(expected) / self.orca.sample_rate, 2)
+
+                os.remove(paths[1])
+                os.remove(os.path.join(checkpoint_dir, sorted(os.listdir(checkpoint_dir))[0]))
+                progress.clear()
+                self.assertEqual(renderer.render(chapters, output_dir), paths)
+                self.assertGreater(progress[-1].num_resumed_segments, 0)
+                self.assertLess(progress[-1].num_resumed_segments, progress[-1].num_segments)
+                self.assertTrue(os.path.exists(paths[1]))
+        finally:
+            pool.delete()
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return
+        pool = pvorca.OrcaProcessPool(
+            functools.partial(pvorca.FakeOrca, max_character_limit=40),
+            num_processes=2,
+            context=multiprocessing.get_context("fork"))
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                renderer = pvorca.LongFormRenderer(pool, os.path.join(directory, "checkpoints"), random_state=1)
+                paths = renderer.render(chapters, os.path.join(directory, "output"))
+                for path, chapter in zip(paths, chapters):
+                    expected = []
+                    for segment in pvorca.split_segments(chapter, 40):
+                        expected.extend(self.orca.synthesize(segment)[0])
+                    with wave.open(path, "rb") as f:
+                        self.assertEqual(array('h', f.readframes(f.getnframes())).tolist(), expected)
+        finally:
+            pool.delete()
+
+    def test_tune(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "tuning.json")
+            self.assertIsNone(pvorca.load_tuning(cache_path=cache_path))
+
+            results = []
+            for workload in pvorca.OrcaWorkload:
+                best = pvorca.tune(
+                    access_key="",
+                    workload=workload,
+                    devices=["cpu"],
+                    max_num_instances=2,
+                    num_iterations=1,
+                    cache_path=cache_path,
+                    orca_factory=lambda device: pvorca.FakeOrca(),
+                    on_result=results.append)
+                self.assertEqual(best.workload, workload)
+                self.assertTrue(best.device.startswith("cpu:"))
+                self.assertEqual(pvorca.load_tuning(workload=workload, cache_path=cache_path), best)
+
+            self.assertEqual(pvorca.load_tuning(cache_path=cache_path).workload, pvorca.OrcaWorkload.BATCH)
+            self.assertGreaterEqual(len(results), 2)
+
+    def test_create_tuned_device(self) -> None:
+        factory_module = sys.modules["pvorca._factory"]
+        for saved_device, expected_device in [("cpu:4", "cpu:4"), ("gpu:0", "gpu:0"), ("gpu:1", "best")]:
+            tuning = pvorca.OrcaTuning(
+                workload=pvorca.OrcaWorkload.STREAMING,
+                device=saved_device,
+                num_instances=1,
+                first_audio_sec=0.1,
+                real_time_factor=10.)
+            with mock.patch.object(
+                    factory_module,
+                    "load_tuning",
+                    lambda workload, **_: tuning if workload is tuning.workload else None), \
+                    mock.patch.object(factory_module, "list_hardware_devices", lambda **_: ["cpu", "gpu:0"]), \
+                    mock.patch.object(factory_module, "Orca", lambda **kwargs: kwargs["device"]):
+                self.assertEqual(pvorca.create(access_key="", model_path="m.pv", library_path="a.so"), expected_device)
+                self.assertEqual(
+                    pvorca.create(
+                        access_key="",
+                        model_path="m.pv",
+                        library_path="a.so",
+                        workload=pvorca.OrcaWorkload.BATCH),
+                    "best")
+
+    def test_server(self) -> None:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=1)
+        server_module = importlib.import_module("pvorca.server")
+        server = _Server(server_module.OrcaServer(pool).serve(port=port))
+        try:
+            connection = None
+            for _ in range(50):
+                try:
+                    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                    connection.request("POST", "/synthesize", json.dumps({"text": PLAIN_TEXT, "format": "pcm"}))
+                    break
+                except ConnectionRefusedError:
+                    threading.Event().wait(0.05)
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            pcm = array('h', response.read())
+            if sys.byteorder == 'big':
+                pcm.byteswap()
+            self.assertEqual(list(pcm), self.orca.synthesize(PLAIN_TEXT)[0])
+            connection.close()
+
+            with socket.create_connection(("127.0.0.1", port), timeout=10) as client:
+                client.sendall(
+                    b"GET /stream HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                    b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n\r\n")
+                stream = client.makefile("rb")
+                self.assertIn(b" 101 ", stream.readline())
+                while stream.readline() != b"\r\n":
+                    pass
+
+                _send_websocket_text(client, "[1]")
+                self.assertEqual(json.loads(_read_websocket_message(stream)[1])["event"], "error")
+
+                for word in PLAIN_TEXT.split(" "):
+                    _send_websocket_text(client, json.dumps({"text": word + " "}))
+                _send_websocket_text(client, json.dumps({"flush": True}))
+                samples = bytearray()
+                while True:
+                    opcode, payload = _read_websocket_message(stream)
+                    if opcode == 0x1:
+                        self.assertEqual(json.loads(payload)["event"], "flushed")
+                        break
+                    samples.extend(payload)
+                pcm = array('h', bytes(samples))
+                if sys.byteorder == 'big':
+                    pcm.byteswap()
+                self.assertEqual(list(pcm), self.orca.synthesize(PLAIN_TEXT + " ")[0])
+
+                mask = os.urandom(4)
+                client.sendall(bytes([0x88, 0x80]) + mask)
+                self.assertEqual(_read_websocket_message(stream)[0], 0x8)
+                self.assertEqual(stream.read(), b"")
+        finally:
+            server.stop()
+            pool.delete()
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+    def test_daemon(self) -> None:
+        directory = tempfile.mkdtemp()
+        runtime_dir = os.path.join(directory, "runtime")
+        output_dir = os.path.join(directory, "output")
+        os.mkdir(output_dir)
+
+        pool = pvorca.OrcaPool(lambda: pvorca.FakeOrca(), num_instances=1)
+        daemon_module = importlib.import_module("pvorca.daemon")
+        daemon = daemon_module.OrcaDaemon(pool, max_message_size=4096, output_dir=output_dir)
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": runtime_dir}):
+            socket_path = pvorca.default_socket_path()
+            server = _Server(daemon.serve())
+            client = _connect_client()
+        try:
+            self.assertEqual(socket_path, os.path.join(runtime_dir, "pvorca.sock"))
+            self.assertIsNotNone(client)
+            self.assertEqual(os.stat(runtime_dir).st_mode & 0o777, 0o700)
+            self.assertEqual(client.sample_rate, self.orca.sample_rate)
+
+            client.synthesize_to_file(PLAIN_TEXT, "a.wav")
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "a.wav")))
+            for output_path in ("../b.wav", os.path.join(directory, "b.wav")):
+                with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+                    client.synthesize_to_file(PLAIN_TEXT, output_path)
+            self.assertFalse(os.path.exists(os.path.join(directory, "b.wav")))
+
+            pcm, alignments = client.synthesize(PLAIN_TEXT)
+            self.assertEqual(list(pcm), self.orca.synthesize(PLAIN_TEXT)[0])
+            self.assertEqual(len(alignments), len(PLAIN_TEXT.split()))
+
+            with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+                client.synthesize("Invalid ☃")
+
+            stream = client.stream_open()
+            try:
+                self.assertEqual(list(_stream(stream, PLAIN_TEXT)), self.orca.synthesize(PLAIN_TEXT + " ")[0])
+            finally:
+                stream.close()
+
+            large_client = pvorca.OrcaClient(socket_path)
+            try:
+                with self.assertRaises(pvorca.OrcaInvalidArgumentError):
+                    large_client.synthesize("a" * 5000)
+                with self.assertRaises(pvorca.OrcaIOError):
+                    large_client.synthesize(PLAIN_TEXT)
+            finally:
+                large_client.delete()
+            self.assertEqual(list(client.synthesize(PLAIN_TEXT)[0]), self.orca.synthesize(PLAIN_TEXT)[0])
+        finally:
+            if client is not None:
+                client.delete()
+            server.stop()
+
+        server = _Server(daemon_module.OrcaDaemon(pool).serve(socket_path))
+        client = _connect_client(socket_path)
+        try:
+            self.assertIsNotNone(client)
+            with self.assertRaises(pvorca.OrcaInvalidStateError):
+                client.synthesize_to_file(PLAIN_TEXT, "a.wav")
+        finally:
+            if client is not None:
+                client.delete()
+            server.stop()
+            pool.delete()
+
+
+if __name__ == '__main__':
+    unittest.main()
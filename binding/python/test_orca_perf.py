@@ -12,15 +12,20 @@
 import argparse
 import os
 import sys
+import threading
 import unittest
 
-from time import perf_counter
+from ctypes import POINTER, byref, c_int16, c_int32
+from time import perf_counter, perf_counter_ns, process_time
 from parameterized import parameterized
-from typing import List
+from typing import List, Optional, Sequence, Set, Tuple
 
-from _orca import Orca
-from _util import default_library_path
-from test_util import get_model_path, get_test_data
+from test_util import get_model_path, get_test_data, load_package
+
+load_package()
+
+from pvorca import device_num_threads, Orca, plan_cpu_sets
+from pvorca._util import default_library_path
 
 test_data = get_test_data()
 
@@ -31,6 +36,11 @@ class OrcaPerformanceTestCase(unittest.TestCase):
     num_test_iterations: int
     proc_performance_threshold_rtf: float
 
+    # Timing on shared runners is noisy, so comparisons between two modes allow for a margin.
+    WAIT_MARGIN = 1.25
+    WAIT_SLACK_SEC = 0.01
+    AFFINITY_MARGIN = 1.25
+
     def test_performance_proc(self) -> None:
 
         td = test_data.sentence_tests[0]
@@ -57,6 +67,301 @@ class OrcaPerformanceTestCase(unittest.TestCase):
             print("Average proc performance[model=%s %s]: RTF = %s " % (model, td.language, real_time_factor))
             self.assertGreater(real_time_factor, self.proc_performance_threshold_rtf)
 
+    @staticmethod
+    def _num_seconds_first_audio(orca: Orca, text: str, busy_wait: bool) -> float:
+        first_audio = threading.Event()
+        time_first_audio = []
+
+        def synthesize() -> None:
+            stream = orca.stream_open()
+            try:
+                for token in [f"{word} " for word in text.split()] + [None]:
+                    pcm = stream.synthesize(token) if token is not None else stream.flush()
+                    if pcm is not None and not first_audio.is_set():
+                        time_first_audio.append(perf_counter())
+                        first_audio.set()
+            finally:
+                stream.close()
+
+        thread = threading.Thread(target=synthesize)
+        start = perf_counter()
+        thread.start()
+        if busy_wait:
+            while not first_audio.is_set():
+                pass
+        else:
+            first_audio.wait()
+        thread.join()
+
+        return time_first_audio[0] - start
+
+    def test_performance_first_audio(self) -> None:
+        td = test_data.sentence_tests[0]
+
+        affinity = os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity') else None
+        if affinity is not None:
+            os.sched_setaffinity(0, {min(affinity)})
+
+        try:
+            for model in td.models:
+                orca = Orca(
+                    access_key=self.access_key,
+                    model_path=get_model_path(model),
+                    device=self.device,
+                    library_path=default_library_path('../..'))
+
+                try:
+                    num_seconds_first_audio = dict()
+                    for busy_wait in (True, False):
+                        num_seconds = 0
+                        for i in range(self.num_test_iterations):
+                            num_seconds_iteration = self._num_seconds_first_audio(orca, td.text, busy_wait)
+                            if i > 0:
+                                num_seconds += num_seconds_iteration
+                        num_seconds_first_audio[busy_wait] = num_seconds / max(self.num_test_iterations - 1, 1)
+
+                        print("Average time to first audio[model=%s %s wait=%s single_core=%s]: %.3f s" % (
+                            model,
+                            td.language,
+                            "busy" if busy_wait else "event",
+                            affinity is not None,
+                            num_seconds_first_audio[busy_wait]))
+                finally:
+                    orca.delete()
+
+                self.assertLessEqual(
+                    num_seconds_first_audio[False],
+                    num_seconds_first_audio[True] * self.WAIT_MARGIN + self.WAIT_SLACK_SEC)
+        finally:
+            if affinity is not None:
+                os.sched_setaffinity(0, affinity)
+
+    def test_performance_coalescing(self) -> None:
+        td = test_data.sentence_tests[0]
+        tokens = [f"{word} " for word in td.text.split()]
+        tokens = [token[i:i + 3] for token in tokens for i in range(0, len(token), 3)]
+
+        for model in td.models:
+            orca = Orca(
+                access_key=self.access_key,
+                model_path=get_model_path(model),
+                device=self.device,
+                library_path=default_library_path('../..'))
+
+            num_calls = dict()
+            for coalescing in (None, Orca.Coalescing()):
+                num_calls[coalescing] = 0
+                num_seconds = 0
+                num_cpu_seconds = 0
+                for i in range(self.num_test_iterations):
+                    stream = orca.stream_open(coalescing=coalescing)
+                    start = perf_counter()
+                    start_cpu = process_time()
+                    for token in tokens:
+                        stream.synthesize(token)
+                    stream.flush()
+                    if i > 0:
+                        num_seconds += perf_counter() - start
+                        num_cpu_seconds += process_time() - start_cpu
+                        num_calls[coalescing] += stream.num_calls
+                    stream.close()
+
+                num_iterations = max(self.num_test_iterations - 1, 1)
+                print("Average stream performance[model=%s %s coalescing=%s]: %.1f calls/s, %d calls, %.3f s CPU" % (
+                    model,
+                    td.language,
+                    coalescing is not None,
+                    num_calls[coalescing] / max(num_seconds, 1e-9),
+                    num_calls[coalescing] / num_iterations,
+                    num_cpu_seconds / num_iterations))
+
+            orca.delete()
+
+            self.assertLessEqual(num_calls[Orca.Coalescing()], num_calls[None])
+
+    def test_performance_progressive(self) -> None:
+        td = test_data.sentence_tests[0]
+        text = " ".join([td.text] * 4)
+
+        for model in td.models:
+            orca = Orca(
+                access_key=self.access_key,
+                model_path=get_model_path(model),
+                device=self.device,
+                library_path=default_library_path('../..'))
+
+            num_seconds_single = 0
+            num_seconds_first_segment = 0
+            num_seconds_progressive = 0
+            for i in range(self.num_test_iterations):
+                start = perf_counter()
+                orca.synthesize(text)
+                num_seconds = perf_counter() - start
+                if i > 0:
+                    num_seconds_single += num_seconds
+
+                start = perf_counter()
+                num_seconds_first = None
+                for _ in orca.synthesize_progressive(text):
+                    if num_seconds_first is None:
+                        num_seconds_first = perf_counter() - start
+                num_seconds = perf_counter() - start
+                if i > 0:
+                    num_seconds_first_segment += num_seconds_first
+                    num_seconds_progressive += num_seconds
+
+            orca.delete()
+
+            num_iterations = max(self.num_test_iterations - 1, 1)
+            print("Average progressive synthesis[model=%s %s]: first audio %.3f s (single %.3f s), total %.3f s" % (
+                model,
+                td.language,
+                num_seconds_first_segment / num_iterations,
+                num_seconds_single / num_iterations,
+                num_seconds_progressive / num_iterations))
+
+            self.assertLess(num_seconds_first_segment, num_seconds_single)
+
+    @staticmethod
+    def _num_ns_stream_calls(orca: Orca, tokens: List[str], raw: bool) -> int:
+        stream = orca.stream_open(random_state=42)
+        try:
+            if raw:
+                synthesize_func = orca._stream_synthesize_func
+                pcm_delete_func = orca._pcm_delete_func
+                c_num_samples = c_int32()
+                c_pcm = POINTER(c_int16)()
+                c_num_samples_ref = byref(c_num_samples)
+                c_pcm_ref = byref(c_pcm)
+                encoded_tokens = [token.encode("utf-8") for token in tokens]
+
+                start = perf_counter_ns()
+                for token in encoded_tokens:
+                    synthesize_func(stream._handle, token, c_num_samples_ref, c_pcm_ref)
+                    pcm_delete_func(c_pcm)
+                return perf_counter_ns() - start
+
+            start = perf_counter_ns()
+            for token in tokens:
+                stream.synthesize(token)
+            return perf_counter_ns() - start
+        finally:
+            stream.close()
+
+    def test_performance_call_overhead(self) -> None:
+        td = test_data.sentence_tests[0]
+        tokens = [f"{word} " for word in td.text.split()]
+
+        for model in td.models:
+            orca = Orca(
+                access_key=self.access_key,
+                model_path=get_model_path(model),
+                device=self.device,
+                library_path=default_library_path('../..'))
+
+            num_ns_raw = 0
+            num_ns_binding = 0
+            for i in range(self.num_test_iterations):
+                num_ns_raw_iteration = self._num_ns_stream_calls(orca, tokens, raw=True)
+                num_ns_binding_iteration = self._num_ns_stream_calls(orca, tokens, raw=False)
+                if i > 0:
+                    num_ns_raw += num_ns_raw_iteration
+                    num_ns_binding += num_ns_binding_iteration
+
+            orca.delete()
+
+            num_calls = len(tokens) * max(self.num_test_iterations - 1, 1)
+            print("Average stream call overhead[model=%s %s]: %d ns per call (%d ns binding, %d ns native)" % (
+                model,
+                td.language,
+                (num_ns_binding - num_ns_raw) // num_calls,
+                num_ns_binding // num_calls,
+                num_ns_raw // num_calls))
+
+    def _run_instances(self, model: str, cpu_sets: Sequence[Optional[Set[int]]]) -> Tuple[float, List[float]]:
+        td = test_data.sentence_tests[0]
+        barrier = threading.Barrier(len(cpu_sets) + 1)
+        num_samples = []
+        latencies = []
+        errors = []
+
+        def run(cpu_set: Optional[Set[int]]) -> None:
+            try:
+                if cpu_set is not None:
+                    os.sched_setaffinity(0, cpu_set)
+                orca = Orca(
+                    access_key=self.access_key,
+                    model_path=get_model_path(model),
+                    device=self.device,
+                    library_path=default_library_path('../..'))
+            except Exception as e:
+                errors.append(e)
+                barrier.abort()
+                return
+
+            try:
+                orca.synthesize(td.text)
+                barrier.wait()
+                for _ in range(self.num_test_iterations):
+                    start = perf_counter()
+                    pcm, _ = orca.synthesize(td.text)
+                    latencies.append(perf_counter() - start)
+                    num_samples.append(len(pcm))
+                sample_rate.append(orca.sample_rate)
+            except threading.BrokenBarrierError:
+                pass
+            finally:
+                orca.delete()
+
+        sample_rate = []
+        threads = [threading.Thread(target=run, args=(cpu_set,)) for cpu_set in cpu_sets]
+        for thread in threads:
+            thread.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        start = perf_counter()
+        for thread in threads:
+            thread.join()
+        num_seconds = perf_counter() - start
+
+        if len(errors) > 0:
+            raise errors[0]
+
+        return sum(num_samples) / sample_rate[0] / num_seconds, sorted(latencies)
+
+    @unittest.skipUnless(hasattr(os, 'sched_setaffinity'), "CPU affinity is not supported on this platform")
+    def test_performance_affinity(self) -> None:
+        td = test_data.sentence_tests[0]
+
+        num_threads = device_num_threads(self.device) or 1
+        num_instances = max(1, len(os.sched_getaffinity(0)) // num_threads)
+        cpu_sets = plan_cpu_sets(num_instances, self.device)
+
+        for model in td.models:
+            real_time_factors = dict()
+            for pinned in (False, True):
+                real_time_factor, latencies = self._run_instances(
+                    model,
+                    cpu_sets if pinned else [None] * num_instances)
+                p50 = latencies[len(latencies) // 2]
+                p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+                print("Pool performance[model=%s %s instances=%d pinned=%s]: RTF = %.2f, p50 = %.3f s, p99 = %.3f s" % (
+                    model,
+                    td.language,
+                    num_instances,
+                    pinned,
+                    real_time_factor,
+                    p50,
+                    p99))
+
+                self.assertGreater(p50, 0)
+                self.assertGreaterEqual(p99, p50)
+                real_time_factors[pinned] = real_time_factor
+
+            self.assertGreaterEqual(real_time_factors[True], real_time_factors[False] / self.AFFINITY_MARGIN)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
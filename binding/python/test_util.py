@@ -9,11 +9,13 @@
 # specific language governing permissions and limitations under the License.
 #
 
+import importlib.util
 import json
 import os
 import platform
 import struct
 import subprocess
+import sys
 import wave
 from dataclasses import dataclass
 from typing import Sequence, Optional
@@ -21,6 +23,20 @@ from typing import Sequence, Optional
 from _orca import Orca
 
 
+def load_package():
+    """Imports this directory as the `pvorca` package, so that modules using relative imports can be tested in place."""
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "pvorca",
+        os.path.join(directory, "__init__.py"),
+        submodule_search_locations=[directory])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["pvorca"] = package
+    spec.loader.exec_module(package)
+    return package
+
+
 def android_first_device_id():
     res = subprocess.run(["adb", "devices"], capture_output=True, text=True)
     serial_ids = [x.split("\t")[0] for x in res.stdout.replace("\r\n", "\n").split("\n")[1:]]
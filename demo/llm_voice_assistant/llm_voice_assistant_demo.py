@@ -10,7 +10,6 @@
 #
 
 import argparse
-import time
 from typing import Dict
 
 from pvrecorder import PvRecorder
@@ -107,6 +106,7 @@ def main(args: argparse.Namespace) -> None:
     synthesizer_init_kwargs = get_synthesizer_init_kwargs(args)
     synthesizer = Synthesizer.create(
         Synthesizers(args.synthesizer),
+        sentence_pipelining=not args.no_sentence_pipelining,
         play_audio_callback=audio_output.play,
         timer=timer,
         **synthesizer_init_kwargs)
@@ -128,51 +128,52 @@ def main(args: argparse.Namespace) -> None:
             timer.log_time_llm_request()
             text_generator = llm.chat(user_input=text)
 
-            llm_message = ""
-            printed_stats = False
-            for token in text_generator:
-                if token is None:
-                    continue
+            try:
+                llm_message = ""
+                printed_stats = False
+                for token in text_generator:
+                    if token is None:
+                        continue
 
-                if timer.is_first_token:
-                    timer.log_time_first_llm_token()
+                    if timer.is_first_token:
+                        timer.log_time_first_llm_token()
 
-                llm_message += token
+                    llm_message += token
 
-                if synthesizer.text_streamable:
-                    synthesizer.synthesize(token)
+                    if synthesizer.text_streamable:
+                        synthesizer.synthesize(token)
 
-                if not timer.before_first_audio and not printed_stats:
-                    timing_printer.print_timing_stats(
-                        num_seconds_first_llm_token=timer.num_seconds_to_first_token(),
-                        num_seconds_first_audio=timer.num_seconds_to_first_audio(),
-                    )
-                    printed_stats = True
-                    print(f"Answering with {synthesizer} ...")
+                    if not timer.before_first_audio and not printed_stats:
+                        timing_printer.print_timing_stats(
+                            num_seconds_first_llm_token=timer.num_seconds_to_first_token(),
+                            num_seconds_first_audio=timer.num_seconds_to_first_audio(),
+                        )
+                        printed_stats = True
+                        print(f"Answering with {synthesizer} ...")
 
-                timer.increment_num_tokens()
+                    timer.increment_num_tokens()
 
-            timer.log_time_last_llm_token()
+                timer.log_time_last_llm_token()
 
-            if synthesizer.text_streamable:
-                synthesizer.flush()
-            else:
-                synthesizer.synthesize(llm_message)
+                if synthesizer.text_streamable:
+                    synthesizer.flush()
+                else:
+                    synthesizer.synthesize(llm_message)
 
-            wait_start_time = time.time()
-            while timer.before_first_audio:
-                if time.time() - wait_start_time > MAX_WAIT_TIME_FIRST_AUDIO:
-                    print(
-                        f"Waited for {MAX_WAIT_TIME_FIRST_AUDIO}s for first audio but did not receive any. Exiting")
-                    break
+                if not timer.wait_for_first_audio(timeout=MAX_WAIT_TIME_FIRST_AUDIO):
+                    print(f"Waited for {MAX_WAIT_TIME_FIRST_AUDIO}s for first audio but did not receive any. Exiting")
 
-            if not printed_stats:
-                timing_printer.print_timing_stats(
-                    num_seconds_first_llm_token=timer.num_seconds_to_first_token(),
-                    num_seconds_first_audio=timer.num_seconds_to_first_audio())
-                print(f"Answering with {synthesizer} ...")
+                if not printed_stats:
+                    timing_printer.print_timing_stats(
+                        num_seconds_first_llm_token=timer.num_seconds_to_first_token(),
+                        num_seconds_first_audio=timer.num_seconds_to_first_audio())
+                    print(f"Answering with {synthesizer} ...")
 
-            audio_output.flush_and_terminate()
+                audio_output.flush_and_terminate()
+            except KeyboardInterrupt:
+                num_seconds_cancel = audio_output.cancel() + synthesizer.cancel()
+                audio_output.terminate()
+                print(f"\nInterrupted. Dropped pending speech in {num_seconds_cancel * 1000:.1f} ms.")
 
             num_interactions_counter += 1
 
@@ -236,6 +237,11 @@ if __name__ == "__main__":
         default=Synthesizers.PICOVOICE_ORCA.value,
         choices=[s.value for s in Synthesizers],
         help="Choose voice synthesizer to use")
+    parser.add_argument(
+        "--no-sentence-pipelining",
+        action="store_true",
+        help="Send the whole LLM answer to a synthesizer that cannot stream text (e.g. `openai`) once it is complete, "
+             "instead of sending each sentence as soon as it is complete")
     parser.add_argument(
         "--picovoice-access-key",
         default=None,
@@ -1,5 +1,5 @@
 #
-#    Copyright 2024 Picovoice Inc.
+#    Copyright 2024-2026 Picovoice Inc.
 #
 #    You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
 #    file accompanying this source.
@@ -10,7 +10,6 @@
 #
 
 import time
-from queue import Queue
 from typing import (
     Any,
     Optional,
@@ -20,22 +19,35 @@ from typing import (
 
 import numpy as np
 from numpy.typing import NDArray
+from pvorca import (
+    OrcaOverflowPolicy,
+    PcmRingBuffer,
+)
 from sounddevice import OutputStream, query_devices
 
 
 class StreamingAudioDevice:
-    def __init__(self, device_index: int) -> None:
+    def __init__(
+            self,
+            device_index: int,
+            buffer_size_secs: float = 20.,
+            overflow_policy: OrcaOverflowPolicy = OrcaOverflowPolicy.BLOCK,
+    ) -> None:
         self._device_index = device_index
-        self._queue: Queue[NDArray] = Queue()
+        self._buffer_size_secs = buffer_size_secs
+        self._overflow_policy = overflow_policy
 
-        self._buffer = None
+        self._ring_buffer = None
         self._stream = None
         self._sample_rate = None
         self._blocksize = None
+        self._is_cancelled = False
 
     def start(self, sample_rate: int) -> None:
         self._sample_rate = sample_rate
         self._blocksize = self._sample_rate // 20
+        self._is_cancelled = False
+        self._ring_buffer = PcmRingBuffer(capacity=int(self._buffer_size_secs * self._sample_rate))
         self._stream = OutputStream(
             channels=1,
             samplerate=self._sample_rate,
@@ -48,52 +60,66 @@ class StreamingAudioDevice:
     # noinspection PyShadowingNames
     # noinspection PyUnusedLocal
     def _callback(self, outdata: NDArray, frames: int, time: Any, status: Any) -> None:
-        if self._queue.empty():
-            outdata[:] = 0
-            return
-        data = self._queue.get()
-        outdata[:, 0] = data
+        self._ring_buffer.read_into(outdata[:, 0])
 
     def play(self, pcm_chunk: Optional[Union[Sequence[int], NDArray]] = None) -> None:
         if self._stream is None:
             raise ValueError("Stream is not started. Call `start` method first.")
 
-        if pcm_chunk is not None and isinstance(pcm_chunk, list):
-            pcm_chunk = np.array(pcm_chunk, dtype=np.int16)
-
-        if self._buffer is not None:
-            pcm_chunk = self._buffer if pcm_chunk is None else np.concatenate([self._buffer, pcm_chunk])
-            self._buffer = None
-
-        if pcm_chunk is None:
+        if self._is_cancelled or pcm_chunk is None or len(pcm_chunk) == 0:
             return
 
-        length = pcm_chunk.shape[0]
-        for index_block in range(0, length, self._blocksize):
-            if (length - index_block) < self._blocksize:
-                self._buffer = pcm_chunk[index_block: index_block + (length - index_block)]
-            else:
-                self._queue.put_nowait(pcm_chunk[index_block: index_block + self._blocksize])
+        self._ring_buffer.write(
+            pcm_chunk,
+            timeout=None if self._overflow_policy is OrcaOverflowPolicy.BLOCK else 0.,
+            overflow_policy=self._overflow_policy)
+
+    def cancel(self) -> float:
+        start = time.perf_counter()
+        # Drops audio passed to `play` until the next `start`. Clearing the ring buffer also ends a `play` call that is
+        # blocked waiting for room, so a synthesizer delivering to this device can be cancelled right after.
+        self._is_cancelled = True
+        if self._ring_buffer is not None:
+            self._ring_buffer.clear()
+        return time.perf_counter() - start
 
     def flush_and_terminate(self) -> None:
         self.flush()
         self.terminate()
 
     def flush(self) -> None:
-        if self._buffer is not None:
-            chunk = np.zeros(self._blocksize, dtype=np.int16)
-            chunk[:self._buffer.shape[0]] = self._buffer
-            self._queue.put_nowait(chunk)
+        self._ring_buffer.finish()
+        self.wait_drained()
 
-        time_interval = self._blocksize / self._sample_rate
-        while not self._queue.empty():
-            time.sleep(time_interval)
+        time.sleep(self._blocksize / self._sample_rate)
 
-        time.sleep(time_interval)
+    def wait_drained(self, timeout: Optional[float] = None) -> bool:
+        if self._ring_buffer is None:
+            return True
+        return self._ring_buffer.wait_drained(timeout)
 
     def terminate(self) -> None:
+        if self._stream is None:
+            return
         self._stream.stop()
         self._stream.close()
+        self._stream = None
+
+    @property
+    def num_underruns(self) -> int:
+        return self._ring_buffer.num_underruns if self._ring_buffer is not None else 0
+
+    @property
+    def fill_level(self) -> int:
+        return self._ring_buffer.fill_level if self._ring_buffer is not None else 0
+
+    @property
+    def max_fill_level(self) -> int:
+        return self._ring_buffer.max_fill_level if self._ring_buffer is not None else 0
+
+    @property
+    def num_dropped_samples(self) -> int:
+        return self._ring_buffer.num_dropped_samples if self._ring_buffer is not None else 0
 
     @classmethod
     def from_default_device(cls) -> 'StreamingAudioDevice':
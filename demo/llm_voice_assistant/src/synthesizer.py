@@ -1,5 +1,5 @@
 #
-#    Copyright 2024 Picovoice Inc.
+#    Copyright 2024-2026 Picovoice Inc.
 #
 #    You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
 #    file accompanying this source.
@@ -9,15 +9,17 @@
 #    specific language governing permissions and limitations under the License.
 #
 
+import queue
+import re
 import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from io import BytesIO
-from queue import Queue
 from typing import (
     Any,
     Callable,
+    Iterator,
     Literal,
     Optional,
     Sequence,
@@ -56,6 +58,15 @@ class Synthesizer:
         raise NotImplementedError(
             f"Method `synthesize` must be implemented in a subclass of {self.__class__.__name__}")
 
+    def generate(self, text: str) -> Iterator[Union[Sequence[int], NDArray]]:
+        """
+        Synthesizes a complete text and yields the audio chunks instead of playing them. Used by
+        `SentencePipeliningSynthesizer` for synthesizers that are not text-streamable.
+        """
+
+        raise NotImplementedError(
+            f"Method `generate` must be implemented in a subclass of {self.__class__.__name__}")
+
     @property
     def info(self) -> str:
         raise NotImplementedError(
@@ -64,11 +75,14 @@ class Synthesizer:
     def flush(self) -> None:
         pass
 
+    def cancel(self) -> float:
+        return 0.
+
     def terminate(self) -> None:
         pass
 
     @classmethod
-    def create(cls, engine: Synthesizers, **kwargs: Any) -> 'Synthesizer':
+    def create(cls, engine: Synthesizers, sentence_pipelining: bool = True, **kwargs: Any) -> 'Synthesizer':
         subclasses = {
             Synthesizers.PICOVOICE_ORCA: PicovoiceOrcaSynthesizer,
             Synthesizers.OPENAI: OpenAISynthesizer,
@@ -77,7 +91,14 @@ class Synthesizer:
         if engine not in subclasses:
             raise NotImplementedError(f"Cannot create {cls.__name__} of type `{engine.value}`")
 
-        return subclasses[engine](**kwargs)
+        synthesizer = subclasses[engine](**kwargs)
+        if sentence_pipelining and not synthesizer.text_streamable:
+            synthesizer = SentencePipeliningSynthesizer(
+                synthesizer,
+                play_audio_callback=kwargs["play_audio_callback"],
+                timer=kwargs["timer"])
+
+        return synthesizer
 
     def __str__(self) -> str:
         raise NotImplementedError()
@@ -111,6 +132,11 @@ class OpenAISynthesizer(Synthesizer):
     def synthesize(self, text: str) -> None:
         self._timer.maybe_log_time_first_synthesis_request()
 
+        for pcm in self.generate(text):
+            self._timer.maybe_log_time_first_audio()
+            self._play_audio_callback(pcm)
+
+    def generate(self, text: str) -> Iterator[NDArray]:
         response = self._client.audio.speech.create(
             model=self._model_name,
             voice=self._voice_name,
@@ -118,10 +144,7 @@ class OpenAISynthesizer(Synthesizer):
             input=text)
 
         for chunk in response.iter_bytes(chunk_size=1024):
-            self._timer.maybe_log_time_first_audio()
-
-            pcm = self._decode(chunk)
-            self._play_audio_callback(pcm)
+            yield self._decode(chunk)
 
     @property
     def info(self) -> str:
@@ -131,100 +154,194 @@ class OpenAISynthesizer(Synthesizer):
         return f"{self.NAME}"
 
 
-class PicovoiceOrcaSynthesizer(Synthesizer):
-    NUM_TOKENS_PER_PCM_CHUNK = 4
+class SentencePipeliningSynthesizer(Synthesizer):
+    """
+    Makes a synthesizer that needs complete texts (`text_streamable=False`) text-streamable. LLM tokens are collected
+    until a sentence is complete, and each sentence is sent to the synthesizer right away, on one of `max_num_requests`
+    worker threads, while the LLM is still generating the rest of the answer. The audio of the sentences is played in
+    order, each one as soon as its chunks arrive and the sentence before it has been played.
+    """
 
-    @dataclass
-    class OrcaTextInput:
-        text: str
-        flush: bool
+    DEFAULT_MAX_NUM_REQUESTS = 3
+    DEFAULT_MIN_SENTENCE_LENGTH = 20
+    SENTENCE_END_PATTERN = re.compile(r"[.!?][\"')\]]*\s|\n")
 
     def __init__(
             self,
+            synthesizer: Synthesizer,
             play_audio_callback: Callable[[Union[Sequence[int], NDArray]], None],
             timer: Timer,
-            access_key: str,
-            model_path: Optional[str] = None,
-            library_path: Optional[str] = None,
+            max_num_requests: int = DEFAULT_MAX_NUM_REQUESTS,
+            min_sentence_length: int = DEFAULT_MIN_SENTENCE_LENGTH,
     ) -> None:
-        self._orca = pvorca.create(access_key=access_key, model_path=model_path, library_path=library_path)
         super().__init__(
-            sample_rate=self._orca.sample_rate,
+            sample_rate=synthesizer.sample_rate,
             play_audio_callback=play_audio_callback,
             timer=timer,
             text_streamable=True)
 
-        self._orca_stream = self._orca.stream_open()
-
-        self._queue: Queue[Optional[PicovoiceOrcaSynthesizer.OrcaTextInput]] = Queue()
+        self._synthesizer = synthesizer
+        self._min_sentence_length = min_sentence_length
+        self._text = ""
+        self._generation = 0
+        self._error: Optional[Exception] = None
+        self._chunks: Optional[queue.Queue] = None
 
-        self._num_tokens = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_num_requests)
+        self._sentences = queue.Queue()
+        self._player = threading.Thread(target=self._play_loop, daemon=True)
+        self._player.start()
 
-        self._thread = None
-        self._start_thread()
+    def synthesize(self, text: str) -> None:
+        self._text += text
 
-    def _start_thread(self) -> None:
-        self._thread = threading.Thread(target=self._run)
-        self._thread.start()
+        end = 0
+        for match in self.SENTENCE_END_PATTERN.finditer(self._text):
+            if len(self._text[end:match.end()].strip()) >= self._min_sentence_length:
+                self._dispatch(self._text[end:match.end()])
+                end = match.end()
+        self._text = self._text[end:]
 
-    def _close_thread_blocking(self):
-        self._queue.put_nowait(None)
-        self._thread.join()
+    def flush(self) -> None:
+        self._dispatch(self._text)
+        self._text = ""
+        self._sentences.join()
 
-    def _reset_state(self) -> None:
-        self._num_tokens = 0
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
 
-    def _compute_first_audio_delay(self, pcm: Sequence[int], processing_time: float) -> float:
-        seconds_audio = len(pcm) / self.sample_rate
-        tokens_per_sec = self._num_tokens / (time.time() - self._timer.time_first_synthesis_request)
-        llm_delay_seconds = (self.NUM_TOKENS_PER_PCM_CHUNK / (tokens_per_sec + 1e-4))
-        orca_delay_seconds = 3 * processing_time
-        delay_seconds = max(llm_delay_seconds + orca_delay_seconds - seconds_audio, 0)
-        return delay_seconds
+    def cancel(self) -> float:
+        start = time.perf_counter()
 
-    def _run(self) -> None:
+        self._text = ""
+        self._generation += 1
         while True:
-            orca_input = self._queue.get()
-            if orca_input is None:
+            try:
+                self._sentences.get_nowait()
+            except queue.Empty:
                 break
+            self._sentences.task_done()
 
-            self._timer.maybe_log_time_first_synthesis_request()
+        chunks = self._chunks
+        if chunks is not None:
+            chunks.put(None)
 
-            self._num_tokens += 1
+        return time.perf_counter() - start
 
-            start = time.time()
-            try:
-                if not orca_input.flush:
-                    pcm = self._orca_stream.synthesize(orca_input.text)
-                else:
-                    pcm = self._orca_stream.flush()
-            except OrcaActivationLimitError:
-                raise ValueError("Orca activation limit reached.")
-            processing_time = time.time() - start
+    def terminate(self) -> None:
+        self.cancel()
+        self._sentences.put(None)
+        self._player.join()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._synthesizer.terminate()
 
-            if pcm is not None:
-                if self._timer.before_first_audio:
-                    self._timer.maybe_log_time_first_audio()
+    def _dispatch(self, text: str) -> None:
+        if len(text.strip()) == 0:
+            return
 
-                    initial_audio_delay = self._compute_first_audio_delay(pcm=pcm, processing_time=processing_time)
-                    self._timer.set_initial_audio_delay(initial_audio_delay)
+        self._timer.maybe_log_time_first_synthesis_request()
 
-                    time.sleep(initial_audio_delay)
+        chunks = queue.Queue()
+        generation = self._generation
+        self._sentences.put((generation, chunks))
+        self._executor.submit(self._generate, text.strip(), generation, chunks)
+
+    def _generate(self, text: str, generation: int, chunks: queue.Queue) -> None:
+        try:
+            for pcm in self._synthesizer.generate(text):
+                if generation != self._generation:
+                    break
+                chunks.put(pcm)
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            chunks.put(None)
+
+    def _play_loop(self) -> None:
+        while True:
+            sentence = self._sentences.get()
+            if sentence is None:
+                self._sentences.task_done()
+                break
 
+            generation, chunks = sentence
+            self._chunks = chunks
+            while generation == self._generation:
+                pcm = chunks.get()
+                if pcm is None:
+                    break
+                if isinstance(pcm, Exception):
+                    self._error = pcm
+                    break
+                self._timer.maybe_log_time_first_audio()
                 self._play_audio_callback(pcm)
+            self._chunks = None
+            self._sentences.task_done()
+
+    @property
+    def info(self) -> str:
+        return f"{self._synthesizer.info} with sentence pipelining"
+
+    def __str__(self) -> str:
+        return f"{self._synthesizer}"
+
+
+class PicovoiceOrcaSynthesizer(Synthesizer):
+    def __init__(
+            self,
+            play_audio_callback: Callable[[Union[Sequence[int], NDArray]], None],
+            timer: Timer,
+            access_key: str,
+            model_path: Optional[str] = None,
+            library_path: Optional[str] = None,
+    ) -> None:
+        self._orca = pvorca.create(access_key=access_key, model_path=model_path, library_path=library_path)
+        super().__init__(
+            sample_rate=self._orca.sample_rate,
+            play_audio_callback=play_audio_callback,
+            timer=timer,
+            text_streamable=True)
+
+        self._session = pvorca.StreamingSession(
+            self._orca,
+            sink=play_audio_callback,
+            stall_policy=pvorca.StallPolicy(),
+            jitter_buffer=pvorca.AdaptiveJitterBuffer(sample_rate=self._orca.sample_rate),
+            on_first_audio=self._on_first_audio)
+
+    def _on_first_audio(self, initial_audio_delay: float) -> None:
+        if self._timer.before_first_audio:
+            self._timer.maybe_log_time_first_audio()
+            self._timer.set_initial_audio_delay(initial_audio_delay)
 
     def synthesize(self, text: str) -> None:
-        self._queue.put_nowait(self.OrcaTextInput(text=text, flush=False))
+        self._timer.maybe_log_time_first_synthesis_request()
+        try:
+            self._session.synthesize(text)
+        except OrcaActivationLimitError:
+            raise ValueError("Orca activation limit reached.")
 
     def flush(self) -> None:
-        self._queue.put_nowait(self.OrcaTextInput(text="", flush=True))
-        self._close_thread_blocking()
-        self._reset_state()
-        self._start_thread()
+        try:
+            self._session.flush()
+            self._session.wait_delivered()
+        except OrcaActivationLimitError:
+            raise ValueError("Orca activation limit reached.")
+
+    def cancel(self) -> float:
+        """
+        Drops all pending text and audio of the current answer. Waits only for the call into Orca that is in flight,
+        then replaces the stream with a new one.
+
+        :return: Number of seconds it took to cancel.
+        """
+
+        return self._session.cancel()
 
     def terminate(self):
-        self._close_thread_blocking()
-        self._orca_stream.close()
+        self._session.close(drain=False)
         self._orca.delete()
 
     @property
@@ -9,9 +9,16 @@
 #    specific language governing permissions and limitations under the License.
 #
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Optional,
+    Tuple,
+)
 
 
 @dataclass
@@ -33,6 +40,7 @@ class Timer:
     before_first_audio: bool = True
     _is_first_synthesis_request: bool = True
     _num_tokens: int = 0
+    _first_audio_event: threading.Event = field(default_factory=threading.Event)
 
     @staticmethod
     def _get_time() -> float:
@@ -56,6 +64,10 @@ class Timer:
         if self.before_first_audio:
             self.time_first_audio = self._get_time()
             self.before_first_audio = False
+            self._first_audio_event.set()
+
+    def wait_for_first_audio(self, timeout: Optional[float] = None) -> bool:
+        return self._first_audio_event.wait(timeout)
 
     def increment_num_tokens(self) -> None:
         self._num_tokens += 1
@@ -83,6 +95,7 @@ class Timer:
 
         self._is_first_synthesis_request = True
         self.before_first_audio = True
+        self._first_audio_event.clear()
 
         self._num_tokens = 0
 
@@ -0,0 +1,147 @@
+#
+#    Copyright 2026 Picovoice Inc.
+#
+#    You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
+#    file accompanying this source.
+#
+#    Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+#    an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+#    specific language governing permissions and limitations under the License.
+#
+
+import argparse
+import functools
+import os
+
+import pvorca
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--access_key',
+        '-a',
+        help='AccessKey obtained from Picovoice Console (https://console.picovoice.ai/)')
+    parser.add_argument(
+        '--input_path',
+        '-i',
+        help='Path to the text file to be synthesized')
+    parser.add_argument(
+        '--output_dir',
+        '-o',
+        help='Directory where a .wav and a .json file with the word alignments are stored per chapter')
+    parser.add_argument(
+        '--checkpoint_dir',
+        help='Directory where completed segments are stored, so that an interrupted run resumes where it stopped. '
+             'Default: `checkpoints` within the output directory')
+    parser.add_argument(
+        "--model_path",
+        "-m",
+        help="Absolute path to Orca model")
+    parser.add_argument(
+        '--device',
+        help='Device to run inference on (`best`, `cpu:{num_threads}` or `gpu:{gpu_index}`). '
+             'Default: automatically selects best device')
+    parser.add_argument(
+        '--library_path',
+        '-l',
+        help='Absolute path to dynamic library. Default: using the library provided by `pvorca`')
+    parser.add_argument(
+        '--num_instances',
+        type=int,
+        help='Number of Orca instances synthesizing segments in parallel. '
+             'Default: the number saved by `pvorca.tune()` for batch synthesis on this host, or 2')
+    parser.add_argument(
+        '--processes',
+        action='store_true',
+        help='Run each Orca instance in its own worker process instead of a thread of this process')
+    parser.add_argument(
+        '--speech_rate',
+        type=float,
+        help='Rate of speech of the generated audio')
+    parser.add_argument(
+        '--random_state',
+        type=int,
+        default=0,
+        help='Random seed for the synthesis process, so that resumed runs sound the same')
+    parser.add_argument(
+        '--chapter_pattern',
+        default=pvorca.DEFAULT_CHAPTER_PATTERN,
+        help='Regular expression matching the heading line that starts a chapter. '
+             'Default: Markdown headings and lines starting with `Chapter`')
+    parser.add_argument(
+        '--show_inference_devices',
+        action='store_true',
+        help='Print devices that are available to run Orca inference')
+    args = parser.parse_args()
+
+    if args.show_inference_devices:
+        print('\n'.join(pvorca.available_devices(library_path=args.library_path)))
+        return
+
+    access_key = args.access_key
+    input_path = args.input_path
+    output_dir = args.output_dir
+
+    if access_key is None or input_path is None or output_dir is None:
+        raise ValueError("Arguments --access_key, --input_path and --output_dir are required.")
+
+    checkpoint_dir = args.checkpoint_dir
+    if checkpoint_dir is None:
+        checkpoint_dir = os.path.join(output_dir, "checkpoints")
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        chapters = pvorca.split_chapters(f.read(), pattern=args.chapter_pattern)
+
+    def on_progress(progress: pvorca.LongFormRenderer.Progress) -> None:
+        print(
+            f"\rSegments {progress.num_completed_segments}/{progress.num_segments} "
+            f"({progress.num_resumed_segments} resumed), "
+            f"chapters {progress.num_completed_chapters}/{len(chapters)}, "
+            f"{progress.audio_sec:.1f} seconds of audio at {progress.audio_sec_per_sec:.1f} audio-seconds/sec",
+            end="",
+            flush=True)
+
+    orca_factory = functools.partial(
+        pvorca.create,
+        access_key=access_key,
+        model_path=args.model_path,
+        device=args.device,
+        library_path=args.library_path,
+        workload=pvorca.OrcaWorkload.BATCH)
+
+    num_instances = args.num_instances
+    if num_instances is None:
+        tuning = pvorca.load_tuning(workload=pvorca.OrcaWorkload.BATCH, model_path=args.model_path)
+        num_instances = tuning.num_instances if tuning is not None else 2
+
+    if args.processes:
+        pool = pvorca.OrcaProcessPool(orca_factory, num_processes=num_instances)
+    else:
+        pool = pvorca.OrcaPool(orca_factory=orca_factory, num_instances=num_instances, batch_share=1.)
+
+    try:
+        print(f"Orca version: {pool.version}")
+        print(f"Rendering {len(chapters)} chapters from `{input_path}`.")
+
+        renderer = pvorca.LongFormRenderer(
+            pool,
+            checkpoint_dir,
+            speech_rate=args.speech_rate,
+            random_state=args.random_state,
+            on_progress=on_progress)
+        paths = renderer.render(chapters, output_dir)
+
+        print()
+        for path in paths:
+            print(f"Audio written to `{path}`.")
+    except KeyboardInterrupt:
+        print("\nStopped. Run the same command again to resume.")
+    except pvorca.OrcaActivationLimitError:
+        print("\nAccessKey has reached its processing limit")
+    finally:
+        pool.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 #
-#    Copyright 2024-2025 Picovoice Inc.
+#    Copyright 2024-2026 Picovoice Inc.
 #
 #    You may not use this file except in compliance with the license. A copy of the license is located in the "LICENSE"
 #    file accompanying this source.
@@ -10,27 +10,14 @@
 #
 
 import argparse
-import platform
+import codecs
+import functools
 import re
-import subprocess
-import threading
 import time
-from dataclasses import dataclass
-from queue import Queue
-from collections import deque
-from itertools import chain
-from typing import (
-    Callable,
-    Optional,
-    Sequence,
-)
+from typing import Sequence
 
 import pvorca
-from pvorca import (
-    Orca,
-    OrcaActivationLimitError,
-    OrcaInvalidArgumentError,
-)
+from pvorca import OrcaActivationLimitError
 from pvspeaker import PvSpeaker
 
 # TODO: Remove once tiktoken supports windows-arm64
@@ -39,178 +26,34 @@ try:
 except:
     pass
 
-CUSTOM_PRON_PATTERN = r"\{(.*?\|.*?)\}"
 CUSTOM_PRON_PATTERN_NO_WHITESPACE = r"\{(.*?\|.*?)\}(?!\s)"
 
 
-def linux_machine() -> str:
-    machine = platform.machine()
-    if machine == "x86_64":
-        return machine
-    elif machine in ["aarch64", "armv7l"]:
-        arch_info = ("-" + machine) if "64bit" in platform.architecture()[0] else ""
-    else:
-        raise NotImplementedError("Unsupported CPU architecture: `%s`" % machine)
+@functools.lru_cache(maxsize=None)
+def _get_encoder() -> 'tiktoken.Encoding':
+    return tiktoken.encoding_for_model("gpt-4")
 
-    cpu_info = ""
-    try:
-        cpu_info = subprocess.check_output(["cat", "/proc/cpuinfo"]).decode("utf-8")
-        cpu_part_list = [x for x in cpu_info.split("\n") if "CPU part" in x]
-        cpu_part = cpu_part_list[0].split(" ")[-1].lower()
-    except Exception as e:
-        raise RuntimeError("Failed to identify the CPU with `%s`\nCPU info: `%s`" % (e, cpu_info))
-
-    if "0xd03" == cpu_part:
-        return "cortex-a53" + arch_info
-    elif "0xd08" == cpu_part:
-        return "cortex-a72" + arch_info
-    elif "0xd0b" == cpu_part:
-        return "cortex-a76" + arch_info
-    else:
-        raise NotImplementedError("Unsupported CPU: `%s`." % cpu_part)
-
-
-class OrcaThread:
-    @dataclass
-    class OrcaInput:
-        text: str
-        flush: bool
-
-    def __init__(
-            self,
-            orca: Orca,
-            flush_audio_callback: Callable[[Sequence[int]], None],
-            play_audio_callback: Callable[[Sequence[int]], int],
-            num_tokens_per_second: int,
-            audio_wait_chunks: Optional[int] = None,
-    ) -> None:
-
-        self._orca = orca
-        self._orca_stream = self._orca.stream_open()
-
-        self._play_audio_callback = play_audio_callback
-        self._flush_audio_callback = flush_audio_callback
-        self._num_tokens_per_second = num_tokens_per_second
-        assert self._num_tokens_per_second > 0
-
-        self._queue: Queue[Optional[OrcaThread.OrcaInput]] = Queue()
-        self._thread = None
-
-        self._time_first_audio_available = -1
-        self._pcm_buffer = deque()
-
-        self._wait_chunks = audio_wait_chunks or self._get_first_audio_wait_chunks()
-        self._num_pcm_chunks_processed = 0
-
-    @staticmethod
-    def _get_first_audio_wait_chunks() -> int:
-        wait_chunks = 0
-        if platform.system() == "Linux":
-            machine = linux_machine()
-            if "cortex" in machine:
-                wait_chunks = 1
-        return wait_chunks
-
-    def _run(self) -> None:
-        while True:
-            orca_input = self._queue.get()
-            if orca_input is None:
-                break
 
-            try:
-                if not orca_input.flush:
-                    pcm = self._orca_stream.synthesize(orca_input.text)
-                else:
-                    pcm = self._orca_stream.flush()
-            except OrcaInvalidArgumentError as e:
-                raise ValueError(f"Orca could not synthesize text input `{orca_input.text}`: `{e}`")
-
-            if pcm is not None:
-                if self._num_pcm_chunks_processed == 0:
-                    self._time_first_audio_available = time.time()
-                self._num_pcm_chunks_processed += 1
-
-                self._pcm_buffer.append(pcm)
-
-            if self._num_pcm_chunks_processed > self._wait_chunks:
-                if len(self._pcm_buffer) > 0:
-                    pcm = self._pcm_buffer.popleft()
-                    written = self._play_audio_callback(pcm)
-                    if written < len(pcm):
-                        self._pcm_buffer.appendleft(pcm[written:])
-
-    def _close_thread_blocking(self):
-        self._queue.put_nowait(None)
-        self._thread.join()
-
-    def start(self) -> None:
-        self._thread = threading.Thread(target=self._run)
-        self._thread.start()
-
-    def synthesize(self, text: str) -> None:
-        self._queue.put_nowait(self.OrcaInput(text=text, flush=False))
-
-    def flush(self) -> None:
-        self._queue.put_nowait(self.OrcaInput(text="", flush=True))
-        self._close_thread_blocking()
-
-    def flush_audio(self) -> None:
-        remaining_pcm = list(chain.from_iterable(self._pcm_buffer))
-        self._thread = threading.Thread(target=self._flush_audio_callback, args=(remaining_pcm,))
-        self._thread.start()
-        self._thread.join()
-
-    def delete(self) -> None:
-        self._close_thread_blocking()
-        self._orca_stream.close()
-        self._orca.delete()
-
-    def get_time_first_audio_available(self) -> float:
-        return self._time_first_audio_available
-
-
-def tokenize_text(text: str, language: str) -> Sequence[str]:
+def tokenize_text(text: str, language: str) -> Sequence[bytes]:
     text = re.sub(CUSTOM_PRON_PATTERN_NO_WHITESPACE, r'{\1} ', text)
 
-    custom_pronunciations = re.findall(CUSTOM_PRON_PATTERN, text)
-    custom_pronunciations = set(["{" + pron + "}" for pron in custom_pronunciations])
-
-    # TODO: Update once Orca supports passing in partial bytes
-    if language == "ko" or language == "ja":
-        tokens_raw = list(text)
-    else:
-        # TODO: Remove once tiktoken supports windows-arm64
-        try:
-            encoder = tiktoken.encoding_for_model("gpt-4")
-            tokens_raw = [encoder.decode([i]) for i in encoder.encode(text)]
-        except:
-            ALPHA_NUMERIC = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
-            PUNCTUATION = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ '
-            tokens_raw = [text[0]]
-            for ch in text[1:]:
-                if (ch in ALPHA_NUMERIC and tokens_raw[-1][-1] not in ALPHA_NUMERIC) or ch in PUNCTUATION:
-                    tokens_raw.append(ch)
-                else:
-                    tokens_raw[-1] += ch
-
-    custom_pron = ""
-    tokens_with_custom_pronunciations = []
-    for i, token in enumerate(tokens_raw):
-        in_custom_pron = False
-        for pron in custom_pronunciations:
-            in_custom_pron_global = len(custom_pron) > 0
-            current_match = token.strip() if not in_custom_pron_global else custom_pron + token
-            if pron.startswith(current_match):
-                custom_pron += token.strip() if not in_custom_pron_global else token
-                in_custom_pron = True
-
-        if not in_custom_pron:
-            if custom_pron != "":
-                tokens_with_custom_pronunciations.append(f" {custom_pron}" if i != 0 else custom_pron)
-                custom_pron = ""
-            tokens_with_custom_pronunciations.append(token)
-
-    return tokens_with_custom_pronunciations
+    # TODO: Remove once tiktoken supports windows-arm64
+    try:
+        encoder = _get_encoder()
+        return [encoder.decode_single_token_bytes(token) for token in encoder.encode(text)]
+    except:
+        if language == "ko" or language == "ja":
+            return [ch.encode("utf-8") for ch in text]
+
+        ALPHA_NUMERIC = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
+        PUNCTUATION = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ '
+        tokens = [text[0]]
+        for ch in text[1:]:
+            if (ch in ALPHA_NUMERIC and tokens[-1][-1] not in ALPHA_NUMERIC) or ch in PUNCTUATION:
+                tokens.append(ch)
+            else:
+                tokens[-1] += ch
+        return [token.encode("utf-8") for token in tokens]
 
 
 def main() -> None:
@@ -244,7 +87,8 @@ def main() -> None:
         "--audio_wait_chunks",
         type=int,
         default=None,
-        help="Number of PCM chunks to wait before starting to play audio. Default: system-dependent.")
+        help="Number of PCM chunks to wait before starting to play audio. "
+             "Default: adapts the start delay to the measured token rate and synthesis speed.")
     parser.add_argument(
         "--buffer_size_secs",
         type=int,
@@ -320,57 +164,57 @@ def main() -> None:
             pass
         return len(pcm)
 
-    def flush_audio_callback(pcm: Sequence[int]) -> None:
-        try:
-            if speaker is not None:
-                speaker.flush(pcm)
-        except MemoryError:
-            pass
-
-    orca_thread = OrcaThread(
-        orca=orca,
-        play_audio_callback=play_audio_callback,
-        flush_audio_callback=flush_audio_callback,
-        num_tokens_per_second=tokens_per_second,
-        audio_wait_chunks=audio_wait_chunks,
-    )
+    time_first_audio_available = []
+    session = pvorca.StreamingSession(
+        orca,
+        sink=play_audio_callback,
+        buffer_size_sec=buffer_size_secs,
+        stall_policy=pvorca.StallPolicy(),
+        jitter_buffer=pvorca.AdaptiveJitterBuffer(sample_rate=orca.sample_rate) if audio_wait_chunks is None else None,
+        num_start_chunks=audio_wait_chunks,
+        on_first_audio=lambda _: time_first_audio_available.append(time.time()))
 
-    orca_thread.start()
     try:
         print(f"Orca version: {orca.version}\n")
 
         tokens = tokenize_text(text=text, language=language)
 
         print(f"Simulated text stream:")
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         time_start_text_stream = time.time()
         for token in tokens:
-            print(f"{token}", end="", flush=True)
+            print(f"{decoder.decode(token)}", end="", flush=True)
 
-            orca_thread.synthesize(text=token)
+            session.synthesize(token)
 
             time.sleep(1 / tokens_per_second)
 
         text_stream_duration_seconds = time.time() - time_start_text_stream
 
-        orca_thread.flush()
-        first_audio_available_seconds = orca_thread.get_time_first_audio_available() - time_start_text_stream
+        session.flush()
+        session.wait_delivered()
+
+        first_audio_available_seconds = time_first_audio_available[0] - time_start_text_stream
         print(f"\n\nTime to finish text stream:  {text_stream_duration_seconds:.2f} seconds")
         print(f"Time to receive first audio: {first_audio_available_seconds:.2f} seconds after text stream started\n")
 
         if speaker is not None:
             print("Waiting for audio to finish ...")
-        orca_thread.flush_audio()
-
-        if speaker is not None:
+            try:
+                speaker.flush()
+            except MemoryError:
+                pass
             speaker.delete()
     except KeyboardInterrupt:
-        print("\nStopped...")
+        num_seconds_cancel = session.cancel()
+        print(f"\nStopped... Dropped pending speech in {num_seconds_cancel * 1000:.1f} ms.")
         if speaker is not None:
             speaker.stop()
     except OrcaActivationLimitError:
         print("\nAccessKey has reached its processing limit")
     finally:
-        orca_thread.delete()
+        session.close(drain=False)
+        orca.delete()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import setuptools
 INCLUDE_FILES = [
     "../../LICENSE",
     "orca_demo.py",
+    "orca_demo_long_form.py",
     "orca_demo_streaming.py"]
 
 os.system("git clean -dfx")
@@ -26,14 +27,14 @@ with open(os.path.join(os.path.dirname(__file__), "README.md"), "r") as f:
     long_description = f.read()
 
 if platform.platform() != 'win32' or platform.machine() != 'ARM64':
-    dependencies = ["numpy>=1.24.0", "pvorca==3.1.0", "pvspeaker==1.0.5", "tiktoken==0.8.0"]
+    dependencies = ["numpy>=1.24.0", "pvorca==3.2.0", "pvspeaker==1.0.5", "tiktoken==0.8.0"]
 else:
-    dependencies = ["pvorca==3.1.0", "pvspeaker==1.0.5"]
+    dependencies = ["pvorca==3.2.0", "pvspeaker==1.0.5"]
 
 
 setuptools.setup(
     name="pvorcademo",
-    version="3.1.0",
+    version="3.2.0",
     author="Picovoice",
     author_email="hello@picovoice.ai",
     description="Orca Streaming Text-to-Speech Engine demos",
@@ -54,6 +55,7 @@ setuptools.setup(
     entry_points=dict(
         console_scripts=[
             "orca_demo=pvorcademo.orca_demo:main",
+            "orca_demo_long_form=pvorcademo.orca_demo_long_form:main",
             "orca_demo_streaming=pvorcademo.orca_demo_streaming:main",
         ],
     ),